@@ -16,7 +16,7 @@ For more information, see README.md and docs/ARCHITECTURE.md
 """
 
 from src.domain.value_objects import GameRules
-from src.domain.services import ProbabilityCalculator, CounterCalculator, PitySimulator
+from src.domain.services import ProbabilityCalculator, CounterCalculator, PitySimulator, configure_registry
 from src.application.use_cases import (
     CalculateStateUseCase,
     SimulatePullUseCase,
@@ -25,6 +25,7 @@ from src.application.use_cases import (
 )
 from src.infrastructure.persistence.json_repository import JsonStateRepository
 from src.infrastructure.persistence.random_adapter import StandardRandomGenerator
+from src.infrastructure.persistence.artifact_cache import NpyArtifactCache
 from src.infrastructure.presentation.console_presenter import ConsolePresenter
 from src.infrastructure.cli.console_input import ConsoleInput
 from src.infrastructure.cli.menu import PityCalculatorMenu
@@ -49,6 +50,7 @@ def main():
     random_gen = StandardRandomGenerator()
     presenter = ConsolePresenter()
     input_adapter = ConsoleInput()
+    configure_registry(NpyArtifactCache())
     
     # 3. Domain services
     prob_calculator = ProbabilityCalculator(rules)
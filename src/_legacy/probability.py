@@ -11,6 +11,28 @@ from .constants import (
 )
 
 
+def _build_hazard_table() -> tuple[float, ...]:
+    """
+    Builds the 6★ probability for every pulls_without_6_star value (0..80).
+
+    Soft pity formula: P(r) = 0.008 + max(0, r - 64) * 0.05, capped at 100%
+    and forced to 100% from index 79 (pull 80, hard pity) on.
+    """
+    table = []
+    for t in range(HARD_PITY + 1):
+        if t >= HARD_PITY - 1:
+            table.append(1.0)
+        elif t >= SOFT_PITY_START - 1:
+            pulls_in_soft = t - (SOFT_PITY_START - 1) + 1
+            table.append(min(PROB_6_STAR_BASE + pulls_in_soft * SOFT_PITY_INCREMENT, 1.0))
+        else:
+            table.append(PROB_6_STAR_BASE)
+    return tuple(table)
+
+
+HAZARD_TABLE = _build_hazard_table()
+
+
 def calculate_6_star_probability(pulls_without_6_star: int) -> float:
     """
     Calculates the probability of getting a 6★ on the next pull.
@@ -23,19 +45,9 @@ def calculate_6_star_probability(pulls_without_6_star: int) -> float:
     - 0 = first pull
     - 79 = pull 80 (hard pity)
 
-    Soft pity formula: P(r) = 0.008 + max(0, r - 64) * 0.05
+    Looks up the precomputed HAZARD_TABLE.
     """
-    # Hard pity: pull 80 (index 79) is 100% guaranteed
-    if pulls_without_6_star >= HARD_PITY - 1:
-        return 1.0
-
-    # Soft pity: starts at pull 65 (index 64)
-    if pulls_without_6_star >= SOFT_PITY_START - 1:
-        pulls_in_soft = pulls_without_6_star - (SOFT_PITY_START - 1) + 1
-        prob = PROB_6_STAR_BASE + (pulls_in_soft * SOFT_PITY_INCREMENT)
-        return min(prob, 1.0)
-
-    return PROB_6_STAR_BASE
+    return HAZARD_TABLE[min(pulls_without_6_star, HARD_PITY)]
 
 
 def calculate_pulls_for_5_star(pulls_without_5_star: int) -> int:
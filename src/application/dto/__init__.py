@@ -42,3 +42,63 @@ class ProbabilityTableRowDTO:
     pity: int
     probability: float
     cumulative: float
+
+
+@dataclass(frozen=True)
+class MonteCarloEstimateDTO:
+    """DTO for a Monte Carlo estimate reported with its confidence interval."""
+    estimate: float
+    lower: float
+    upper: float
+    half_width: float
+    confidence: float
+    samples: int
+    converged: bool
+
+
+@dataclass(frozen=True)
+class StrategyStatsDTO:
+    """DTO for the per-strategy statistics of a strategy comparison."""
+    name: str
+    mean_featured_copies: float
+    stderr_featured_copies: float
+    mean_pulls_spent: float
+    stderr_pulls_spent: float
+
+
+@dataclass(frozen=True)
+class PairedDifferenceDTO:
+    """DTO for the paired difference between a strategy and the baseline."""
+    name: str
+    baseline: str
+    mean_copies_difference: float
+    stderr_copies_difference: float
+    mean_pulls_difference: float
+    stderr_pulls_difference: float
+
+
+@dataclass(frozen=True)
+class StrategyComparisonDTO:
+    """DTO for a full strategy comparison."""
+    trials: int
+    strategies: tuple[StrategyStatsDTO, ...]
+    differences: tuple[PairedDifferenceDTO, ...]
+
+
+@dataclass(frozen=True)
+class PopulationReportDTO:
+    """DTO for population statistics over a pull record dataset."""
+    players: int
+    pulls: int
+    six_stars: int
+    five_stars: int
+    six_star_rate: float
+    won_50_50: int
+    lost_50_50: int
+    win_rate_50_50: float
+    soft_pity_share: float
+    cycle_lengths: tuple[int, ...]
+    final_pity: tuple[int, ...]
+    featured_obtained: int
+    mean_pulls_per_featured: float
+    pulls_per_featured_percentiles: dict[float, float]
@@ -4,5 +4,16 @@ from .state_repository import StateRepository
 from .output_port import OutputPort
 from .input_port import InputPort
 from .random_generator import RandomGeneratorPort
+from .account_snapshot_repository import AccountSnapshotRepository
+from .pull_record_source import PullRecordSource
+from .result_exporter import ResultExporter
 
-__all__ = ["StateRepository", "OutputPort", "InputPort", "RandomGeneratorPort"]
+__all__ = [
+    "StateRepository",
+    "OutputPort",
+    "InputPort",
+    "RandomGeneratorPort",
+    "AccountSnapshotRepository",
+    "PullRecordSource",
+    "ResultExporter",
+]
@@ -0,0 +1,23 @@
+"""Account snapshot repository port."""
+
+from typing import Protocol, Optional
+
+import numpy as np
+
+from src.domain.entities import PityStateBatch
+
+
+class AccountSnapshotRepository(Protocol):
+    """
+    Port for persisting the columnar state of many tracked accounts.
+    
+    This is an abstract interface that infrastructure will implement.
+    """
+    
+    def save(self, account_ids: np.ndarray, batch: PityStateBatch) -> None:
+        """Save a snapshot of all tracked accounts."""
+        ...
+    
+    def load(self) -> Optional[tuple[np.ndarray, PityStateBatch]]:
+        """Load the latest snapshot. Returns None if none exists."""
+        ...
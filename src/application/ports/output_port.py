@@ -1,5 +1,6 @@
 """Output port for presenting results."""
 
+from collections.abc import Iterable, Sequence
 from typing import Protocol, Any
 
 
@@ -25,3 +26,7 @@ class OutputPort(Protocol):
     def show_table(self, headers: list[str], rows: list[list[Any]]) -> None:
         """Display a table."""
         ...
+    
+    def stream_table(self, headers: Sequence[str], rows: Iterable[Sequence[Any]], widths: Sequence[int]) -> None:
+        """Display a table streamed from a row iterable with fixed column widths."""
+        ...
@@ -0,0 +1,24 @@
+"""Pull record source port."""
+
+from collections.abc import Iterator
+from typing import Any, Protocol
+
+from src.domain.entities import PullRecordBatch
+
+
+class PullRecordSource(Protocol):
+    """
+    Port for reading large pull record datasets in chunks.
+    
+    Reading raw chunks is cheap and happens in the calling process;
+    decoding them is the expensive part and runs in worker processes, so
+    the source and its raw chunks must be picklable.
+    """
+    
+    def iter_chunks(self) -> Iterator[Any]:
+        """Yield raw chunks in dataset order."""
+        ...
+    
+    def parse(self, chunk: Any) -> PullRecordBatch:
+        """Decode one raw chunk into columns."""
+        ...
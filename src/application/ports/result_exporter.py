@@ -0,0 +1,40 @@
+"""Result exporter port."""
+
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Optional, Protocol
+
+import numpy as np
+
+from src.domain.services import FixedBinHistogram
+
+
+class ResultExporter(Protocol):
+    """
+    Port for exporting results to files other tools can read.
+    
+    Samples and tables arrive as chunks and are written incrementally, so
+    an export never needs the whole result in memory.
+    """
+    
+    def write_samples(self, name: str, chunks: Iterable[np.ndarray]) -> Path:
+        """Write a stream of 1-D sample chunks. Returns the written file."""
+        ...
+    
+    def write_table(
+        self,
+        name: str,
+        chunks: Iterable[dict[str, np.ndarray]],
+        columns: Optional[Sequence[str]] = None,
+    ) -> Path:
+        """
+        Write a stream of column chunks (same columns in every chunk).
+        
+        ``columns`` names the columns upfront, so an empty stream still
+        produces a valid file. Returns the written file.
+        """
+        ...
+    
+    def write_histogram(self, name: str, histogram: FixedBinHistogram) -> Path:
+        """Write a histogram. Returns the written file."""
+        ...
@@ -4,10 +4,18 @@ from .calculate_state import CalculateStateUseCase
 from .simulate_pull import SimulatePullUseCase
 from .show_probability_table import ShowProbabilityTableUseCase
 from .show_base_rates import ShowBaseRatesUseCase
+from .estimate_featured_probability import EstimateFeaturedProbabilityUseCase
+from .compare_strategies import CompareStrategiesUseCase
+from .track_accounts import MultiAccountTracker
+from .analyze_population import AnalyzePopulationUseCase
 
 __all__ = [
     "CalculateStateUseCase",
     "SimulatePullUseCase",
     "ShowProbabilityTableUseCase",
     "ShowBaseRatesUseCase",
+    "EstimateFeaturedProbabilityUseCase",
+    "CompareStrategiesUseCase",
+    "MultiAccountTracker",
+    "AnalyzePopulationUseCase",
 ]
@@ -0,0 +1,115 @@
+"""Population analytics use case."""
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Optional
+
+from src.domain.entities import PullRecordBatch
+from src.domain.services import PlayerCarry, PopulationReplayer, PopulationStats
+from src.domain.value_objects import GameRules
+from ..dto import PopulationReportDTO
+from ..ports import PullRecordSource
+
+
+def _analyze_chunk(
+    rules: GameRules,
+    source: PullRecordSource,
+    chunk: Any,
+) -> tuple[PullRecordBatch, PopulationStats, Optional[PlayerCarry]]:
+    """
+    Decode and replay one chunk (executed in a worker process).
+
+    The leading player's records may continue a player from the previous
+    chunk, so they are returned undecided for the caller to replay in
+    order; every other player is replayed here from the initial state.
+
+    Returns:
+        Leading player's records, statistics of the rest, and the carry of
+        the last player (None if the chunk holds a single player)
+    """
+    batch = source.parse(chunk)
+    replayer = PopulationReplayer(rules)
+    stats = PopulationStats(rules)
+    head = batch.leading_run()
+    tail = replayer.replay(batch.slice(head, len(batch)), stats) if head < len(batch) else None
+    return batch.slice(0, head), stats, tail
+
+
+class AnalyzePopulationUseCase:
+    """
+    Use case for population statistics over a large pull record dataset.
+
+    The source is read chunk by chunk; chunks are decoded and replayed on
+    a process pool with a bounded number in flight, so memory stays flat
+    however large the dataset is. Results are consumed in dataset order,
+    which lets a player split across chunks be resumed from its carry.
+    """
+
+    def __init__(self, rules: GameRules, workers: int | None = None, max_pending: int | None = None):
+        """
+        Initialize use case.
+
+        Args:
+            rules: Game rules
+            workers: Worker processes (None = CPU count, 1 = run in-process)
+            max_pending: Chunks in flight at once (default: twice the workers)
+        """
+        self.rules = rules
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.max_pending = max_pending if max_pending is not None else 2 * self.workers
+
+    def execute(self, source: PullRecordSource) -> PopulationReportDTO:
+        """
+        Analyze every record of a source.
+
+        Args:
+            source: Records grouped by player, in pull order
+
+        Returns:
+            Population statistics as DTO
+        """
+        replayer = PopulationReplayer(self.rules)
+        stats = PopulationStats(self.rules)
+        carry: Optional[PlayerCarry] = None
+
+        def consume(result: tuple[PullRecordBatch, PopulationStats, Optional[PlayerCarry]]) -> None:
+            nonlocal carry
+            head, partial, tail = result
+            carry = replayer.replay(head, stats, carry)
+            stats.merge(partial)
+            if tail is not None:
+                replayer.finish(carry, stats)
+                carry = tail
+
+        if self.workers <= 1:
+            for chunk in source.iter_chunks():
+                consume(_analyze_chunk(self.rules, source, chunk))
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                pending: deque[Future] = deque()
+                for chunk in source.iter_chunks():
+                    pending.append(pool.submit(_analyze_chunk, self.rules, source, chunk))
+                    if len(pending) >= self.max_pending:
+                        consume(pending.popleft().result())
+                while pending:
+                    consume(pending.popleft().result())
+        replayer.finish(carry, stats)
+
+        featured = stats.pulls_per_featured
+        return PopulationReportDTO(
+            players=stats.players,
+            pulls=stats.pulls,
+            six_stars=stats.six_stars,
+            five_stars=stats.five_stars,
+            six_star_rate=stats.six_star_rate,
+            won_50_50=stats.won_50_50,
+            lost_50_50=stats.lost_50_50,
+            win_rate_50_50=stats.win_rate_50_50,
+            soft_pity_share=stats.soft_pity_share,
+            cycle_lengths=tuple(int(c) for c in stats.cycle_lengths),
+            final_pity=tuple(int(c) for c in stats.final_pity),
+            featured_obtained=featured.count,
+            mean_pulls_per_featured=featured.moments.mean,
+            pulls_per_featured_percentiles=featured.percentiles() if featured.count else {},
+        )
@@ -0,0 +1,142 @@
+"""Compare pulling strategies use case."""
+
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from src.domain.services import PullStrategy, StrategySimulator, RunningMoments
+from src.domain.value_objects import GameRules
+from ..dto import StrategyStatsDTO, PairedDifferenceDTO, StrategyComparisonDTO
+
+
+def _trial_stream(seed: int, trial: int) -> random.Random:
+    """Random stream for one trial, shared by every strategy (common random numbers)."""
+    return random.Random(f"{seed}:{trial}")
+
+
+def _run_trial_block(
+    rules: GameRules,
+    strategies: list[PullStrategy],
+    banners: int,
+    pulls_per_banner: int,
+    seed: int,
+    trials: range,
+) -> tuple[list[RunningMoments], list[RunningMoments], list[RunningMoments], list[RunningMoments]]:
+    """
+    Run a block of trials for every strategy (executed in a worker process).
+
+    Returns:
+        Per-strategy copies and pulls moments, then per-strategy paired
+        differences against the first strategy (copies, pulls)
+    """
+    simulator = StrategySimulator(rules)
+    copies = [RunningMoments() for _ in strategies]
+    pulls = [RunningMoments() for _ in strategies]
+    copies_diff = [RunningMoments() for _ in strategies]
+    pulls_diff = [RunningMoments() for _ in strategies]
+
+    for trial in trials:
+        outcomes = [
+            simulator.play(strategy, _trial_stream(seed, trial), banners, pulls_per_banner)
+            for strategy in strategies
+        ]
+        baseline = outcomes[0]
+        for i, outcome in enumerate(outcomes):
+            copies[i].add(outcome.featured_copies)
+            pulls[i].add(outcome.pulls_spent)
+            copies_diff[i].add(outcome.featured_copies - baseline.featured_copies)
+            pulls_diff[i].add(outcome.pulls_spent - baseline.pulls_spent)
+
+    return copies, pulls, copies_diff, pulls_diff
+
+
+class CompareStrategiesUseCase:
+    """
+    Use case for comparing pulling strategies under the same game rules.
+
+    Every strategy replays the same random stream in each trial, so the
+    paired differences have far lower variance than independent runs.
+    Trial blocks are spread over a process pool and merged afterwards.
+    """
+
+    def __init__(self, rules: GameRules, workers: int | None = None, block_size: int = 2_000):
+        """
+        Initialize use case.
+
+        Args:
+            rules: Game rules
+            workers: Worker processes (None = CPU count, 1 = run in-process)
+            block_size: Trials per worker task
+        """
+        self.rules = rules
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.block_size = block_size
+
+    def execute(
+        self,
+        strategies: list[PullStrategy],
+        trials: int,
+        banners: int = 2,
+        pulls_per_banner: int = 120,
+        seed: int = 0
+    ) -> StrategyComparisonDTO:
+        """
+        Compare strategies over a banner plan.
+
+        Args:
+            strategies: Strategies to compare (the first one is the baseline)
+            trials: Number of simulated plans
+            banners: Banners per plan
+            pulls_per_banner: Pull income per banner
+            seed: Base seed for the common random streams
+
+        Returns:
+            Per-strategy and paired-difference statistics as DTO
+        """
+        if not strategies:
+            raise ValueError("At least one strategy is required")
+
+        blocks = [
+            range(start, min(start + self.block_size, trials))
+            for start in range(0, trials, self.block_size)
+        ]
+        args = [(self.rules, strategies, banners, pulls_per_banner, seed, block) for block in blocks]
+
+        if self.workers <= 1 or len(blocks) <= 1:
+            results = [_run_trial_block(*a) for a in args]
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(blocks))) as pool:
+                results = list(pool.map(_run_trial_block, *zip(*args)))
+
+        copies = [RunningMoments() for _ in strategies]
+        pulls = [RunningMoments() for _ in strategies]
+        copies_diff = [RunningMoments() for _ in strategies]
+        pulls_diff = [RunningMoments() for _ in strategies]
+        for block_result in results:
+            for merged, partial in zip((copies, pulls, copies_diff, pulls_diff), block_result):
+                for total, part in zip(merged, partial):
+                    total.merge(part)
+
+        stats = tuple(
+            StrategyStatsDTO(
+                name=strategy.name,
+                mean_featured_copies=copies[i].mean,
+                stderr_featured_copies=copies[i].standard_error,
+                mean_pulls_spent=pulls[i].mean,
+                stderr_pulls_spent=pulls[i].standard_error
+            )
+            for i, strategy in enumerate(strategies)
+        )
+        differences = tuple(
+            PairedDifferenceDTO(
+                name=strategy.name,
+                baseline=strategies[0].name,
+                mean_copies_difference=copies_diff[i].mean,
+                stderr_copies_difference=copies_diff[i].standard_error,
+                mean_pulls_difference=pulls_diff[i].mean,
+                stderr_pulls_difference=pulls_diff[i].standard_error
+            )
+            for i, strategy in enumerate(strategies) if i > 0
+        )
+
+        return StrategyComparisonDTO(trials=trials, strategies=stats, differences=differences)
@@ -0,0 +1,62 @@
+"""Estimate featured probability use case."""
+
+from src.domain.entities import PityState
+from src.domain.services import EventDrivenSimulator, AdaptiveMonteCarlo
+from src.domain.value_objects import GameRules
+from ..dto import MonteCarloEstimateDTO
+
+
+class EstimateFeaturedProbabilityUseCase:
+    """
+    Use case for estimating P(featured within N pulls) to a target precision.
+
+    Trials are run in chunks with the event-driven simulator and sampling
+    stops as soon as the confidence interval is tight enough.
+    """
+    
+    def __init__(
+        self,
+        simulator: EventDrivenSimulator,
+        monte_carlo: AdaptiveMonteCarlo,
+        rules: GameRules
+    ):
+        """Initialize use case."""
+        self.simulator = simulator
+        self.monte_carlo = monte_carlo
+        self.rules = rules
+    
+    def execute(
+        self,
+        state: PityState,
+        within_pulls: int,
+        target_half_width: float = 0.001,
+        confidence: float = 0.95,
+        featured_obtained: bool = False
+    ) -> MonteCarloEstimateDTO:
+        """
+        Estimate the probability of obtaining the featured unit within N pulls.
+        
+        Args:
+            state: Current pity state
+            within_pulls: Pull budget
+            target_half_width: Required absolute precision (0.001 = ±0.1%)
+            confidence: Confidence level of the reported interval
+            featured_obtained: Whether the featured guarantee was already used
+        
+        Returns:
+            Estimate with its confidence interval as DTO
+        """
+        def trial() -> bool:
+            return self.simulator.pulls_to_featured(state, featured_obtained) <= within_pulls
+        
+        interval = self.monte_carlo.estimate_proportion(trial, target_half_width, confidence)
+        
+        return MonteCarloEstimateDTO(
+            estimate=interval.estimate,
+            lower=interval.lower,
+            upper=interval.upper,
+            half_width=interval.half_width,
+            confidence=interval.confidence,
+            samples=interval.samples,
+            converged=interval.converged
+        )
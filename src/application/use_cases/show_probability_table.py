@@ -1,6 +1,10 @@
 """Show probability table use case."""
 
-from src.domain.services import ProbabilityCalculator, CounterCalculator
+from collections.abc import Iterator
+
+import numpy as np
+
+from src.domain.services import ProbabilityCalculator, CounterCalculator, compile_rules
 from src.domain.value_objects import GameRules
 from ..dto import ProbabilityTableRowDTO
 
@@ -8,6 +12,9 @@ from ..dto import ProbabilityTableRowDTO
 class ShowProbabilityTableUseCase:
     """
     Use case for generating probability tables.
+    
+    Rows already generated are kept, so a request for a longer table only
+    computes the missing pulls, continuing from the last cumulative value.
     """
     
     def __init__(
@@ -20,6 +27,8 @@ class ShowProbabilityTableUseCase:
         self.prob_calc = probability_calculator
         self.counter_calc = counter_calculator
         self.rules = rules
+        self._rows: list[ProbabilityTableRowDTO] = []
+        self._cumulative_prob_no_6 = 1.0
     
     def execute(self, max_pulls: int = 80) -> list[ProbabilityTableRowDTO]:
         """
@@ -31,10 +40,10 @@ class ShowProbabilityTableUseCase:
         Returns:
             List of table rows
         """
-        rows = []
-        cumulative_prob_no_6 = 1.0
+        rows = self._rows
+        cumulative_prob_no_6 = self._cumulative_prob_no_6
         
-        for pull in range(max_pulls):
+        for pull in range(len(rows), max_pulls):
             pity = self.counter_calc.calculate_pity_counter(pull)
             prob = self.prob_calc.calculate_6_star_probability(pull)
             
@@ -49,4 +58,35 @@ class ShowProbabilityTableUseCase:
                 cumulative=cumulative
             ))
         
-        return rows
+        self._cumulative_prob_no_6 = cumulative_prob_no_6
+        return rows[:max_pulls]
+    
+    def iter_columns(self, max_pulls: int = 80, chunk_size: int = 65_536) -> Iterator[dict[str, np.ndarray]]:
+        """
+        Stream the same table as column arrays, without building row DTOs.
+        
+        Args:
+            max_pulls: Maximum number of pulls to include
+            chunk_size: Rows per chunk
+        
+        Yields:
+            Dicts of ``pull_number``, ``pity``, ``probability`` and
+            ``cumulative`` arrays of at most ``chunk_size`` rows
+        """
+        hazard = np.asarray(self.rules.hazard_table, dtype=float)
+        prob_no_6 = 1.0
+        for start in range(0, max_pulls, chunk_size):
+            pulls = np.arange(start, min(start + chunk_size, max_pulls))
+            probability = hazard[np.minimum(pulls, len(hazard) - 1)]
+            survival = prob_no_6 * np.cumprod(1.0 - probability)
+            prob_no_6 = float(survival[-1])
+            yield {
+                "pull_number": pulls + 1,
+                "pity": np.minimum(pulls, self.rules.hard_pity),
+                "probability": probability,
+                "cumulative": 1.0 - survival,
+            }
+    
+    def featured_curve(self) -> np.ndarray:
+        """P(featured within n pulls) on a fresh banner at pity 0, for n = 1 .. featured guarantee."""
+        return np.asarray(compile_rules(self.rules).featured_cdf[1:])
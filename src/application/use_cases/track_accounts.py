@@ -0,0 +1,169 @@
+"""Multi-account tracking use case."""
+
+from collections.abc import Sequence
+from typing import Optional
+
+import numpy as np
+
+from src.domain.entities import PityState, PityStateBatch
+from src.domain.entities.pity_state_batch import COUNTER_DTYPE
+from src.domain.services import ArrayCounterCalculator, BulkPullApplier
+from src.domain.value_objects import GameRules
+from ..ports import AccountSnapshotRepository
+
+
+class MultiAccountTracker:
+    """
+    Tracks the pity state of many accounts in a struct-of-arrays store.
+
+    Each counter is one preallocated column indexed by account row; the
+    store grows by doubling, so adding accounts is amortized O(1). Pull
+    batches for any mix of accounts are applied in a single vectorized
+    pass, and snapshots save the columns as-is.
+    """
+
+    def __init__(
+        self,
+        rules: GameRules,
+        repository: Optional[AccountSnapshotRepository] = None,
+        capacity: int = 1_024,
+    ):
+        """
+        Initialize an empty tracker.
+
+        Args:
+            rules: Game rules
+            repository: Snapshot persistence (optional)
+            capacity: Initial number of account rows allocated
+        """
+        self.rules = rules
+        self.repository = repository
+        self.applier = BulkPullApplier(rules)
+        self.counters = ArrayCounterCalculator(rules)
+        self._size = 0
+        self._ids = np.empty(max(capacity, 1), dtype=object)
+        self._columns = PityStateBatch.zeros(max(capacity, 1))
+        self._rows: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, account_id: str) -> bool:
+        return account_id in self._rows
+
+    @property
+    def account_ids(self) -> np.ndarray:
+        """Ids of the tracked accounts, in row order."""
+        return self._ids[:self._size]
+
+    @property
+    def batch(self) -> PityStateBatch:
+        """View of the live rows of every column."""
+        return PityStateBatch(*(getattr(self._columns, name)[:self._size] for name in PityStateBatch.COLUMNS))
+
+    def _grow(self, needed: int) -> None:
+        """Reallocate the columns to hold at least ``needed`` rows."""
+        capacity = len(self._ids)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        ids = np.empty(capacity, dtype=object)
+        ids[:self._size] = self._ids[:self._size]
+        columns = PityStateBatch.zeros(capacity)
+        for name in PityStateBatch.COLUMNS:
+            getattr(columns, name)[:self._size] = getattr(self._columns, name)[:self._size]
+        self._ids = ids
+        self._columns = columns
+
+    def add_accounts(self, account_ids: Sequence[str], states: Optional[PityStateBatch] = None) -> np.ndarray:
+        """
+        Start tracking new accounts.
+
+        Args:
+            account_ids: Ids of the new accounts (must not be tracked yet)
+            states: Their current states (default: initial states)
+
+        Returns:
+            Row index of each new account
+        """
+        duplicates = [a for a in account_ids if a in self._rows]
+        if duplicates or len(set(account_ids)) != len(account_ids):
+            raise ValueError(f"Accounts already tracked or repeated: {duplicates[:10]}")
+        if states is not None:
+            if len(states) != len(account_ids):
+                raise ValueError("states must have one row per account")
+            states.validate().raise_if_invalid()
+
+        start = self._size
+        end = start + len(account_ids)
+        self._grow(end)
+        self._ids[start:end] = list(account_ids)
+        for name in PityStateBatch.COLUMNS:
+            column = getattr(self._columns, name)
+            column[start:end] = 0 if states is None else getattr(states, name)
+        self._rows.update((account_id, start + i) for i, account_id in enumerate(account_ids))
+        self._size = end
+        return np.arange(start, end)
+
+    def rows(self, account_ids: Sequence[str]) -> np.ndarray:
+        """Row index of each account (KeyError if not tracked)."""
+        return np.fromiter((self._rows[a] for a in account_ids), dtype=np.int64, count=len(account_ids))
+
+    def apply_pulls(self, rows: np.ndarray, rarities: np.ndarray) -> None:
+        """
+        Apply a batch of pull results.
+
+        Args:
+            rows: Account row of each pull, in pull order
+            rarities: Rarity (4, 5 or 6) of each pull
+        """
+        updated = self.applier.apply(self.batch, rows, rarities)
+        for name in PityStateBatch.COLUMNS:
+            getattr(self._columns, name)[:self._size] = getattr(updated, name)
+
+    def start_banner(self, rows: Optional[np.ndarray] = None) -> None:
+        """Reset banner_pulls (for the given rows, or every account) when a new banner starts."""
+        banner = self._columns.banner_pulls
+        if rows is None:
+            banner[:self._size] = 0
+        else:
+            banner[np.asarray(rows, dtype=np.int64)] = 0
+
+    def state(self, account_id: str) -> PityState:
+        """Current state of one account."""
+        return self._columns.state(self._rows[account_id])
+
+    def status(self) -> dict[str, np.ndarray]:
+        """Counters and milestone distances of every tracked account."""
+        return self.counters.status(self.batch)
+
+    def save(self) -> None:
+        """Save a snapshot through the repository."""
+        if self.repository is None:
+            raise ValueError("No snapshot repository configured")
+        self.repository.save(self.account_ids.astype(str), self.batch)
+
+    def load(self) -> bool:
+        """
+        Replace the tracked accounts with the repository's snapshot.
+
+        The tracked accounts are only replaced once the whole snapshot
+        has been validated.
+
+        Returns:
+            Whether a snapshot was found
+        """
+        if self.repository is None:
+            raise ValueError("No snapshot repository configured")
+        snapshot = self.repository.load()
+        if snapshot is None:
+            return False
+        account_ids, batch = snapshot
+        # Validate into a fresh store so a bad snapshot leaves this one intact
+        loaded = MultiAccountTracker(self.rules, capacity=len(self._ids))
+        loaded.add_accounts(account_ids.tolist(), PityStateBatch(
+            *(getattr(batch, name).astype(COUNTER_DTYPE) for name in PityStateBatch.COLUMNS)
+        ))
+        self._size, self._ids, self._columns, self._rows = loaded._size, loaded._ids, loaded._columns, loaded._rows
+        return True
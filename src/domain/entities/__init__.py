@@ -2,5 +2,17 @@
 
 from .pity_state import PityState
 from .pull_result import PullResult, CharacterType
+from .pull_event import PullEvent, EventType
+from .pity_state_batch import PityStateBatch, StateValidationReport
+from .pull_record_batch import PullRecordBatch
 
-__all__ = ["PityState", "PullResult", "CharacterType"]
+__all__ = [
+    "PityState",
+    "PullResult",
+    "CharacterType",
+    "PullEvent",
+    "EventType",
+    "PityStateBatch",
+    "StateValidationReport",
+    "PullRecordBatch",
+]
@@ -0,0 +1,120 @@
+"""Columnar batch of pity states."""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from ..exceptions import InvalidPityStateError
+from .pity_state import PityState
+
+
+COUNTER_DTYPE = np.int32
+
+
+@dataclass(frozen=True)
+class StateValidationReport:
+    """
+    Result of validating a batch against the PityState invariants.
+
+    ``violations`` maps each broken invariant to the offending row indices.
+    """
+    rows: int
+    violations: dict[str, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def valid(self) -> bool:
+        """Whether every row satisfies every invariant."""
+        return not self.violations
+
+    @property
+    def invalid_rows(self) -> np.ndarray:
+        """Sorted indices of rows breaking at least one invariant."""
+        if not self.violations:
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate(list(self.violations.values())))
+
+    def raise_if_invalid(self) -> None:
+        """Raise InvalidPityStateError listing the first offending rows per invariant."""
+        if self.valid:
+            return
+        details = "; ".join(
+            f"{name}: rows {rows[:10].tolist()}{'...' if len(rows) > 10 else ''}"
+            for name, rows in self.violations.items()
+        )
+        raise InvalidPityStateError(f"{len(self.invalid_rows)} of {self.rows} states are invalid ({details})")
+
+
+@dataclass(frozen=True)
+class PityStateBatch:
+    """
+    Many PityState values stored as one array per counter.
+
+    Row i of every column belongs to the same account. Unlike PityState the
+    batch is not validated on construction; call validate() once for the
+    whole batch instead of paying for one model per row.
+    """
+    pulls_without_6_star: np.ndarray
+    pulls_without_5_star: np.ndarray
+    banner_pulls: np.ndarray
+    total_pulls: np.ndarray
+
+    COLUMNS = ("pulls_without_6_star", "pulls_without_5_star", "banner_pulls", "total_pulls")
+
+    def __post_init__(self) -> None:
+        lengths = {len(getattr(self, name)) for name in self.COLUMNS}
+        if len(lengths) > 1:
+            raise ValueError(f"All columns must have the same length, got {sorted(lengths)}")
+
+    def __len__(self) -> int:
+        return len(self.pulls_without_6_star)
+
+    @classmethod
+    def from_arrays(cls, **columns: Iterable[int]) -> "PityStateBatch":
+        """Build from array-likes (pulls_without_5_star defaults to zeros)."""
+        arrays = {name: np.asarray(values, dtype=COUNTER_DTYPE) for name, values in columns.items()}
+        if "pulls_without_5_star" not in arrays:
+            arrays["pulls_without_5_star"] = np.zeros_like(arrays["pulls_without_6_star"])
+        return cls(**arrays)
+
+    @classmethod
+    def from_states(cls, states: Iterable[PityState]) -> "PityStateBatch":
+        """Build from PityState objects."""
+        rows = [
+            (s.pulls_without_6_star, s.pulls_without_5_star, s.banner_pulls, s.total_pulls)
+            for s in states
+        ]
+        table = np.array(rows, dtype=COUNTER_DTYPE).reshape(-1, 4)
+        return cls(*(np.ascontiguousarray(table[:, i]) for i in range(4)))
+
+    @classmethod
+    def zeros(cls, size: int) -> "PityStateBatch":
+        """Batch of initial states."""
+        return cls(*(np.zeros(size, dtype=COUNTER_DTYPE) for _ in cls.COLUMNS))
+
+    def state(self, index: int) -> PityState:
+        """Row as a validated PityState."""
+        return PityState(**{name: int(getattr(self, name)[index]) for name in self.COLUMNS})
+
+    def to_states(self) -> list[PityState]:
+        """All rows as validated PityState objects."""
+        return [self.state(i) for i in range(len(self))]
+
+    def validate(self) -> StateValidationReport:
+        """
+        Check the PityState invariants for every row at once.
+
+        Returns:
+            Report with the offending row indices per invariant
+        """
+        checks = {
+            "negative_counter": (
+                (self.pulls_without_6_star < 0) | (self.pulls_without_5_star < 0)
+                | (self.banner_pulls < 0) | (self.total_pulls < 0)
+            ),
+            "6_star_pity_above_hard_pity": self.pulls_without_6_star > 80,
+            "5_star_pity_above_guarantee": self.pulls_without_5_star > 10,
+            "total_below_banner_pulls": self.total_pulls < self.banner_pulls,
+        }
+        violations = {name: np.flatnonzero(mask) for name, mask in checks.items() if mask.any()}
+        return StateValidationReport(rows=len(self), violations=violations)
@@ -0,0 +1,31 @@
+"""Pull event entity."""
+
+from enum import Enum
+from pydantic import BaseModel, Field
+
+from .pity_state import PityState
+from .pull_result import PullResult
+
+
+class EventType(str, Enum):
+    """Type of event produced by an event-driven simulation."""
+    SIX_STAR = "six_star"
+    FIVE_STAR = "five_star"
+    FREE_PULL_REWARD = "free_pull_reward"
+    FEATURED_GUARANTEE = "featured_guarantee"
+    BONUS_DUPE = "bonus_dupe"
+
+
+class PullEvent(BaseModel):
+    """
+    Represents a noteworthy pull in a simulated sequence.
+
+    Uneventful 4★ pulls are never materialized; an event records how many
+    pulls into the simulation it happened and the state right after it.
+    """
+    pull_offset: int = Field(ge=1, description="Pulls since simulation start")
+    event_type: EventType = Field(description="What happened on this pull")
+    result: PullResult | None = Field(default=None, description="Pull result (None for milestones)")
+    state: PityState = Field(description="Pity state after this pull")
+
+    model_config = {"frozen": True}
@@ -0,0 +1,52 @@
+"""Columnar batch of imported pull records."""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+NO_50_50 = -1
+
+
+@dataclass(frozen=True)
+class PullRecordBatch:
+    """
+    Pull records of many players stored as one column per field.
+
+    Row i is one pull. Records of a player are contiguous and in pull
+    order; ``banners`` identifies the banner each pull was made on.
+    ``won_50_50`` is 1 (won), 0 (lost) or NO_50_50.
+    """
+    players: tuple[str, ...]
+    banners: tuple[str, ...]
+    rarities: np.ndarray
+    featured: np.ndarray
+    won_50_50: np.ndarray
+
+    def __post_init__(self) -> None:
+        sizes = {len(self.players), len(self.banners), len(self.rarities), len(self.featured), len(self.won_50_50)}
+        if len(sizes) != 1:
+            raise ValueError("All record columns must have the same length")
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def slice(self, start: int, end: int) -> "PullRecordBatch":
+        """Records [start, end) as a new batch."""
+        return PullRecordBatch(
+            self.players[start:end],
+            self.banners[start:end],
+            self.rarities[start:end],
+            self.featured[start:end],
+            self.won_50_50[start:end],
+        )
+
+    def leading_run(self) -> int:
+        """Number of leading records that belong to the first player."""
+        if not self.players:
+            return 0
+        first = self.players[0]
+        for i, player in enumerate(self.players):
+            if player != first:
+                return i
+        return len(self.players)
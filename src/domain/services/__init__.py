@@ -3,5 +3,97 @@
 from .probability_calculator import ProbabilityCalculator
 from .counter_calculator import CounterCalculator
 from .pity_simulator import PitySimulator
+from .gap_distributions import GapDistributions
+from .event_simulator import EventDrivenSimulator
+from .streaming_stats import RunningMoments, FixedBinHistogram, QuantileSketch, PullStatistics
+from .adaptive_monte_carlo import AdaptiveMonteCarlo
+from .pull_kernel import PullKernel, KernelState, PullOutcome
+from .pull_strategies import (
+    PullStrategy,
+    StopAtFeatured,
+    ReachSpark,
+    SaveForNextBanner,
+    ChaseDupe,
+    StrategySimulator,
+    StrategyOutcome,
+)
+from .chunked_simulation import ChunkedSimulation, CancellationToken
+from .markov_engine import MarkovTransitionEngine, StateDistribution, SparseTransitions
+from .renewal_analysis import RenewalAnalyzer, LongRunMetrics
+from .rules_sweep import RulesSweep, SweepResult
+from .compiled_rules import (
+    ArtifactStore,
+    CompiledRules,
+    CompiledRulesRegistry,
+    build_alias_table,
+    compile_rules,
+    configure_registry,
+    get_registry,
+)
+from .answer_cube import FeaturedAnswerCube, CubeAnswer
+from .banner_plan_dp import BannerPlanDP, PlanDistribution
+from .tiered_query import TieredProbabilityService, TieredAnswer
+from .array_counters import ArrayCounterCalculator
+from .bulk_pulls import BulkPullApplier
+from .event_sourcing import AccountEventLog, HistoryEventKind
+from .history_index import FenwickTree, PullHistoryIndex, HistoryCounts
+from .luck_scoring import LuckScorer, LuckAccumulator, LuckReport
+from .population_stats import PopulationStats, PopulationReplayer, PlayerCarry
 
-__all__ = ["ProbabilityCalculator", "CounterCalculator", "PitySimulator"]
+__all__ = [
+    "ProbabilityCalculator",
+    "CounterCalculator",
+    "PitySimulator",
+    "GapDistributions",
+    "EventDrivenSimulator",
+    "RunningMoments",
+    "FixedBinHistogram",
+    "QuantileSketch",
+    "PullStatistics",
+    "AdaptiveMonteCarlo",
+    "PullKernel",
+    "KernelState",
+    "PullOutcome",
+    "PullStrategy",
+    "StopAtFeatured",
+    "ReachSpark",
+    "SaveForNextBanner",
+    "ChaseDupe",
+    "StrategySimulator",
+    "StrategyOutcome",
+    "ChunkedSimulation",
+    "CancellationToken",
+    "MarkovTransitionEngine",
+    "StateDistribution",
+    "SparseTransitions",
+    "RenewalAnalyzer",
+    "LongRunMetrics",
+    "RulesSweep",
+    "SweepResult",
+    "ArtifactStore",
+    "CompiledRules",
+    "CompiledRulesRegistry",
+    "build_alias_table",
+    "compile_rules",
+    "configure_registry",
+    "get_registry",
+    "FeaturedAnswerCube",
+    "CubeAnswer",
+    "BannerPlanDP",
+    "PlanDistribution",
+    "TieredProbabilityService",
+    "TieredAnswer",
+    "ArrayCounterCalculator",
+    "BulkPullApplier",
+    "AccountEventLog",
+    "HistoryEventKind",
+    "FenwickTree",
+    "PullHistoryIndex",
+    "HistoryCounts",
+    "LuckScorer",
+    "LuckAccumulator",
+    "LuckReport",
+    "PopulationStats",
+    "PopulationReplayer",
+    "PlayerCarry",
+]
@@ -0,0 +1,132 @@
+"""Adaptive-precision Monte Carlo domain service."""
+
+import math
+from collections.abc import Callable
+from statistics import NormalDist
+
+from ..value_objects import ConfidenceInterval
+from .streaming_stats import RunningMoments
+
+
+class AdaptiveMonteCarlo:
+    """
+    Domain service that samples in chunks until a target precision is met.
+
+    After every chunk the confidence interval is recomputed; sampling stops
+    as soon as its half-width is within the target, or when the sample
+    budget is exhausted (reported as not converged).
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 10_000,
+        min_samples: int = 1_000,
+        max_samples: int = 10_000_000,
+    ):
+        """
+        Initialize runner.
+
+        Args:
+            chunk_size: Samples drawn between precision checks
+            min_samples: Samples drawn before the first check
+            max_samples: Hard cap on the number of samples
+        """
+        if chunk_size <= 0 or max_samples <= 0:
+            raise ValueError("chunk_size and max_samples must be positive")
+        self.chunk_size = chunk_size
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+
+    @staticmethod
+    def z_score(confidence: float) -> float:
+        """Two-sided normal critical value for a confidence level."""
+        if not 0.0 < confidence < 1.0:
+            raise ValueError(f"Confidence must be between 0 and 1, got {confidence}")
+        return NormalDist().inv_cdf((1 + confidence) / 2)
+
+    @staticmethod
+    def wilson_interval(successes: int, trials: int, z: float) -> tuple[float, float]:
+        """Wilson score interval for a binomial proportion."""
+        if trials == 0:
+            return 0.0, 1.0
+        p = successes / trials
+        denom = 1 + z * z / trials
+        center = (p + z * z / (2 * trials)) / denom
+        margin = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denom
+        return max(0.0, center - margin), min(1.0, center + margin)
+
+    def _next_chunk(self, drawn: int) -> int:
+        """Size of the next chunk, honouring the minimum and the cap."""
+        size = self.chunk_size if drawn >= self.min_samples else max(self.chunk_size, self.min_samples)
+        return min(size, self.max_samples - drawn)
+
+    def estimate_proportion(
+        self,
+        trial: Callable[[], bool],
+        target_half_width: float,
+        confidence: float = 0.95,
+    ) -> ConfidenceInterval:
+        """
+        Estimate the probability of an event.
+
+        Args:
+            trial: Runs one independent trial and reports whether the event happened
+            target_half_width: Required absolute half-width (e.g. 0.001 for ±0.1%)
+            confidence: Confidence level of the interval
+
+        Returns:
+            Estimate with its Wilson interval
+        """
+        z = self.z_score(confidence)
+        successes = 0
+        trials = 0
+
+        while trials < self.max_samples:
+            chunk = self._next_chunk(trials)
+            successes += sum(1 for _ in range(chunk) if trial())
+            trials += chunk
+            lower, upper = self.wilson_interval(successes, trials, z)
+            if (upper - lower) / 2 <= target_half_width:
+                return ConfidenceInterval(
+                    estimate=successes / trials, lower=lower, upper=upper,
+                    confidence=confidence, samples=trials, converged=True
+                )
+
+        lower, upper = self.wilson_interval(successes, trials, z)
+        return ConfidenceInterval(
+            estimate=successes / trials, lower=lower, upper=upper,
+            confidence=confidence, samples=trials, converged=False
+        )
+
+    def estimate_mean(
+        self,
+        sample: Callable[[], float],
+        target_half_width: float,
+        confidence: float = 0.95,
+    ) -> ConfidenceInterval:
+        """
+        Estimate the mean of a random quantity.
+
+        Args:
+            sample: Draws one independent sample
+            target_half_width: Required absolute half-width of the interval
+            confidence: Confidence level of the interval
+
+        Returns:
+            Estimate with its normal-approximation interval
+        """
+        z = self.z_score(confidence)
+        moments = RunningMoments()
+
+        while moments.count < self.max_samples:
+            for _ in range(self._next_chunk(moments.count)):
+                moments.add(sample())
+            half_width = z * moments.standard_error
+            if half_width <= target_half_width:
+                break
+
+        half_width = z * moments.standard_error
+        return ConfidenceInterval(
+            estimate=moments.mean, lower=moments.mean - half_width, upper=moments.mean + half_width,
+            confidence=confidence, samples=moments.count, converged=half_width <= target_half_width
+        )
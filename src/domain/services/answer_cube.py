@@ -0,0 +1,169 @@
+"""Precomputed featured answer cube domain service."""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from ..entities import PityState
+from ..value_objects import GameRules
+from .compiled_rules import compile_rules
+from .renewal_analysis import RenewalAnalyzer
+
+
+class CubeAnswer(NamedTuple):
+    """Featured odds for one state and budget."""
+    probability: float
+    expected_spend: float
+    expected_pulls: float
+
+
+class FeaturedAnswerCube:
+    """
+    Domain service answering featured queries by table lookup.
+
+    For every (pulls_without_6_star, banner_pulls, guarantee state, budget)
+    the cube holds P(featured within budget) and the expected pulls spent
+    when stopping at the featured unit or the budget, whichever comes
+    first; the uncapped expected pulls to featured is held per state.
+
+    These rules have no carry-over guarantee after a lost 50/50, so the
+    only flag that changes the answer is whether the banner's featured
+    guarantee is still pending. Once it is used (or banner_pulls is past
+    it) the answer no longer depends on banner_pulls, so that half of the
+    cube is stored as a (pity, budget) plane. pulls_without_5_star never
+    affects the featured odds and is not an axis.
+
+    Tables are built once per rules set by backward DP over the budget and
+    go through the compiled-rules artifact store, so with an on-disk cache
+    configured they are memory-mapped rather than rebuilt.
+    """
+
+    def __init__(self, rules: GameRules, max_budget: int = 240):
+        """
+        Build or load the cube.
+
+        Args:
+            rules: Game rules
+            max_budget: Largest budget that can be queried
+        """
+        if max_budget < 0:
+            raise ValueError(f"max_budget must be non-negative, got {max_budget}")
+        self.rules = rules
+        self.max_budget = max_budget
+        compiled = compile_rules(rules)
+        self.hazard = compiled.hazard
+        suffix = f"b{max_budget}"
+
+        # probability[pity, banner, budget] with the guarantee pending,
+        # probability_used[pity, budget] once it is not
+        self.probability_used = compiled.artifact(f"cube_probability_used_{suffix}", self._build_used)
+        self.probability = compiled.artifact(f"cube_probability_{suffix}", self._build_pending)
+        self.spend_used = compiled.artifact(f"cube_spend_used_{suffix}", lambda: self._spend(self.probability_used))
+        self.spend = compiled.artifact(f"cube_spend_{suffix}", lambda: self._spend(self.probability))
+        analyzer = RenewalAnalyzer(rules)
+        self.expected_used = analyzer.expected_pulls_to_featured_used()
+        self.expected = analyzer.expected_pulls_to_featured_pending()
+
+    @property
+    def _next_pity(self) -> np.ndarray:
+        return np.minimum(np.arange(self.rules.hard_pity + 1) + 1, self.rules.hard_pity)
+
+    def _build_used(self) -> np.ndarray:
+        """P(featured within b pulls) with no guarantee left, shape (pity, budget)."""
+        h = self.hazard
+        win = self.rules.prob_50_50
+        nxt = self._next_pity
+        table = np.zeros((self.max_budget + 1, h.size))
+        for b in range(1, self.max_budget + 1):
+            prev = table[b - 1]
+            table[b] = h * (win + (1 - win) * prev[0]) + (1 - h) * prev[nxt]
+        return np.ascontiguousarray(table.T)
+
+    def _build_pending(self) -> np.ndarray:
+        """P(featured within b pulls) with the guarantee pending, shape (pity, banner, budget)."""
+        h = self.hazard[:, None]
+        win = self.rules.prob_50_50
+        nxt = self._next_pity
+        guarantee = self.rules.featured_guarantee
+        table = np.zeros((self.max_budget + 1, self.hazard.size, guarantee))
+        for b in range(1, self.max_budget + 1):
+            prev = table[b - 1]
+            table[b, :, :-1] = h * (win + (1 - win) * prev[0, 1:]) + (1 - h) * prev[nxt, 1:]
+            # The pull reaching the guarantee is featured
+            table[b, :, -1] = 1.0
+        return np.ascontiguousarray(np.moveaxis(table, 0, -1))
+
+    @staticmethod
+    def _spend(probability: np.ndarray) -> np.ndarray:
+        """E[min(T, b)] = sum over k < b of P(T > k), along the budget axis."""
+        spend = np.zeros_like(probability)
+        np.cumsum(1.0 - probability[..., :-1], axis=-1, out=spend[..., 1:])
+        return spend
+
+    def _check_budget(self, budget: int) -> None:
+        if not 0 <= budget <= self.max_budget:
+            raise ValueError(f"Budget must be between 0 and {self.max_budget}, got {budget}")
+
+    def lookup(self, state: PityState, budget: int, featured_obtained: bool = False) -> CubeAnswer:
+        """
+        Featured odds for one account.
+
+        Args:
+            state: Current pity state
+            budget: Pulls available
+            featured_obtained: Whether the featured unit was already obtained
+                on this banner (the guarantee is then used up)
+
+        Returns:
+            P(featured within budget), expected pulls spent (capped at the
+            budget) and uncapped expected pulls to featured
+        """
+        self._check_budget(budget)
+        pity = min(state.pulls_without_6_star, self.rules.hard_pity)
+        if featured_obtained or state.banner_pulls >= self.rules.featured_guarantee:
+            return CubeAnswer(
+                float(self.probability_used[pity, budget]),
+                float(self.spend_used[pity, budget]),
+                float(self.expected_used[pity]),
+            )
+        banner = state.banner_pulls
+        return CubeAnswer(
+            float(self.probability[pity, banner, budget]),
+            float(self.spend[pity, banner, budget]),
+            float(self.expected[pity, banner]),
+        )
+
+    def lookup_many(
+        self,
+        pity: np.ndarray,
+        banner_pulls: np.ndarray,
+        budget: np.ndarray,
+        featured_obtained: np.ndarray | None = None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized lookup for many accounts at once.
+
+        Args:
+            pity: pulls_without_6_star per account
+            banner_pulls: banner_pulls per account
+            budget: Pulls available per account
+            featured_obtained: Per-account flag (default: all False)
+
+        Returns:
+            (probability, expected_spend, expected_pulls) arrays
+        """
+        pity = np.minimum(np.asarray(pity), self.rules.hard_pity)
+        banner = np.asarray(banner_pulls)
+        budget = np.asarray(budget)
+        if budget.size and (budget.min() < 0 or budget.max() > self.max_budget):
+            raise ValueError(f"Budgets must be between 0 and {self.max_budget}")
+        used = banner >= self.rules.featured_guarantee
+        if featured_obtained is not None:
+            used = used | np.asarray(featured_obtained, dtype=bool)
+        banner = np.where(used, 0, banner)
+
+        return (
+            np.where(used, self.probability_used[pity, budget], self.probability[pity, banner, budget]),
+            np.where(used, self.spend_used[pity, budget], self.spend[pity, banner, budget]),
+            np.where(used, self.expected_used[pity], self.expected[pity, banner]),
+        )
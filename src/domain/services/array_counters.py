@@ -0,0 +1,92 @@
+"""Vectorized counter calculation domain service."""
+
+import numpy as np
+
+from ..entities import PityStateBatch
+from ..value_objects import GameRules
+
+
+class ArrayCounterCalculator:
+    """
+    Array counterpart of CounterCalculator.
+
+    Every method takes whole columns of counters and returns plain integer
+    arrays (no PityCount/PullCount wrapping), with the same formulas as the
+    scalar service.
+    """
+
+    def __init__(self, rules: GameRules):
+        """Initialize with game rules."""
+        self.rules = rules
+
+    def pity_counter(self, pulls_without_6_star: np.ndarray) -> np.ndarray:
+        """P(r) = min(r, 80)."""
+        return np.minimum(pulls_without_6_star, self.rules.hard_pity)
+
+    def spark_counter(self, banner_pulls: np.ndarray) -> np.ndarray:
+        """S(r) = min(r, 120)."""
+        return np.minimum(banner_pulls, self.rules.featured_guarantee)
+
+    def dupe_counter(self, total_pulls: np.ndarray) -> np.ndarray:
+        """D(r) = min(r, 240)."""
+        return np.minimum(total_pulls, self.rules.bonus_dupe)
+
+    def pity_reset(self, banner_pulls: np.ndarray) -> np.ndarray:
+        """PR(r) = max(0, r - 80)."""
+        return np.maximum(0, banner_pulls - self.rules.hard_pity)
+
+    def pulls_to_soft_pity(self, pulls_without_6_star: np.ndarray) -> np.ndarray:
+        """Pulls remaining until soft pity starts."""
+        return np.maximum(0, self.rules.soft_pity_start - pulls_without_6_star)
+
+    def pulls_to_hard_pity(self, pulls_without_6_star: np.ndarray) -> np.ndarray:
+        """Pulls remaining until hard pity."""
+        return np.maximum(0, self.rules.hard_pity - pulls_without_6_star)
+
+    def pulls_to_featured(self, banner_pulls: np.ndarray) -> np.ndarray:
+        """Pulls remaining until the featured guarantee."""
+        return np.maximum(0, self.rules.featured_guarantee - banner_pulls)
+
+    def pulls_to_bonus_dupe(self, total_pulls: np.ndarray) -> np.ndarray:
+        """Pulls remaining until the bonus dupe."""
+        return np.maximum(0, self.rules.bonus_dupe - total_pulls)
+
+    def pulls_to_free_pull(self, banner_pulls: np.ndarray) -> np.ndarray:
+        """Pulls remaining until the free 10-pull reward."""
+        return np.maximum(0, self.rules.free_pull_reward - banner_pulls)
+
+    def pulls_to_5_star(self, pulls_without_5_star: np.ndarray) -> np.ndarray:
+        """Pulls remaining until the 5★ guarantee."""
+        guarantee = self.rules.five_star_guarantee
+        return guarantee - (pulls_without_5_star % guarantee)
+
+    def status(self, batch: PityStateBatch) -> dict[str, np.ndarray]:
+        """
+        Every counter and milestone distance for a batch of accounts.
+
+        Args:
+            batch: Account states
+
+        Returns:
+            Column name -> array, with the same fields as StateInfoDTO
+        """
+        p6 = batch.pulls_without_6_star
+        banner = batch.banner_pulls
+        return {
+            "pulls_without_6_star": p6,
+            "pulls_without_5_star": batch.pulls_without_5_star,
+            "banner_pulls": banner,
+            "total_pulls": batch.total_pulls,
+            "current_pity": self.pity_counter(p6),
+            "banner_counter": self.spark_counter(banner),
+            "dupe_counter": self.dupe_counter(batch.total_pulls),
+            "pulls_to_soft_pity": self.pulls_to_soft_pity(p6),
+            "pulls_to_hard_pity": self.pulls_to_hard_pity(p6),
+            "pulls_to_featured": self.pulls_to_featured(banner),
+            "pulls_to_bonus_dupe": self.pulls_to_bonus_dupe(batch.total_pulls),
+            "pulls_to_free_pull": self.pulls_to_free_pull(banner),
+            "pulls_to_5_star": self.pulls_to_5_star(batch.pulls_without_5_star),
+            "in_soft_pity": p6 >= self.rules.soft_pity_start,
+            "at_hard_pity": p6 >= self.rules.hard_pity,
+            "at_featured_guarantee": banner >= self.rules.featured_guarantee,
+        }
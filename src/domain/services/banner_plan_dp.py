@@ -0,0 +1,162 @@
+"""Long-horizon banner plan DP with probability-mass pruning."""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from ..entities import PityState
+from ..value_objects import GameRules
+from .compiled_rules import compile_rules
+
+
+@dataclass(frozen=True)
+class PlanDistribution:
+    """
+    Distribution of featured copies at the end of a banner plan.
+
+    ``copies_pmf[i]`` is P(copies = copies_offset + i) computed on the pruned
+    state space, so every entry is a lower bound and the true value exceeds
+    it by at most ``discarded_mass`` in total (the pruned vector is
+    dominated entrywise by the exact one). Copies include bonus dupes.
+    """
+    pulls: int
+    copies_offset: int
+    copies_pmf: np.ndarray
+    pity_6_star: np.ndarray
+    discarded_mass: float
+    peak_states: int
+
+    @property
+    def max_copies(self) -> int:
+        """Largest copy count any path could reach (used for error bounds)."""
+        return self.copies_offset + len(self.copies_pmf) - 1 + self.pulls
+
+    def probability_at_least(self, copies: int) -> tuple[float, float]:
+        """Bounds (lower, upper) on P(at least ``copies`` featured copies)."""
+        lower = float(self.copies_pmf[max(copies - self.copies_offset, 0):].sum())
+        return lower, min(lower + self.discarded_mass, 1.0)
+
+    def expected_copies(self) -> tuple[float, float]:
+        """Bounds (lower, upper) on the expected number of featured copies."""
+        values = self.copies_offset + np.arange(len(self.copies_pmf))
+        lower = float(values @ self.copies_pmf)
+        return lower, lower + self.discarded_mass * self.max_copies
+
+
+class BannerPlanDP:
+    """
+    Domain service for exact featured-copy distributions over many banners.
+
+    The state is the PityState tuple: pulls_without_6_star, the spark
+    (banner_pulls) and dupe (total_pulls) positions, plus whether the
+    featured unit was obtained on the current banner and the number of
+    copies so far. Spark and dupe positions are deterministic for a given
+    plan, so only (pity, featured obtained, copies) carries probability
+    mass; pulls_without_5_star never affects featured copies and is dropped.
+
+    The copies axis grows with the horizon. Any state whose mass falls
+    below ``epsilon`` is dropped and its mass added to the reported
+    discarded total, and the copies window is trimmed to its live range,
+    which keeps state counts bounded for multi-year plans.
+    """
+
+    def __init__(self, rules: GameRules, epsilon: float = 1e-12):
+        """
+        Initialize the DP.
+
+        Args:
+            rules: Game rules
+            epsilon: States with less probability mass are pruned (0 disables)
+        """
+        if epsilon < 0:
+            raise ValueError(f"epsilon must be non-negative, got {epsilon}")
+        self.rules = rules
+        self.epsilon = epsilon
+        self.hazard = compile_rules(rules).hazard
+
+    def _step(self, mass: np.ndarray, guarantee: bool) -> np.ndarray:
+        """One pull over mass[pity, featured obtained, copies]; the copies axis grows by one."""
+        h = self.hazard[:, None, None]
+        win = self.rules.prob_50_50
+        states, _, width = mass.shape
+        new = np.zeros((states, 2, width + 1))
+
+        if guarantee:
+            # The pull reaching the guarantee is featured unless already obtained
+            new[0, 1, 1:] += mass[:, 0, :].sum(axis=0)
+            mass = mass.copy()
+            mass[:, 0, :] = 0.0
+
+        hits = (mass * h).sum(axis=0)
+        new[0, 1, 1:] += win * hits.sum(axis=0)
+        new[0, :, :width] += (1 - win) * hits
+        miss = mass * (1 - h)
+        new[1:, :, :width] += miss[:-1]
+        new[-1, :, :width] += miss[-1]
+        return new
+
+    def _prune(self, mass: np.ndarray, offset: int) -> tuple[np.ndarray, int, float]:
+        """Drop states under epsilon and trim empty copy counts at either end."""
+        discarded = 0.0
+        if self.epsilon > 0:
+            small = mass < self.epsilon
+            discarded = float(mass[small].sum())
+            mass[small] = 0.0
+        live = np.flatnonzero(mass.any(axis=(0, 1)))
+        if live.size == 0:
+            return mass[:, :, :1], offset, discarded
+        return mass[:, :, live[0]:live[-1] + 1], offset + int(live[0]), discarded
+
+    def evaluate(
+        self,
+        state: PityState,
+        plan: Sequence[int],
+        featured_obtained: bool = False,
+    ) -> PlanDistribution:
+        """
+        Distribution of featured copies after following a banner plan.
+
+        Args:
+            state: Pity state at the start of the first banner
+            plan: Pulls spent on each banner, in order
+            featured_obtained: Whether the featured unit was already obtained
+                on the first banner
+
+        Returns:
+            Copy distribution with its pruning error bound
+        """
+        rules = self.rules
+        mass = np.zeros((rules.hard_pity + 1, 2, 1))
+        mass[min(state.pulls_without_6_star, rules.hard_pity), int(featured_obtained), 0] = 1.0
+        offset = 0
+        discarded = 0.0
+        peak = 1
+        banner = state.banner_pulls
+        total = state.total_pulls
+
+        for index, pulls in enumerate(plan):
+            if pulls < 0:
+                raise ValueError(f"Pulls per banner must be non-negative, got {pulls}")
+            if index:
+                banner = 0
+                mass[:, 0, :] += mass[:, 1, :]
+                mass[:, 1, :] = 0.0
+            for _ in range(pulls):
+                banner += 1
+                total += 1
+                mass = self._step(mass, banner == rules.featured_guarantee)
+                if total % rules.bonus_dupe == 0:
+                    offset += 1
+                mass, offset, dropped = self._prune(mass, offset)
+                discarded += dropped
+                peak = max(peak, int(np.count_nonzero(mass)))
+
+        return PlanDistribution(
+            pulls=sum(plan),
+            copies_offset=offset,
+            copies_pmf=mass.sum(axis=(0, 1)),
+            pity_6_star=mass.sum(axis=(1, 2)),
+            discarded_mass=discarded,
+            peak_states=peak,
+        )
@@ -0,0 +1,77 @@
+"""Vectorized application of pull results to many accounts."""
+
+import numpy as np
+
+from ..entities import PityStateBatch
+from ..value_objects import GameRules
+from .compiled_rules import RARITIES
+
+
+class BulkPullApplier:
+    """
+    Array counterpart of PitySimulator.apply_pull_result.
+
+    A batch of pull events (account row, rarity) is applied in one pass:
+    events are grouped by account with a stable sort, so each account sees
+    its pulls in the order given. After the batch, an account's 6★ pity is
+    the number of its pulls since its last 6★ (or its old pity plus its
+    pull count if it had none), capped at hard pity; 5★ pity works the
+    same way with 5★ or 6★ resetting it.
+    """
+
+    def __init__(self, rules: GameRules):
+        """Initialize with game rules."""
+        self.rules = rules
+
+    @staticmethod
+    def _pulls_since_last(hit: np.ndarray, sorted_rows: np.ndarray, rank: np.ndarray, size: int) -> np.ndarray:
+        """Per account, rank of the last event where ``hit`` is true (-1 if none)."""
+        last = np.full(size, -1, dtype=np.int64)
+        np.maximum.at(last, sorted_rows[hit], rank[hit])
+        return last
+
+    def apply(self, batch: PityStateBatch, rows: np.ndarray, rarities: np.ndarray) -> PityStateBatch:
+        """
+        Apply pull results to a batch of accounts.
+
+        Args:
+            batch: Current account states
+            rows: Account row of each pull, in pull order
+            rarities: Rarity (4, 5 or 6) of each pull
+
+        Returns:
+            New batch with every pull applied
+
+        Raises:
+            ValueError: If a rarity is not 4, 5 or 6
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        rarities = np.asarray(rarities)
+        if rows.shape != rarities.shape:
+            raise ValueError("rows and rarities must have the same shape")
+        size = len(batch)
+        if rows.size and (rows.min() < 0 or rows.max() >= size):
+            raise IndexError(f"Account rows must be between 0 and {size - 1}")
+        invalid = ~np.isin(rarities, RARITIES)
+        if invalid.any():
+            raise ValueError(f"Rarities must be 4, 5 or 6, got {np.unique(rarities[invalid])[:10].tolist()}")
+
+        order = np.argsort(rows, kind="stable")
+        sorted_rows = rows[order]
+        sorted_rarities = rarities[order]
+        counts = np.bincount(sorted_rows, minlength=size)
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        rank = np.arange(rows.size) - starts[sorted_rows]
+
+        last_6 = self._pulls_since_last(sorted_rarities == 6, sorted_rows, rank, size)
+        last_5 = self._pulls_since_last(sorted_rarities >= 5, sorted_rows, rank, size)
+
+        p6 = np.where(last_6 >= 0, counts - 1 - last_6, batch.pulls_without_6_star + counts)
+        p5 = np.where(last_5 >= 0, counts - 1 - last_5, batch.pulls_without_5_star + counts)
+        dtype = batch.pulls_without_6_star.dtype
+        return PityStateBatch(
+            pulls_without_6_star=np.minimum(p6, self.rules.hard_pity).astype(dtype),
+            pulls_without_5_star=np.minimum(p5, self.rules.five_star_guarantee).astype(dtype),
+            banner_pulls=(batch.banner_pulls + counts).astype(dtype),
+            total_pulls=(batch.total_pulls + counts).astype(dtype),
+        )
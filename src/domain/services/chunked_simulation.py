@@ -0,0 +1,149 @@
+"""Chunked, bounded-memory simulation domain service."""
+
+from collections.abc import Callable, Iterator
+from typing import Protocol
+
+import numpy as np
+
+from ..entities import PityState
+from ..value_objects import GameRules
+from .event_simulator import EventDrivenSimulator
+from .pity_simulator import RandomGenerator
+from .pull_kernel import PullKernel, KernelState
+
+
+class CancellationToken(Protocol):
+    """Protocol for cooperative cancellation (threading.Event satisfies it)."""
+
+    def is_set(self) -> bool:
+        """Return True once cancellation was requested."""
+        ...
+
+
+class ChunkedSimulation:
+    """
+    Domain service that streams simulation results in fixed-size chunks.
+
+    No request, however large, allocates more than one chunk at a time:
+    the chunk length is derived from a memory cap and the result dtype.
+    Consumers can stream each chunk into writers, sketches or plots, and
+    cancellation is checked between chunks.
+    """
+
+    DEFAULT_MEMORY_CAP = 8 * 1024 * 1024
+
+    def __init__(
+        self,
+        rules: GameRules,
+        random_gen: RandomGenerator,
+        chunk_size: int = 65_536,
+        memory_cap_bytes: int = DEFAULT_MEMORY_CAP,
+    ):
+        """
+        Initialize the chunked simulation.
+
+        Args:
+            rules: Game rules
+            random_gen: Random number generator (injected for testing)
+            chunk_size: Preferred number of results per chunk
+            memory_cap_bytes: Upper bound on the size of one chunk
+        """
+        if chunk_size <= 0 or memory_cap_bytes <= 0:
+            raise ValueError("chunk_size and memory_cap_bytes must be positive")
+        self.rules = rules
+        self.random_gen = random_gen
+        self.chunk_size = chunk_size
+        self.memory_cap_bytes = memory_cap_bytes
+        self.event_simulator = EventDrivenSimulator(rules, random_gen)
+        self.kernel = PullKernel(rules)
+
+    def chunk_length(self, dtype: np.dtype) -> int:
+        """Number of results per chunk for a given dtype under the memory cap."""
+        itemsize = np.dtype(dtype).itemsize
+        return max(1, min(self.chunk_size, self.memory_cap_bytes // itemsize))
+
+    def iter_samples(
+        self,
+        sampler: Callable[[], float],
+        samples: int,
+        dtype: np.dtype = np.float64,
+        cancel: CancellationToken | None = None,
+    ) -> Iterator[np.ndarray]:
+        """
+        Stream independent samples from any sampler.
+
+        Args:
+            sampler: Draws one sample
+            samples: Total number of samples requested
+            dtype: Result dtype
+            cancel: Optional token checked before each chunk
+
+        Yields:
+            Arrays of at most ``chunk_length(dtype)`` samples
+        """
+        length = self.chunk_length(dtype)
+        remaining = samples
+        while remaining > 0:
+            if cancel is not None and cancel.is_set():
+                return
+            n = min(length, remaining)
+            yield np.fromiter((sampler() for _ in range(n)), dtype=dtype, count=n)
+            remaining -= n
+
+    def iter_pulls_to_featured(
+        self,
+        state: PityState,
+        samples: int,
+        featured_obtained: bool = False,
+        cancel: CancellationToken | None = None,
+    ) -> Iterator[np.ndarray]:
+        """
+        Stream samples of the number of pulls until the featured unit.
+
+        Args:
+            state: Starting pity state
+            samples: Total number of samples requested
+            featured_obtained: Whether the featured guarantee was already used
+            cancel: Optional token checked before each chunk
+
+        Yields:
+            uint16 arrays of pulls-to-featured
+        """
+        def sampler() -> int:
+            return self.event_simulator.pulls_to_featured(state, featured_obtained)
+
+        yield from self.iter_samples(sampler, samples, np.uint16, cancel)
+
+    def iter_pull_rarities(
+        self,
+        state: PityState,
+        pulls: int,
+        cancel: CancellationToken | None = None,
+    ) -> Iterator[np.ndarray]:
+        """
+        Stream one long pull sequence as rarity codes (4, 5 or 6).
+
+        The state carries over between chunks, so the concatenation of all
+        chunks is a single continuous sequence of pulls.
+
+        Args:
+            state: Starting pity state
+            pulls: Total number of pulls to simulate
+            cancel: Optional token checked before each chunk
+
+        Yields:
+            uint8 arrays of rarities
+        """
+        current = KernelState.from_pity_state(state)
+        length = self.chunk_length(np.uint8)
+        remaining = pulls
+        while remaining > 0:
+            if cancel is not None and cancel.is_set():
+                return
+            n = min(length, remaining)
+            chunk = np.empty(n, dtype=np.uint8)
+            for i in range(n):
+                current, outcome = self.kernel.step(current, self.random_gen.random(), self.random_gen.random())
+                chunk[i] = outcome.rarity
+            yield chunk
+            remaining -= n
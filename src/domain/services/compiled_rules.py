@@ -0,0 +1,255 @@
+"""Compiled rules artifacts and the process-wide registry."""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import cached_property
+from typing import Optional, Protocol
+
+import numpy as np
+
+from ..value_objects import GameRules
+from .gap_distributions import GapDistributions
+from .rules_sweep import RulesSweep
+
+
+RARITIES = (6, 5, 4)
+
+
+class ArtifactStore(Protocol):
+    """Persistent store of arrays keyed by rules fingerprint (e.g. an on-disk cache)."""
+
+    def get_or_build(self, fingerprint: str, name: str, build: Callable[[], np.ndarray]) -> np.ndarray:
+        """Load an artifact, building and storing it on a miss."""
+        ...
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    """Mark an array read-only so shared artifacts cannot be mutated."""
+    array.setflags(write=False)
+    return array
+
+
+def build_alias_table(weights: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Walker alias tables for a batch of discrete distributions.
+
+    Args:
+        weights: Array of shape (rows, outcomes), each row summing to 1
+
+    Returns:
+        (prob, alias): pick column i = int(u * outcomes); keep i if the
+        fractional part of u * outcomes is below prob[row, i], else take
+        alias[row, i]
+    """
+    rows, outcomes = weights.shape
+    prob = np.ones((rows, outcomes))
+    alias = np.tile(np.arange(outcomes), (rows, 1))
+    for row in range(rows):
+        scaled = list(weights[row] * outcomes)
+        small = [i for i, w in enumerate(scaled) if w < 1.0]
+        large = [i for i, w in enumerate(scaled) if w >= 1.0]
+        while small and large:
+            s, g = small.pop(), large.pop()
+            prob[row, s] = scaled[s]
+            alias[row, s] = g
+            scaled[g] -= 1.0 - scaled[s]
+            (small if scaled[g] < 1.0 else large).append(g)
+    return prob, alias
+
+
+class CompiledRules:
+    """
+    Everything derived from one GameRules set, computed once and shared.
+
+    Cheap tables are built eagerly; heavier artifacts (gap CDFs, the
+    featured DP) are built on first access. All arrays are read-only.
+    With a store, array artifacts are loaded from it (and saved to it on
+    a miss) instead of being recomputed.
+    """
+
+    def __init__(self, rules: GameRules, store: Optional[ArtifactStore] = None):
+        """
+        Compile the eager tables for a rules set.
+
+        Args:
+            rules: Game rules
+            store: Optional persistent artifact store
+        """
+        self.rules = rules
+        self.fingerprint = rules.fingerprint
+        self.store = store
+        self.hazard = _read_only(np.asarray(rules.hazard_table, dtype=float))
+        self.five_star_rate = rules.prob_5_star / (rules.prob_5_star + rules.prob_4_star)
+        self.survival = self.artifact("survival", self._build_survival)
+
+    def artifact(self, name: str, build: Callable[[], np.ndarray]) -> np.ndarray:
+        """Read-only array artifact, served from the store when there is one."""
+        if self.store is None:
+            return _read_only(build())
+        array = self.store.get_or_build(self.fingerprint, name, build)
+        if array.flags.writeable:
+            array = _read_only(array)
+        return array
+
+    def _build_survival(self) -> np.ndarray:
+        """survival[p, k] = P(no 6★ in the next k pulls | pity p)."""
+        states = self.rules.hard_pity + 1
+        padded = np.zeros(2 * states)
+        padded[:states] = 1.0 - self.hazard
+        survival = np.ones((states, states + 1))
+        for pity in range(states):
+            survival[pity, 1:] = np.cumprod(padded[pity:pity + states])
+        return survival
+
+    @cached_property
+    def expected_pulls_to_6_star(self) -> np.ndarray:
+        """Expected pulls until the next 6★, indexed by current pity."""
+        return _read_only(self.survival.sum(axis=1))
+
+    @cached_property
+    def gaps(self) -> GapDistributions:
+        """Conditional gap distributions for event-driven sampling."""
+        return GapDistributions(self.rules)
+
+    @cached_property
+    def featured_cdf(self) -> np.ndarray:
+        """P(featured within n pulls) on a fresh banner at pity 0, n = 0 .. guarantee."""
+        def build() -> np.ndarray:
+            sweep = RulesSweep(self.rules)
+            horizons = range(1, self.rules.featured_guarantee + 1)
+            result = sweep.evaluate(sweep.from_rules([self.rules]), quantiles=(), featured_within=horizons)
+            return np.concatenate([[0.0], result.featured_probability[0]])
+
+        return self.artifact("featured_cdf", build)
+
+    @cached_property
+    def rarity_alias(self) -> tuple[np.ndarray, np.ndarray]:
+        """Alias tables over RARITIES per 6★ pity (5★ not yet guaranteed)."""
+        h = self.hazard
+        weights = np.stack([h, (1 - h) * self.five_star_rate, (1 - h) * (1 - self.five_star_rate)], axis=1)
+        prob, alias = build_alias_table(weights)
+        return _read_only(prob), _read_only(alias)
+
+    def sample_rarity(self, pity_6: int, pity_5: int, u: float) -> int:
+        """
+        Sample the rarity of one pull with a single uniform.
+
+        Args:
+            pity_6: Current pulls without 6★
+            pity_5: Current pulls without 5★
+            u: Uniform random number in [0, 1)
+
+        Returns:
+            6, 5 or 4
+        """
+        prob, alias = self.rarity_alias
+        row = min(pity_6, self.rules.hard_pity)
+        scaled = u * len(RARITIES)
+        column = int(scaled)
+        if scaled - column >= prob[row, column]:
+            column = int(alias[row, column])
+        rarity = RARITIES[column]
+        if rarity == 4 and pity_5 + 1 >= self.rules.five_star_guarantee:
+            return 5
+        return rarity
+
+
+class CompiledRulesRegistry:
+    """
+    Thread-safe LRU map from rules fingerprint to CompiledRules.
+
+    Every cache keyed by rules should go through here so that equal rules
+    (even if constructed separately) share one compiled artifact.
+    """
+
+    def __init__(self, max_size: int = 32, store: Optional[ArtifactStore] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            max_size: Number of compiled rule sets kept before evicting the
+                least recently used one
+            store: Optional persistent store handed to every compiled set
+        """
+        if max_size < 1:
+            raise ValueError(f"max_size must be positive, got {max_size}")
+        self.max_size = max_size
+        self._store = store
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, CompiledRules] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def store(self) -> Optional[ArtifactStore]:
+        """Persistent store handed to every compiled set (fixed at construction)."""
+        return self._store
+
+    def get(self, rules: GameRules) -> CompiledRules:
+        """Return the compiled artifact for a rules set, compiling on a miss."""
+        key = rules.fingerprint
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return compiled
+            self.misses += 1
+
+        # Compile outside the lock; a concurrent miss may race, first one wins
+        compiled = CompiledRules(rules, self._store)
+        with self._lock:
+            compiled = self._entries.setdefault(key, compiled)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return compiled
+
+    def __contains__(self, rules: GameRules) -> bool:
+        with self._lock:
+            return rules.fingerprint in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop all compiled artifacts and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_registry = CompiledRulesRegistry()
+
+
+def get_registry() -> CompiledRulesRegistry:
+    """The process-wide registry."""
+    return _registry
+
+
+def configure_registry(store: Optional[ArtifactStore] = None, max_size: int = 32) -> CompiledRulesRegistry:
+    """
+    Replace the process-wide registry with a new one.
+
+    Call once at startup, before rules are compiled: the previous
+    registry's compiled sets are dropped, so every rules set compiled
+    afterwards uses ``store``.
+
+    Args:
+        store: Persistent store handed to every compiled set
+        max_size: Number of compiled rule sets kept
+
+    Returns:
+        The new process-wide registry
+    """
+    global _registry
+    _registry = CompiledRulesRegistry(max_size, store)
+    return _registry
+
+
+def compile_rules(rules: GameRules) -> CompiledRules:
+    """Compiled artifact for a rules set from the process-wide registry."""
+    return _registry.get(rules)
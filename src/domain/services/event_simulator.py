@@ -0,0 +1,184 @@
+"""Event-driven pity simulation domain service."""
+
+from collections.abc import Iterator
+
+from ..entities import PityState, PullEvent, EventType, PullResult, CharacterType
+from ..value_objects import GameRules
+from .counter_calculator import CounterCalculator
+from .compiled_rules import compile_rules
+from .pity_simulator import PitySimulator, RandomGenerator
+
+
+class EventDrivenSimulator:
+    """
+    Domain service that jumps from event to event instead of pull by pull.
+
+    The gap to the next 6★ and to the next 5★ is sampled from precomputed
+    conditional distributions; milestone distances (free 10-pull, featured
+    guarantee, bonus dupe) are deterministic. The state is then advanced by
+    the smallest gap in a single step, so uneventful 4★ pulls cost nothing.
+    """
+
+    def __init__(self, rules: GameRules, random_gen: RandomGenerator):
+        """
+        Initialize simulator.
+
+        Args:
+            rules: Game rules
+            random_gen: Random number generator (injected for testing)
+        """
+        self.rules = rules
+        self.random_gen = random_gen
+        self.gaps = compile_rules(rules).gaps
+        self.counter_calc = CounterCalculator(rules)
+        self.pull_simulator = PitySimulator(rules, random_gen)
+
+    def iter_events(self, state: PityState, featured_obtained: bool = False) -> Iterator[PullEvent]:
+        """
+        Yield events indefinitely, starting from the given state.
+
+        Args:
+            state: Starting pity state
+            featured_obtained: Whether the featured unit was already obtained
+                on the current banner (disables the featured guarantee)
+
+        Yields:
+            Events in pull order; milestones reached on the same pull as a
+            6★/5★ are yielded after it
+        """
+        rules = self.rules
+        pity_6, pity_5 = state.pulls_without_6_star, state.pulls_without_5_star
+        banner, total = state.banner_pulls, state.total_pulls
+        offset = 0
+        gap_6: int | None = None
+        gap_5: int | None = None
+
+        while True:
+            if gap_6 is None:
+                gap_6 = self.gaps.sample_six_star_gap(pity_6, self.random_gen.random())
+            if gap_5 is None:
+                gap_5 = self.gaps.sample_five_star_gap(pity_5, self.random_gen.random())
+
+            to_free = self.counter_calc.calculate_pulls_to_free_pull(banner) or None
+            to_spark = None
+            if not featured_obtained:
+                to_spark = self.counter_calc.calculate_pulls_to_featured(banner) or None
+            to_dupe = self.counter_calc.calculate_pulls_to_bonus_dupe(total % rules.bonus_dupe)
+
+            step = min(d for d in (gap_6, gap_5, to_free, to_spark, to_dupe) if d is not None)
+            offset += step
+            banner += step
+            total += step
+
+            result: PullResult | None = None
+            event_type: EventType | None = None
+            if step == to_spark:
+                result = PullResult(rarity=6, character_type=CharacterType.FEATURED)
+                event_type = EventType.FEATURED_GUARANTEE
+            elif step == gap_6:
+                won = self.random_gen.random() < rules.prob_50_50
+                result = self.pull_simulator.simulate_50_50(won)
+                event_type = EventType.SIX_STAR
+            elif step == gap_5:
+                result = PullResult(rarity=5, character_type=CharacterType.FIVE_STAR)
+                event_type = EventType.FIVE_STAR
+
+            if result is not None and result.is_six_star():
+                pity_6, pity_5 = 0, 0
+                gap_6, gap_5 = None, None
+                featured_obtained = featured_obtained or result.is_featured()
+            else:
+                pity_6 = int(self.counter_calc.calculate_pity_counter(pity_6 + step))
+                gap_6 -= step
+                if result is not None:
+                    pity_5, gap_5 = 0, None
+                else:
+                    pity_5 = min(pity_5 + step, rules.five_star_guarantee)
+                    gap_5 -= step
+
+            new_state = PityState(
+                pulls_without_6_star=pity_6,
+                pulls_without_5_star=pity_5,
+                banner_pulls=banner,
+                total_pulls=total,
+            )
+            if event_type is not None:
+                yield PullEvent(pull_offset=offset, event_type=event_type, result=result, state=new_state)
+            if step == to_free:
+                yield PullEvent(pull_offset=offset, event_type=EventType.FREE_PULL_REWARD, state=new_state)
+            if step == to_dupe:
+                yield PullEvent(pull_offset=offset, event_type=EventType.BONUS_DUPE, state=new_state)
+
+    def simulate(
+        self,
+        state: PityState,
+        num_pulls: int,
+        featured_obtained: bool = False,
+    ) -> tuple[list[PullEvent], PityState]:
+        """
+        Simulate a fixed number of pulls.
+
+        Args:
+            state: Starting pity state
+            num_pulls: Number of pulls to simulate
+            featured_obtained: Whether the featured unit was already obtained
+
+        Returns:
+            Events that happened within the pulls, and the final state
+        """
+        events = []
+        final_state = state
+        if num_pulls <= 0:
+            return events, final_state
+
+        for event in self.iter_events(state, featured_obtained):
+            if event.pull_offset > num_pulls:
+                # Remaining pulls up to the horizon were all uneventful
+                remaining = num_pulls - (events[-1].pull_offset if events else 0)
+                final_state = self._advance_uneventful(final_state, remaining)
+                break
+            events.append(event)
+            final_state = event.state
+
+        return events, final_state
+
+    def _advance_uneventful(self, state: PityState, pulls: int) -> PityState:
+        """Advance all counters by a run of 4★ pulls in one step."""
+        return PityState(
+            pulls_without_6_star=int(self.counter_calc.calculate_pity_counter(state.pulls_without_6_star + pulls)),
+            pulls_without_5_star=min(state.pulls_without_5_star + pulls, self.rules.five_star_guarantee),
+            banner_pulls=state.banner_pulls + pulls,
+            total_pulls=state.total_pulls + pulls,
+        )
+
+    def pulls_to_featured(self, state: PityState, featured_obtained: bool = False) -> int:
+        """
+        Sample the number of pulls until the next featured 6★.
+
+        Only 6★ gaps and the featured guarantee matter here, so 5★ and
+        milestone events are skipped entirely.
+
+        Args:
+            state: Starting pity state
+            featured_obtained: Whether the featured guarantee was already used
+
+        Returns:
+            Number of pulls until the featured unit is obtained
+        """
+        rules = self.rules
+        pity_6 = state.pulls_without_6_star
+        banner = state.banner_pulls
+        spark_available = not featured_obtained
+        pulls = 0
+
+        while True:
+            gap = self.gaps.sample_six_star_gap(pity_6, self.random_gen.random())
+            if spark_available:
+                to_spark = self.counter_calc.calculate_pulls_to_featured(banner)
+                if 0 < to_spark <= gap:
+                    return pulls + to_spark
+            pulls += gap
+            banner += gap
+            pity_6 = 0
+            if self.random_gen.random() < rules.prob_50_50:
+                return pulls
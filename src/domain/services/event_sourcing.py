@@ -0,0 +1,127 @@
+"""Event-sourced account history domain service."""
+
+from array import array
+from bisect import bisect_right
+from datetime import datetime
+from enum import IntEnum
+
+from ..entities import PityState, PullResult
+from ..value_objects import GameRules
+from .pull_kernel import KernelState, PullKernel
+from .timestamps import posix_timestamp
+
+
+class HistoryEventKind(IntEnum):
+    """Kind of an event in an account history."""
+    PULL = 0
+    BANNER_CHANGE = 1
+
+
+class AccountEventLog:
+    """
+    Append-only log of pulls and banner changes with periodic snapshots.
+
+    The PityState at any point is derived by replaying events through the
+    pull kernel. Every ``snapshot_interval`` events the derived state is
+    stored, so rebuilding any point replays at most one interval from the
+    nearest snapshot. Timestamps are non-decreasing, which makes a date
+    lookup a binary search: "state at date X" is O(log n + interval).
+
+    Events are stored column-wise in compact arrays (8 bytes of timestamp
+    plus 3 bytes per event).
+    """
+
+    def __init__(
+        self,
+        rules: GameRules,
+        initial: PityState | None = None,
+        featured_obtained: bool = False,
+        snapshot_interval: int = 256,
+    ):
+        """
+        Initialize an empty log.
+
+        Args:
+            rules: Game rules
+            initial: State before the first event (default: initial state)
+            featured_obtained: Whether the featured unit was already obtained
+                on the banner that is current before the first event
+            snapshot_interval: Events between snapshots
+        """
+        if snapshot_interval < 1:
+            raise ValueError(f"snapshot_interval must be positive, got {snapshot_interval}")
+        self.kernel = PullKernel(rules)
+        self.snapshot_interval = snapshot_interval
+        self._timestamps = array("d")
+        self._kinds = array("B")
+        self._rarities = array("B")
+        self._featured = array("B")
+        start = KernelState.from_pity_state(initial or PityState.initial(), featured_obtained)
+        self._snapshots: list[KernelState] = [start]
+        self._head = start
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def _append(self, when: datetime, kind: HistoryEventKind, rarity: int, featured: bool) -> None:
+        timestamp = posix_timestamp(when)
+        if self._timestamps and timestamp < self._timestamps[-1]:
+            raise ValueError("Events must be recorded in chronological order")
+        self._timestamps.append(timestamp)
+        self._kinds.append(kind)
+        self._rarities.append(rarity)
+        self._featured.append(featured)
+        self._head = self._apply(self._head, kind, rarity, featured)
+        if len(self) % self.snapshot_interval == 0:
+            self._snapshots.append(self._head)
+
+    def _apply(self, state: KernelState, kind: int, rarity: int, featured: bool) -> KernelState:
+        if kind == HistoryEventKind.BANNER_CHANGE:
+            return self.kernel.new_banner(state)
+        return self.kernel.apply(state, rarity, featured)
+
+    def record_pull(self, when: datetime, result: PullResult) -> None:
+        """Append a pull."""
+        self._append(when, HistoryEventKind.PULL, result.rarity, result.is_featured())
+
+    def record_banner_change(self, when: datetime) -> None:
+        """Append the start of a new banner."""
+        self._append(when, HistoryEventKind.BANNER_CHANGE, 0, False)
+
+    def kernel_state_after(self, events: int) -> KernelState:
+        """
+        Derived state after the first ``events`` events.
+
+        Replays at most ``snapshot_interval - 1`` events from a snapshot.
+        """
+        if not 0 <= events <= len(self):
+            raise IndexError(f"events must be between 0 and {len(self)}, got {events}")
+        if events == len(self):
+            return self._head
+        snapshot = events // self.snapshot_interval
+        state = self._snapshots[snapshot]
+        for i in range(snapshot * self.snapshot_interval, events):
+            state = self._apply(state, self._kinds[i], self._rarities[i], self._featured[i])
+        return state
+
+    def state_after(self, events: int) -> PityState:
+        """PityState after the first ``events`` events."""
+        return self.kernel_state_after(events).to_pity_state()
+
+    def events_until(self, when: datetime) -> int:
+        """Number of events recorded at or before ``when`` (binary search)."""
+        return bisect_right(self._timestamps, posix_timestamp(when))
+
+    def state_at(self, when: datetime) -> PityState:
+        """PityState including every event recorded at or before ``when``."""
+        return self.state_after(self.events_until(when))
+
+    @property
+    def current_state(self) -> PityState:
+        """PityState after every recorded event."""
+        return self._head.to_pity_state()
+
+    @property
+    def featured_obtained(self) -> bool:
+        """Whether the featured unit was obtained on the current banner."""
+        return self._head.featured_obtained
@@ -0,0 +1,85 @@
+"""Conditional gap distributions domain service."""
+
+from bisect import bisect_right
+from itertools import accumulate
+
+from ..value_objects import GameRules
+
+
+class GapDistributions:
+    """
+    Precomputed distributions of the number of pulls until the next 6★/5★.
+
+    Tables are built once per rules set and indexed by the current counter,
+    so a gap can be sampled by inverse transform with a single uniform.
+    """
+
+    def __init__(self, rules: GameRules):
+        """Build all conditional tables from the game rules."""
+        self.rules = rules
+        self.hazard = list(rules.hazard_table)
+        self.six_star_cdf = [self._build_six_star_cdf(p) for p in range(rules.hard_pity + 1)]
+        self.five_star_cdf = [
+            self._build_five_star_cdf(p) for p in range(rules.five_star_guarantee + 1)
+        ]
+
+    @property
+    def five_star_rate(self) -> float:
+        """Probability that a pull which is not a 6★ is a 5★."""
+        return self.rules.prob_5_star / (self.rules.prob_5_star + self.rules.prob_4_star)
+
+    def _build_six_star_cdf(self, pity: int) -> list[float]:
+        """CDF of the gap to the next 6★ (entry k-1 is P(gap <= k))."""
+        pmf = []
+        survival = 1.0
+        for t in range(pity, self.rules.hard_pity + 1):
+            pmf.append(survival * self.hazard[t])
+            survival *= 1.0 - self.hazard[t]
+            if survival <= 0.0:
+                break
+        cdf = list(accumulate(pmf))
+        cdf[-1] = 1.0
+        return cdf
+
+    def _build_five_star_cdf(self, pity: int) -> list[float]:
+        """CDF of the gap to the next 5★ counting only non-6★ pulls."""
+        q = self.five_star_rate
+        max_gap = max(1, self.rules.five_star_guarantee - pity)
+        pmf = [q * (1.0 - q) ** (k - 1) for k in range(1, max_gap)]
+        pmf.append(1.0 - sum(pmf))
+        cdf = list(accumulate(pmf))
+        cdf[-1] = 1.0
+        return cdf
+
+    def six_star_gap_pmf(self, pity: int) -> list[float]:
+        """Probability that the next 6★ lands exactly k pulls ahead (index k-1)."""
+        cdf = self.six_star_cdf[min(pity, self.rules.hard_pity)]
+        return [b - a for a, b in zip([0.0] + cdf[:-1], cdf)]
+
+    def sample_six_star_gap(self, pity: int, u: float) -> int:
+        """
+        Sample the number of pulls until the next 6★.
+
+        Args:
+            pity: Current pulls without 6★
+            u: Uniform random number in [0, 1)
+
+        Returns:
+            Gap in pulls (1 means the very next pull)
+        """
+        cdf = self.six_star_cdf[min(pity, self.rules.hard_pity)]
+        return min(bisect_right(cdf, u), len(cdf) - 1) + 1
+
+    def sample_five_star_gap(self, pity: int, u: float) -> int:
+        """
+        Sample the number of non-6★ pulls until the next 5★.
+
+        Args:
+            pity: Current pulls without 5★
+            u: Uniform random number in [0, 1)
+
+        Returns:
+            Gap in pulls (1 means the very next pull)
+        """
+        cdf = self.five_star_cdf[min(pity, self.rules.five_star_guarantee)]
+        return min(bisect_right(cdf, u), len(cdf) - 1) + 1
@@ -0,0 +1,176 @@
+"""Fenwick-tree indexed pull history domain service."""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+
+from ..entities import PullResult
+from .timestamps import posix_timestamp
+
+
+class FenwickTree:
+    """
+    Binary indexed tree over rows of several integer columns.
+
+    Node i (1-based) holds the column sums of rows (i - lowbit(i), i], so
+    a prefix sum touches O(log n) nodes and one NumPy gather adds them
+    for every column at once. The tree is built from the rows in O(n)
+    (vectorized from a cumulative sum) and supports O(log n) appends.
+    """
+
+    def __init__(self, rows: np.ndarray):
+        """
+        Build the tree.
+
+        Args:
+            rows: Array of shape (n, columns)
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        size, columns = rows.shape
+        self._size = size
+        self._tree = np.zeros((max(size, 16) + 1, columns), dtype=np.int64)
+        if size:
+            prefix = np.zeros((size + 1, columns), dtype=np.int64)
+            np.cumsum(rows, axis=0, out=prefix[1:])
+            nodes = np.arange(1, size + 1)
+            self._tree[1:size + 1] = prefix[nodes] - prefix[nodes - (nodes & -nodes)]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def prefix(self, end: int) -> np.ndarray:
+        """Column sums of rows [0, end)."""
+        nodes = []
+        while end > 0:
+            nodes.append(end)
+            end -= end & -end
+        return self._tree[nodes].sum(axis=0)
+
+    def range_sum(self, start: int, end: int) -> np.ndarray:
+        """Column sums of rows [start, end)."""
+        return self.prefix(end) - self.prefix(start)
+
+    def add(self, index: int, delta: np.ndarray) -> None:
+        """Add ``delta`` to row ``index``."""
+        node = index + 1
+        while node <= self._size:
+            self._tree[node] += delta
+            node += node & -node
+
+    def append(self, row: np.ndarray) -> None:
+        """Add a new last row."""
+        node = self._size + 1
+        if node >= len(self._tree):
+            grown = np.zeros((2 * len(self._tree) - 1, self._tree.shape[1]), dtype=np.int64)
+            grown[:len(self._tree)] = self._tree
+            self._tree = grown
+        low = node & -node
+        self._tree[node] = np.asarray(row, dtype=np.int64) + self.prefix(node - 1) - self.prefix(node - low)
+        self._size = node
+
+
+@dataclass(frozen=True)
+class HistoryCounts:
+    """Counts over a range of a pull history."""
+    pulls: int
+    six_stars: int
+    five_stars: int
+    featured: int
+    won_50_50: int
+    lost_50_50: int
+
+    @property
+    def six_star_rate(self) -> float:
+        """Observed 6★ rate (0 for an empty range)."""
+        return self.six_stars / self.pulls if self.pulls else 0.0
+
+    @property
+    def win_rate_50_50(self) -> float:
+        """Share of decided 50/50s that were won (0 if none)."""
+        decided = self.won_50_50 + self.lost_50_50
+        return self.won_50_50 / decided if decided else 0.0
+
+
+class PullHistoryIndex:
+    """
+    Range analytics over an imported pull history in O(log n) per query.
+
+    Each pull contributes one row of indicator columns (6★, 5★, featured,
+    won 50/50, lost 50/50) to a Fenwick tree. Counts between pull i and j
+    are two prefix queries; counts between two dates first map the dates
+    to pull indices by binary search over the (chronological) timestamps.
+    """
+
+    COLUMNS = ("six_stars", "five_stars", "featured", "won_50_50", "lost_50_50")
+
+    def __init__(self, results: Iterable[PullResult] = (), timestamps: Optional[Iterable[datetime]] = None):
+        """
+        Index a history.
+
+        Args:
+            results: Pull results in pull order
+            timestamps: Time of each pull (needed for date queries)
+        """
+        rows = [self._row(result) for result in results]
+        self._tree = FenwickTree(np.array(rows, dtype=np.int64).reshape(-1, len(self.COLUMNS)))
+        self._timestamps: Optional[array] = None
+        if timestamps is not None:
+            self._timestamps = array("d", (posix_timestamp(t) for t in timestamps))
+            if len(self._timestamps) != len(self._tree):
+                raise ValueError("Need one timestamp per pull")
+            if any(a > b for a, b in zip(self._timestamps, self._timestamps[1:])):
+                raise ValueError("Timestamps must be chronological")
+
+    @staticmethod
+    def _row(result: PullResult) -> tuple[int, int, int, int, int]:
+        return (
+            result.is_six_star(),
+            result.is_five_star(),
+            result.is_featured(),
+            result.won_50_50 is True,
+            result.won_50_50 is False,
+        )
+
+    def __len__(self) -> int:
+        return len(self._tree)
+
+    def append(self, result: PullResult, when: Optional[datetime] = None) -> None:
+        """Index one more pull in O(log n)."""
+        if self._timestamps is not None:
+            if when is None:
+                raise ValueError("This history is timestamped; pass the pull time")
+            timestamp = posix_timestamp(when)
+            if self._timestamps and timestamp < self._timestamps[-1]:
+                raise ValueError("Timestamps must be chronological")
+            self._timestamps.append(timestamp)
+        self._tree.append(np.array(self._row(result)))
+
+    def counts(self, start: int = 0, end: Optional[int] = None) -> HistoryCounts:
+        """
+        Counts over pulls [start, end).
+
+        Args:
+            start: First pull index (0-based)
+            end: One past the last pull index (default: end of history)
+        """
+        end = len(self) if end is None else end
+        if not 0 <= start <= end <= len(self):
+            raise IndexError(f"Invalid pull range [{start}, {end}) for {len(self)} pulls")
+        sums = self._tree.range_sum(start, end)
+        return HistoryCounts(end - start, *(int(v) for v in sums))
+
+    def pull_range(self, since: datetime, until: datetime) -> tuple[int, int]:
+        """Pull indices [start, end) of the pulls made between two dates (inclusive)."""
+        if self._timestamps is None:
+            raise ValueError("This history has no timestamps")
+        return bisect_left(self._timestamps, posix_timestamp(since)), bisect_right(self._timestamps, posix_timestamp(until))
+
+    def counts_between(self, since: datetime, until: datetime) -> HistoryCounts:
+        """Counts over the pulls made between two dates (inclusive)."""
+        start, end = self.pull_range(since, until)
+        return self.counts(start, max(start, end))
@@ -0,0 +1,240 @@
+"""Luck percentile scoring of pull histories."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import numpy as np
+
+from ..entities import PullResult
+from ..value_objects import GameRules
+from .compiled_rules import compile_rules
+
+
+def _normal_cdf(z: float) -> float:
+    return 0.5 * (1.0 + math.erf(z / math.sqrt(2.0)))
+
+
+def _binomial_mid_cdf(successes: int, trials: int, p: float) -> float:
+    """P(X < successes) + P(X = successes) / 2 for X ~ Binomial(trials, p)."""
+    if trials == 0:
+        return 0.5
+    if p <= 0.0 or p >= 1.0:
+        return 0.5
+    log_p, log_q = math.log(p), math.log1p(-p)
+    below = 0.0
+    for k in range(successes):
+        below += math.exp(
+            math.lgamma(trials + 1) - math.lgamma(k + 1) - math.lgamma(trials - k + 1) + k * log_p + (trials - k) * log_q
+        )
+    at = math.exp(
+        math.lgamma(trials + 1) - math.lgamma(successes + 1) - math.lgamma(trials - successes + 1)
+        + successes * log_p + (trials - successes) * log_q
+    )
+    return min(1.0, below + 0.5 * at)
+
+
+@dataclass(frozen=True)
+class LuckReport:
+    """
+    Luck of a pull history scored against the exact distributions.
+
+    Percentiles are on a 0-100 scale. A cycle percentile ranks the cycle
+    length (low = short = lucky); the 50/50 and overall luck percentiles
+    are oriented so that high means luckier than most players.
+    """
+    pulls: int
+    six_stars: int
+    observed_rate: float
+    expected_rate: float
+    cycle_lengths: tuple[int, ...]
+    cycle_percentiles: tuple[float, ...]
+    won_50_50: int
+    lost_50_50: int
+    percentile_50_50: float
+    guaranteed: int
+    open_cycle_pulls: int
+    luck_percentile: float
+
+    @property
+    def mean_cycle_percentile(self) -> float:
+        """Mean percentile of the scored cycles (50 if there are none)."""
+        if not self.cycle_percentiles:
+            return 50.0
+        return sum(self.cycle_percentiles) / len(self.cycle_percentiles)
+
+
+class LuckScorer:
+    """
+    Scores histories against the cycle-length distribution of the rules.
+
+    A pity cycle starting at pity p that ends on a 6★ after k pulls has
+    luck P(L > k) + P(L = k) / 2 (its mid-distribution rank from the lucky
+    side). With S = survival[p] that is (S[k - 1] + S[k]) / 2, so the full
+    luck table is precomputed per rules set and each cycle is an O(1)
+    lookup. Under the rules, luck values have mean 1/2 and a known
+    variance per start pity; each decided 50/50 contributes its mid-rank
+    in the same way. The overall luck percentile combines everything with a
+    Stouffer z-score, so histories are scored in one streaming pass.
+
+    A 6★ without a 50/50 (the featured guarantee) ends a cycle that was
+    forced rather than drawn from the hazard, so it is counted but not
+    scored; the trailing open cycle is reported, not scored.
+    """
+
+    def __init__(self, rules: GameRules):
+        """Initialize with game rules."""
+        self.rules = rules
+        self.compiled = compile_rules(rules)
+        survival = self.compiled.survival
+        self.cycle_luck = self.compiled.artifact("cycle_luck", self._build_cycle_luck)
+        pmf = survival[:, :-1] - survival[:, 1:]
+        self.cycle_variance = (1.0 - (pmf ** 3).sum(axis=1)) / 12.0
+        self.expected_rate = 1.0 / float(self.compiled.expected_pulls_to_6_star[0])
+
+    def _build_cycle_luck(self) -> np.ndarray:
+        """cycle_luck[p, k] = P(L > k) + P(L = k) / 2 for a cycle from pity p (k >= 1)."""
+        survival = self.compiled.survival
+        luck = np.full(survival.shape, np.nan)
+        possible = survival[:, :-1] - survival[:, 1:] > 0.0
+        luck[:, 1:] = np.where(possible, 0.5 * (survival[:, :-1] + survival[:, 1:]), np.nan)
+        return luck
+
+    def cycle_luck_of(self, length: int, start_pity: int = 0) -> float:
+        """
+        Luck value (0-1, high = lucky) of a cycle that ended on a 6★.
+
+        Args:
+            length: Pulls in the cycle, including the 6★
+            start_pity: 6★ pity when the cycle started
+
+        Raises:
+            ValueError: If the rules make this cycle impossible
+        """
+        if not 0 <= start_pity < self.cycle_luck.shape[0] or not 0 < length < self.cycle_luck.shape[1]:
+            raise ValueError(f"Impossible cycle: {length} pulls from pity {start_pity}")
+        luck = self.cycle_luck[start_pity, length]
+        if math.isnan(luck):
+            raise ValueError(f"Impossible cycle: {length} pulls from pity {start_pity}")
+        return float(luck)
+
+    def cycle_percentile(self, length: int, start_pity: int = 0) -> float:
+        """Percentile (0-100) of a cycle length among all cycles from ``start_pity``."""
+        return 100.0 * (1.0 - self.cycle_luck_of(length, start_pity))
+
+    def accumulator(self, initial_pity: int = 0, keep_cycles: bool = True) -> LuckAccumulator:
+        """Start a streaming score for a history beginning at ``initial_pity``."""
+        return LuckAccumulator(self, initial_pity, keep_cycles)
+
+    def score(self, results: Iterable[PullResult], initial_pity: int = 0) -> LuckReport:
+        """Score a whole history in one pass."""
+        accumulator = self.accumulator(initial_pity)
+        accumulator.add_many(results)
+        return accumulator.report()
+
+
+class LuckAccumulator:
+    """
+    Streaming, mergeable state of a luck score.
+
+    Keeps a handful of counters (and optionally the per-cycle lengths and
+    percentiles), never the pulls themselves. Accumulators of different
+    accounts can be merged into a population score.
+    """
+
+    def __init__(self, scorer: LuckScorer, initial_pity: int = 0, keep_cycles: bool = True):
+        """
+        Initialize an empty score.
+
+        Args:
+            scorer: Scorer holding the precomputed tables
+            initial_pity: 6★ pity before the first pull
+            keep_cycles: Whether to keep each cycle's length and percentile
+        """
+        self.scorer = scorer
+        self.keep_cycles = keep_cycles
+        self.pulls = 0
+        self.six_stars = 0
+        self.won_50_50 = 0
+        self.lost_50_50 = 0
+        self.guaranteed = 0
+        self.luck_excess = 0.0
+        self.luck_variance = 0.0
+        self.cycle_lengths = array("i")
+        self.cycle_percentiles = array("d")
+        self._cycle_start = initial_pity
+        self._cycle_pulls = 0
+
+    def add(self, result: PullResult) -> None:
+        """Score one more pull."""
+        self.pulls += 1
+        self._cycle_pulls += 1
+        if not result.is_six_star():
+            return
+        self.six_stars += 1
+        if result.won_50_50 is None:
+            self.guaranteed += 1
+        else:
+            luck = self.scorer.cycle_luck_of(self._cycle_pulls, self._cycle_start)
+            self.luck_excess += luck - 0.5
+            self.luck_variance += self.scorer.cycle_variance[self._cycle_start]
+            if self.keep_cycles:
+                self.cycle_lengths.append(self._cycle_pulls)
+                self.cycle_percentiles.append(100.0 * (1.0 - luck))
+            if result.won_50_50:
+                self.won_50_50 += 1
+            else:
+                self.lost_50_50 += 1
+        self._cycle_start = 0
+        self._cycle_pulls = 0
+
+    def add_many(self, results: Iterable[PullResult]) -> None:
+        """Score every pull from an iterable."""
+        for result in results:
+            self.add(result)
+
+    def merge(self, other: LuckAccumulator) -> LuckAccumulator:
+        """
+        Merge another account's score into this one (in place) and return self.
+
+        Open cycles are summed into ``open_cycle_pulls``; keep adding pulls
+        to the per-account accumulators, not to the merged one.
+        """
+        self.pulls += other.pulls
+        self.six_stars += other.six_stars
+        self.won_50_50 += other.won_50_50
+        self.lost_50_50 += other.lost_50_50
+        self.guaranteed += other.guaranteed
+        self.luck_excess += other.luck_excess
+        self.luck_variance += other.luck_variance
+        self._cycle_pulls += other._cycle_pulls
+        if self.keep_cycles:
+            self.cycle_lengths.extend(other.cycle_lengths)
+            self.cycle_percentiles.extend(other.cycle_percentiles)
+        return self
+
+    def report(self) -> LuckReport:
+        """Current score."""
+        p = self.scorer.rules.prob_50_50
+        decided = self.won_50_50 + self.lost_50_50
+        # A won 50/50 has mid-rank P(loss) + P(win) / 2, a lost one P(loss) / 2.
+        excess = self.luck_excess + self.won_50_50 * (1 - p) / 2 - self.lost_50_50 * p / 2
+        variance = self.luck_variance + decided * p * (1 - p) / 4
+        luck = _normal_cdf(excess / math.sqrt(variance)) if variance > 0 else 0.5
+        return LuckReport(
+            pulls=self.pulls,
+            six_stars=self.six_stars,
+            observed_rate=self.six_stars / self.pulls if self.pulls else 0.0,
+            expected_rate=self.scorer.expected_rate,
+            cycle_lengths=tuple(self.cycle_lengths),
+            cycle_percentiles=tuple(self.cycle_percentiles),
+            won_50_50=self.won_50_50,
+            lost_50_50=self.lost_50_50,
+            percentile_50_50=100.0 * _binomial_mid_cdf(self.won_50_50, decided, p),
+            guaranteed=self.guaranteed,
+            open_cycle_pulls=self._cycle_pulls,
+            luck_percentile=100.0 * luck,
+        )
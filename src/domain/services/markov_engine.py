@@ -0,0 +1,240 @@
+"""Exact Markov transition engine over the pity state space."""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+
+from ..entities import PityState
+from ..value_objects import GameRules
+from .compiled_rules import compile_rules
+
+
+@dataclass(frozen=True)
+class SparseTransitions:
+    """Sparse (COO) transition matrix: mass moves from ``rows`` to ``cols``."""
+    rows: np.ndarray
+    cols: np.ndarray
+    values: np.ndarray
+    size: int
+
+    def propagate(self, vector: np.ndarray) -> np.ndarray:
+        """Advance a probability vector by one pull (row vector times matrix)."""
+        return np.bincount(self.cols, weights=vector[self.rows] * self.values, minlength=self.size)
+
+    def to_dense(self) -> np.ndarray:
+        """Materialize as a dense matrix."""
+        dense = np.zeros((self.size, self.size))
+        np.add.at(dense, (self.rows, self.cols), self.values)
+        return dense
+
+
+@dataclass(frozen=True)
+class StateDistribution:
+    """
+    Exact joint distribution of the pity state after N pulls.
+
+    ``probabilities`` has shape (pity_6 + 1, pity_5 + 1, 2), the last axis
+    being whether the featured unit has been obtained on the banner. The
+    spark and dupe positions are deterministic given N and stored as-is.
+    """
+    pulls: int
+    probabilities: np.ndarray
+    spark_position: int
+    dupe_position: int
+    bonus_dupes: int
+
+    def pity_6_star_marginal(self) -> np.ndarray:
+        """P(pulls_without_6_star = k) for every k."""
+        return self.probabilities.sum(axis=(1, 2))
+
+    def pity_5_star_marginal(self) -> np.ndarray:
+        """P(pulls_without_5_star = k) for every k."""
+        return self.probabilities.sum(axis=(0, 2))
+
+    def featured_probability(self) -> float:
+        """Probability that the featured unit has been obtained on this banner."""
+        return float(self.probabilities[:, :, 1].sum())
+
+
+class MarkovTransitionEngine:
+    """
+    Domain service computing exact N-step state distributions.
+
+    The stochastic part of the state, (pulls_without_6_star,
+    pulls_without_5_star, featured obtained), evolves under a sparse
+    one-pull transition matrix built from the game rules. The spark and
+    dupe counters advance deterministically, so the only inhomogeneity is
+    the single featured-guarantee pull, which splits the horizon into two
+    homogeneous segments. Long segments use exponentiation by squaring
+    (only the current dense power A^(2^k) is held, so memory stays at a
+    couple of matrices whatever the horizon); short ones are stepped
+    through with sparse vector products.
+
+    The distribution reached by each query (the DP frontier) is kept per
+    starting state, so asking for N + k pulls after N only advances k
+    more pulls.
+    """
+
+    def __init__(self, rules: GameRules, step_threshold: int = 2_048, max_frontiers: int = 64):
+        """
+        Build the transition matrices.
+
+        Args:
+            rules: Game rules
+            step_threshold: Horizons up to this length are stepped sparsely
+            max_frontiers: Starting states whose frontier is kept (LRU)
+        """
+        self.rules = rules
+        self.step_threshold = step_threshold
+        self.max_frontiers = max_frontiers
+        self._frontiers: OrderedDict[tuple[int, int, int, bool], tuple[int, np.ndarray]] = OrderedDict()
+        self.pity_6_states = rules.hard_pity + 1
+        self.pity_5_states = rules.five_star_guarantee + 1
+        self.shape = (self.pity_6_states, self.pity_5_states, 2)
+        self.size = int(np.prod(self.shape))
+        self.transitions = self._build_regular()
+        self.guarantee_transitions = self._build_guarantee()
+
+    def index(self, pity_6: int, pity_5: int, featured_obtained: bool) -> int:
+        """Flat index of a state."""
+        return int(np.ravel_multi_index((pity_6, pity_5, int(featured_obtained)), self.shape))
+
+    def _build_regular(self) -> SparseTransitions:
+        """One ordinary pull."""
+        rules = self.rules
+        compiled = compile_rules(rules)
+        hazard = compiled.hazard
+        p6, p5, f = (a.ravel() for a in np.indices(self.shape))
+        src = np.arange(self.size)
+        h = hazard[p6]
+        next_p6 = np.minimum(p6 + 1, rules.hard_pity)
+        guaranteed_5 = p5 + 1 >= rules.five_star_guarantee
+        q5 = np.where(guaranteed_5, 1.0, compiled.five_star_rate)
+        zeros = np.zeros_like(src)
+        ones = np.ones_like(src)
+
+        rows = np.concatenate([src, src, src, src])
+        cols = np.concatenate([
+            np.ravel_multi_index((zeros, zeros, ones), self.shape),
+            np.ravel_multi_index((zeros, zeros, f), self.shape),
+            np.ravel_multi_index((next_p6, zeros, f), self.shape),
+            np.ravel_multi_index((next_p6, np.minimum(p5 + 1, rules.five_star_guarantee), f), self.shape),
+        ])
+        values = np.concatenate([
+            h * rules.prob_50_50,
+            h * (1 - rules.prob_50_50),
+            (1 - h) * q5,
+            (1 - h) * (1 - q5),
+        ])
+        keep = values > 0
+        return SparseTransitions(rows[keep], cols[keep], values[keep], self.size)
+
+    def _build_guarantee(self) -> SparseTransitions:
+        """The featured-guarantee pull: featured for sure unless already obtained."""
+        regular = self.transitions
+        obtained = np.unravel_index(regular.rows, self.shape)[2] == 1
+        target = self.index(0, 0, True)
+        pending = np.flatnonzero(np.unravel_index(np.arange(self.size), self.shape)[2] == 0)
+        return SparseTransitions(
+            np.concatenate([regular.rows[obtained], pending]),
+            np.concatenate([regular.cols[obtained], np.full(pending.size, target)]),
+            np.concatenate([regular.values[obtained], np.ones(pending.size)]),
+            self.size,
+        )
+
+    def advance(self, vector: np.ndarray, pulls: int) -> np.ndarray:
+        """
+        Advance a distribution by ordinary pulls.
+
+        Args:
+            vector: Probability vector over the flat state space
+            pulls: Number of pulls
+
+        Returns:
+            Probability vector after the pulls
+        """
+        if pulls <= self.step_threshold:
+            for _ in range(pulls):
+                vector = self.transitions.propagate(vector)
+            return vector
+
+        power = self.transitions.to_dense()
+        while True:
+            if pulls & 1:
+                vector = vector @ power
+            pulls >>= 1
+            if not pulls:
+                return vector
+            # Replace A^(2^k) by A^(2^(k+1)) so earlier powers are freed
+            power = power @ power
+
+    def advance_from(self, vector: np.ndarray, done: int, pulls: int, to_spark: int) -> np.ndarray:
+        """
+        Advance a distribution that is already ``done`` pulls past its start.
+
+        Args:
+            vector: Probability vector after ``done`` pulls
+            done: Pulls already applied
+            pulls: Further pulls to apply
+            to_spark: Pull number (from the start) that hits the featured
+                guarantee, or <= 0 if there is none
+
+        Returns:
+            Probability vector after ``done + pulls`` pulls
+        """
+        end = done + pulls
+        if done < to_spark <= end:
+            vector = self.advance(vector, to_spark - 1 - done)
+            vector = self.guarantee_transitions.propagate(vector)
+            return self.advance(vector, end - to_spark)
+        return self.advance(vector, pulls)
+
+    def clear_frontiers(self) -> None:
+        """Forget every saved frontier."""
+        self._frontiers.clear()
+
+    def distribution_after(
+        self,
+        state: PityState,
+        pulls: int,
+        featured_obtained: bool = False,
+    ) -> StateDistribution:
+        """
+        Exact joint state distribution after N pulls.
+
+        Args:
+            state: Starting pity state
+            pulls: Number of pulls
+            featured_obtained: Whether the featured unit was already obtained
+
+        Returns:
+            Joint distribution with deterministic spark/dupe positions
+        """
+        rules = self.rules
+        # total_pulls only moves the deterministic dupe counter, so it is not part of the key
+        key = (state.pulls_without_6_star, state.pulls_without_5_star, state.banner_pulls, featured_obtained)
+        frontier = self._frontiers.get(key)
+        if frontier is not None and frontier[0] <= pulls:
+            done, vector = frontier
+        else:
+            done = 0
+            vector = np.zeros(self.size)
+            vector[self.index(state.pulls_without_6_star, state.pulls_without_5_star, featured_obtained)] = 1.0
+
+        to_spark = rules.featured_guarantee - state.banner_pulls
+        vector = self.advance_from(vector, done, pulls - done, to_spark)
+        vector.setflags(write=False)
+        self._frontiers[key] = (pulls, vector)
+        self._frontiers.move_to_end(key)
+        while len(self._frontiers) > self.max_frontiers:
+            self._frontiers.popitem(last=False)
+
+        final_total = state.total_pulls + pulls
+        return StateDistribution(
+            pulls=pulls,
+            probabilities=vector.reshape(self.shape),
+            spark_position=min(state.banner_pulls + pulls, rules.featured_guarantee),
+            dupe_position=final_total % rules.bonus_dupe,
+            bonus_dupes=final_total // rules.bonus_dupe - state.total_pulls // rules.bonus_dupe,
+        )
@@ -0,0 +1,159 @@
+"""Population statistics over imported pull records."""
+
+from __future__ import annotations
+
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from ..entities import PityState, PullRecordBatch
+from ..value_objects import GameRules
+from .pull_kernel import KernelState, PullKernel
+from .streaming_stats import PullStatistics
+
+
+class PlayerCarry(NamedTuple):
+    """Replay state of a player whose records may continue in the next chunk."""
+    player: str
+    banner: str
+    state: KernelState
+
+
+class PopulationStats:
+    """
+    Mergeable accumulator of population statistics.
+
+    Holds counters, the distribution of 6★ cycle lengths (pulls from one
+    6★ to the next, including it), the final 6★ pity of every finished
+    player, and pulls-to-first-featured per banner. Partial results from
+    different workers merge exactly.
+    """
+
+    __slots__ = (
+        "soft_pity_start", "players", "pulls", "six_stars", "five_stars",
+        "won_50_50", "lost_50_50", "cycle_lengths", "final_pity", "pulls_per_featured",
+    )
+
+    def __init__(self, rules: GameRules):
+        """Create an empty accumulator for a rules set."""
+        self.soft_pity_start = rules.soft_pity_start
+        self.players = 0
+        self.pulls = 0
+        self.six_stars = 0
+        self.five_stars = 0
+        self.won_50_50 = 0
+        self.lost_50_50 = 0
+        self.cycle_lengths = np.zeros(rules.hard_pity + 1, dtype=np.int64)
+        self.final_pity = np.zeros(rules.hard_pity + 1, dtype=np.int64)
+        self.pulls_per_featured = PullStatistics(max_pulls=rules.featured_guarantee)
+
+    def merge(self, other: PopulationStats) -> PopulationStats:
+        """Merge another accumulator (in place) and return self."""
+        self.players += other.players
+        self.pulls += other.pulls
+        self.six_stars += other.six_stars
+        self.five_stars += other.five_stars
+        self.won_50_50 += other.won_50_50
+        self.lost_50_50 += other.lost_50_50
+        self.cycle_lengths += other.cycle_lengths
+        self.final_pity += other.final_pity
+        self.pulls_per_featured.merge(other.pulls_per_featured)
+        return self
+
+    @property
+    def six_star_rate(self) -> float:
+        """Observed 6★ rate."""
+        return self.six_stars / self.pulls if self.pulls else 0.0
+
+    @property
+    def win_rate_50_50(self) -> float:
+        """Share of decided 50/50s that were won."""
+        decided = self.won_50_50 + self.lost_50_50
+        return self.won_50_50 / decided if decided else 0.0
+
+    @property
+    def soft_pity_share(self) -> float:
+        """Share of 6★ cycles that ended in soft pity (or at hard pity)."""
+        cycles = int(self.cycle_lengths.sum())
+        return int(self.cycle_lengths[self.soft_pity_start:].sum()) / cycles if cycles else 0.0
+
+
+class PopulationReplayer:
+    """
+    Rebuilds each player's pity state from their records.
+
+    Records go through the pull kernel (the same counter rules as the
+    simulator); a change of banner id starts a new banner. Each player
+    starts from the initial state. A chunk can end in the middle of a
+    player, so replay returns that player's carry, and the next chunk
+    resumes from it.
+    """
+
+    def __init__(self, rules: GameRules):
+        """Initialize with game rules."""
+        self.rules = rules
+        self.kernel = PullKernel(rules)
+        self._initial = KernelState.from_pity_state(PityState.initial())
+
+    def finish(self, carry: Optional[PlayerCarry], stats: PopulationStats) -> None:
+        """Count a player whose records have all been replayed."""
+        if carry is None:
+            return
+        stats.players += 1
+        stats.final_pity[min(carry.state.pulls_without_6_star, self.rules.hard_pity)] += 1
+
+    def replay(
+        self,
+        batch: PullRecordBatch,
+        stats: PopulationStats,
+        carry: Optional[PlayerCarry] = None,
+    ) -> Optional[PlayerCarry]:
+        """
+        Replay a batch of records into ``stats``.
+
+        Args:
+            batch: Records, grouped by player and in pull order
+            stats: Accumulator to update
+            carry: Player left open by the previous batch
+
+        Returns:
+            Carry of the last player (not yet counted as finished)
+        """
+        kernel = self.kernel
+        cycles = stats.cycle_lengths
+        last_length = len(cycles) - 1
+        player, banner, state = carry if carry is not None else (None, None, None)
+        six_stars = five_stars = won = lost = 0
+        rarities = batch.rarities.tolist()
+        featured = batch.featured.tolist()
+        won_50_50 = batch.won_50_50.tolist()
+
+        for i, record_player in enumerate(batch.players):
+            record_banner = batch.banners[i]
+            if record_player != player:
+                if player is not None:
+                    self.finish(PlayerCarry(player, banner, state), stats)
+                player, banner, state = record_player, record_banner, self._initial
+            elif record_banner != banner:
+                banner, state = record_banner, kernel.new_banner(state)
+
+            rarity = rarities[i]
+            if rarity == 6:
+                six_stars += 1
+                cycles[min(state.pulls_without_6_star + 1, last_length)] += 1
+                if won_50_50[i] == 1:
+                    won += 1
+                elif won_50_50[i] == 0:
+                    lost += 1
+                if featured[i] and not state.featured_obtained:
+                    stats.pulls_per_featured.add(state.banner_pulls + 1)
+            elif rarity == 5:
+                five_stars += 1
+            state = kernel.apply(state, rarity, featured[i])
+
+        stats.pulls += len(batch)
+        stats.six_stars += six_stars
+        stats.five_stars += five_stars
+        stats.won_50_50 += won
+        stats.lost_50_50 += lost
+        return PlayerCarry(player, banner, state) if player is not None else None
@@ -18,6 +18,7 @@ class ProbabilityCalculator:
         """
         Calculate the probability of getting a 6★ on the next pull.
         
+        Looks up the rules' hazard table (by default the linear rule):
         - Base: 0.8%
         - Soft Pity (pull 65+): +5% for each pull after 65
         - Hard Pity (pull 80): 100% guaranteed
@@ -28,17 +29,8 @@ class ProbabilityCalculator:
         Returns:
             Probability of getting 6★ on next pull
         """
-        # Hard pity: pull 80 (index 79) is 100% guaranteed
-        if pulls_without_6_star >= self.rules.hard_pity - 1:
-            return Probability.certain()
-        
-        # Soft pity: starts at pull 65 (index 64)
-        if pulls_without_6_star >= self.rules.soft_pity_start - 1:
-            pulls_in_soft = pulls_without_6_star - (self.rules.soft_pity_start - 1) + 1
-            prob_value = self.rules.prob_6_star_base + (pulls_in_soft * self.rules.soft_pity_increment)
-            return Probability(value=min(prob_value, 1.0))
-        
-        return Probability(value=self.rules.prob_6_star_base)
+        table = self.rules.hazard_table
+        return Probability(value=table[min(pulls_without_6_star, len(table) - 1)])
     
     def calculate_pulls_for_5_star(self, pulls_without_5_star: int) -> int:
         """
@@ -64,8 +56,7 @@ class ProbabilityCalculator:
         expected_pull = 0.0
         prob_no_6_previous = 1.0
         
-        for t in range(self.rules.hard_pity):
-            pull_prob = float(self.calculate_6_star_probability(t))
+        for t, pull_prob in enumerate(self.rules.hazard_table[:self.rules.hard_pity]):
             # Probability of getting 6★ exactly on this pull
             exact_prob = prob_no_6_previous * pull_prob
             expected_pull += (t + 1) * exact_prob
@@ -88,6 +79,7 @@ class ProbabilityCalculator:
             Probability of getting at least one 6★
         """
         prob_no_6_star = 1.0
+        table = self.rules.hazard_table
         
         for i in range(num_pulls):
             pull_index = current_pity + i
@@ -95,7 +87,6 @@ class ProbabilityCalculator:
                 # Guaranteed by hard pity
                 return Probability.certain()
             
-            prob_this_pull = float(self.calculate_6_star_probability(pull_index))
-            prob_no_6_star *= (1 - prob_this_pull)
+            prob_no_6_star *= (1 - table[pull_index])
         
         return Probability(value=1.0 - prob_no_6_star)
@@ -0,0 +1,124 @@
+"""Fast single-pull transition kernel."""
+
+from typing import NamedTuple
+
+from ..entities import PityState
+from ..value_objects import GameRules
+from .compiled_rules import compile_rules
+
+
+class KernelState(NamedTuple):
+    """Plain-tuple pity state used in hot loops (no validation)."""
+    pulls_without_6_star: int
+    pulls_without_5_star: int
+    banner_pulls: int
+    total_pulls: int
+    featured_obtained: bool = False
+
+    @classmethod
+    def from_pity_state(cls, state: PityState, featured_obtained: bool = False) -> "KernelState":
+        """Build from a validated PityState."""
+        return cls(
+            state.pulls_without_6_star,
+            state.pulls_without_5_star,
+            state.banner_pulls,
+            state.total_pulls,
+            featured_obtained,
+        )
+
+    def to_pity_state(self) -> PityState:
+        """Convert back to a validated PityState."""
+        return PityState(
+            pulls_without_6_star=self.pulls_without_6_star,
+            pulls_without_5_star=self.pulls_without_5_star,
+            banner_pulls=self.banner_pulls,
+            total_pulls=self.total_pulls,
+        )
+
+
+class PullOutcome(NamedTuple):
+    """Outcome of one pull as seen by the kernel."""
+    rarity: int
+    featured: bool = False
+    bonus_dupe: bool = False
+
+
+class PullKernel:
+    """
+    Per-pull transition function over plain tuples.
+
+    Every pull consumes exactly two uniforms (rarity and 50/50), whether or
+    not the 50/50 is used, so pull number n always sees the same numbers
+    from a given stream. This is what makes common random numbers work
+    across strategies that stop at different points.
+    """
+
+    def __init__(self, rules: GameRules):
+        """Initialize kernel from game rules."""
+        self.rules = rules
+        self.hazard = rules.hazard_table
+        self.five_star_rate = compile_rules(rules).five_star_rate
+
+    def step(self, state: KernelState, u_rarity: float, u_featured: float) -> tuple[KernelState, PullOutcome]:
+        """
+        Apply one pull.
+
+        Args:
+            state: Current state
+            u_rarity: Uniform in [0, 1) deciding the rarity
+            u_featured: Uniform in [0, 1) deciding the 50/50
+
+        Returns:
+            New state and the pull outcome
+        """
+        rules = self.rules
+        pity_6, pity_5, banner, total, featured_obtained = state
+        banner += 1
+        total += 1
+        bonus_dupe = total % rules.bonus_dupe == 0
+
+        hazard = self.hazard[min(pity_6, rules.hard_pity)]
+        if not featured_obtained and banner == rules.featured_guarantee:
+            return KernelState(0, 0, banner, total, True), PullOutcome(6, True, bonus_dupe)
+
+        if u_rarity < hazard:
+            featured = u_featured < rules.prob_50_50
+            return (
+                KernelState(0, 0, banner, total, featured_obtained or featured),
+                PullOutcome(6, featured, bonus_dupe),
+            )
+
+        pity_6 = min(pity_6 + 1, rules.hard_pity)
+        if pity_5 + 1 >= rules.five_star_guarantee or (u_rarity - hazard) < self.five_star_rate * (1.0 - hazard):
+            return KernelState(pity_6, 0, banner, total, featured_obtained), PullOutcome(5, False, bonus_dupe)
+
+        return (
+            KernelState(pity_6, pity_5 + 1, banner, total, featured_obtained),
+            PullOutcome(4, False, bonus_dupe),
+        )
+
+    def apply(self, state: KernelState, rarity: int, featured: bool = False) -> KernelState:
+        """
+        Apply a known pull result (the tuple counterpart of PitySimulator.apply_pull_result).
+
+        Args:
+            state: Current state
+            rarity: Rarity of the pull (4, 5 or 6)
+            featured: Whether a 6★ was the featured unit
+
+        Returns:
+            New state
+        """
+        pity_6, pity_5, banner, total, featured_obtained = state
+        if rarity == 6:
+            return KernelState(0, 0, banner + 1, total + 1, featured_obtained or featured)
+        pity_6 = min(pity_6 + 1, self.rules.hard_pity)
+        if rarity == 5:
+            return KernelState(pity_6, 0, banner + 1, total + 1, featured_obtained)
+        return KernelState(
+            pity_6, min(pity_5 + 1, self.rules.five_star_guarantee), banner + 1, total + 1, featured_obtained
+        )
+
+    def new_banner(self, state: KernelState) -> KernelState:
+        """Start a new banner: spark and featured flag reset, pity carries over."""
+        return state._replace(banner_pulls=0, featured_obtained=False)
@@ -0,0 +1,140 @@
+"""Pulling strategies and the banner-plan simulator that drives them."""
+
+from dataclasses import dataclass
+from typing import Protocol
+
+from ..value_objects import GameRules
+from .pull_kernel import PullKernel, KernelState
+from .pity_simulator import RandomGenerator
+
+
+@dataclass(frozen=True)
+class BannerProgress:
+    """What a strategy can see before deciding on the next pull."""
+    banner_index: int
+    banners: int
+    pulls_available: int
+    state: KernelState
+    featured_copies: int
+
+
+class PullStrategy(Protocol):
+    """Protocol for a pulling strategy (must be picklable for parallel runs)."""
+
+    name: str
+
+    def wants_pull(self, progress: BannerProgress) -> bool:
+        """Decide whether to spend one more pull on the current banner."""
+        ...
+
+
+class StopAtFeatured:
+    """Pull on every banner until the featured unit is obtained."""
+
+    name = "stop_at_featured"
+
+    def wants_pull(self, progress: BannerProgress) -> bool:
+        """Pull while no featured copy was obtained on this banner."""
+        return progress.featured_copies == 0
+
+
+class ReachSpark:
+    """Pull on every banner until the featured guarantee pull is reached."""
+
+    name = "reach_spark"
+
+    def __init__(self, spark: int = 120):
+        """Initialize with the featured guarantee threshold."""
+        self.spark = spark
+
+    def wants_pull(self, progress: BannerProgress) -> bool:
+        """Pull while the banner counter is below the guarantee."""
+        return progress.state.banner_pulls < self.spark
+
+
+class SaveForNextBanner:
+    """Skip every banner except the last one, then pull until featured."""
+
+    name = "save_for_next_banner"
+
+    def wants_pull(self, progress: BannerProgress) -> bool:
+        """Pull only on the last banner of the plan, until featured."""
+        return progress.banner_index == progress.banners - 1 and progress.featured_copies == 0
+
+
+class ChaseDupe:
+    """Pull until the featured unit is obtained and the next bonus dupe is reached."""
+
+    name = "chase_dupe"
+
+    def __init__(self, bonus_dupe: int = 240):
+        """Initialize with the bonus dupe interval."""
+        self.bonus_dupe = bonus_dupe
+
+    def wants_pull(self, progress: BannerProgress) -> bool:
+        """Pull until featured and sitting exactly on a bonus dupe milestone."""
+        at_dupe = progress.state.total_pulls > 0 and progress.state.total_pulls % self.bonus_dupe == 0
+        return progress.featured_copies == 0 or not at_dupe
+
+
+@dataclass(frozen=True)
+class StrategyOutcome:
+    """Result of playing one banner plan with one strategy."""
+    featured_copies: int
+    pulls_spent: int
+
+
+class StrategySimulator:
+    """
+    Plays a sequence of banners with a pull income under one strategy.
+
+    Each banner adds ``pulls_per_banner`` pulls to the available budget;
+    unspent pulls carry over to later banners, as does 6★/5★ pity.
+    """
+
+    def __init__(self, rules: GameRules):
+        """Initialize with game rules."""
+        self.rules = rules
+        self.kernel = PullKernel(rules)
+
+    def play(
+        self,
+        strategy: PullStrategy,
+        random_gen: RandomGenerator,
+        banners: int,
+        pulls_per_banner: int,
+        start: KernelState = KernelState(0, 0, 0, 0),
+    ) -> StrategyOutcome:
+        """
+        Play the plan once.
+
+        Args:
+            strategy: Strategy deciding each pull
+            random_gen: Random stream (two uniforms per pull)
+            banners: Number of banners in the plan
+            pulls_per_banner: Pull income per banner
+            start: State at the start of the first banner
+
+        Returns:
+            Featured copies obtained (including bonus dupes) and pulls spent
+        """
+        state = start
+        available = 0
+        copies = 0
+        spent = 0
+
+        for banner_index in range(banners):
+            state = self.kernel.new_banner(state) if banner_index else state
+            available += pulls_per_banner
+            banner_copies = 0
+            while available > 0 and strategy.wants_pull(
+                BannerProgress(banner_index, banners, available, state, banner_copies)
+            ):
+                state, outcome = self.kernel.step(state, random_gen.random(), random_gen.random())
+                available -= 1
+                spent += 1
+                banner_copies += outcome.featured + outcome.bonus_dupe
+
+            copies += banner_copies
+
+        return StrategyOutcome(featured_copies=copies, pulls_spent=spent)
@@ -0,0 +1,190 @@
+"""Renewal-theory long-run cost analysis domain service."""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from ..value_objects import GameRules
+from .compiled_rules import compile_rules
+
+
+@dataclass(frozen=True)
+class LongRunMetrics:
+    """Steady-state costs for a player spending a fixed number of pulls per banner."""
+    pulls_per_banner: int
+    pulls_per_6_star: float
+    pulls_per_featured: float
+    pulls_per_bonus_dupe: float
+    pulls_per_featured_copy: float
+    featured_per_banner: float
+    stationary_pity: np.ndarray
+
+
+class RenewalAnalyzer:
+    """
+    Domain service for long-run (steady-state) pull costs.
+
+    All figures come from stationary distributions and linear solves over
+    the pity chain, never from simulation:
+
+    - the 6★ pity counter is a renewal process whose stationary
+      distribution gives the long-run 6★ rate;
+    - pity carries over between banners, so the pity at the start of each
+      banner is itself a Markov chain whose stationary distribution
+      weights the per-banner featured yield;
+    - the expected time to the featured unit is a first-passage problem
+      solved by backward recursion over the (deterministic) banner counter
+      plus one linear solve once the guarantee is no longer available.
+    """
+
+    def __init__(self, rules: GameRules):
+        """Initialize with game rules."""
+        self.rules = rules
+        self.hazard = compile_rules(rules).hazard
+        self.states = rules.hard_pity + 1
+        self._next = np.minimum(np.arange(self.states) + 1, rules.hard_pity)
+
+    @staticmethod
+    def stationary_distribution(transition: np.ndarray) -> np.ndarray:
+        """Solve pi P = pi, sum(pi) = 1 for a row-stochastic matrix."""
+        n = transition.shape[0]
+        system = transition.T - np.eye(n)
+        system[-1, :] = 1.0
+        rhs = np.zeros(n)
+        rhs[-1] = 1.0
+        pi = np.linalg.solve(system, rhs)
+        return np.clip(pi, 0.0, None) / np.clip(pi, 0.0, None).sum()
+
+    def pity_transition_matrix(self) -> np.ndarray:
+        """One-pull transition matrix of the 6★ pity counter."""
+        matrix = np.zeros((self.states, self.states))
+        idx = np.arange(self.states)
+        matrix[idx, 0] += self.hazard
+        matrix[idx, self._next] += 1 - self.hazard
+        return matrix
+
+    def expected_pulls_per_6_star(self) -> float:
+        """Long-run pulls per 6★ (inverse of the stationary 6★ rate)."""
+        pi = self.stationary_distribution(self.pity_transition_matrix())
+        return float(1.0 / (pi @ self.hazard))
+
+    def expected_pulls_to_featured_used(self) -> np.ndarray:
+        """
+        Expected pulls to the next featured unit once the guarantee is
+        gone, by pity: E = 1 + h*(1-w)*E[0] + (1-h)*E[next].
+        """
+        system = np.eye(self.states)
+        system[:, 0] -= self.hazard * (1 - self.rules.prob_50_50)
+        system[np.arange(self.states), self._next] -= 1 - self.hazard
+        return np.linalg.solve(system, np.ones(self.states))
+
+    def expected_pulls_to_featured_pending(self, banner_pulls: int = 0) -> np.ndarray:
+        """
+        Expected pulls to the next featured unit while the guarantee is
+        pending, by pity and banner position.
+
+        Computed backward over the banner position, since the pull
+        reaching the guarantee is featured.
+
+        Args:
+            banner_pulls: First banner position needed
+
+        Returns:
+            Array of shape (pity, featured_guarantee - banner_pulls); column
+            j is the banner position ``banner_pulls + j``
+        """
+        h = self.hazard
+        keep = 1 - self.rules.prob_50_50
+        positions = self.rules.featured_guarantee - banner_pulls
+        expected = np.ones((self.states, positions))
+        for s in range(positions - 2, -1, -1):
+            after = expected[:, s + 1]
+            expected[:, s] = 1 + h * keep * after[0] + (1 - h) * after[self._next]
+        return expected
+
+    def expected_pulls_to_featured(self, pity: int = 0, banner_pulls: int = 0, featured_obtained: bool = False) -> float:
+        """
+        Expected pulls until the next featured unit.
+
+        Args:
+            pity: Current pulls without 6★
+            banner_pulls: Current banner pulls
+            featured_obtained: Whether the featured guarantee was already used
+
+        Returns:
+            Expected number of pulls
+        """
+        pity = min(pity, self.rules.hard_pity)
+        if featured_obtained or banner_pulls >= self.rules.featured_guarantee:
+            return float(self.expected_pulls_to_featured_used()[pity])
+        return float(self.expected_pulls_to_featured_pending(banner_pulls)[pity, 0])
+
+    def banner_kernel(self, pulls_per_banner: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Per-banner transition of the pity counter and expected yields.
+
+        Args:
+            pulls_per_banner: Pulls spent on every banner
+
+        Returns:
+            (K, featured, six_stars): K[p, p'] is the probability that a
+            banner started at pity p ends at pity p'; featured[p] and
+            six_stars[p] are the expected featured copies and 6★ pulls
+        """
+        rules = self.rules
+        h = self.hazard
+        win = rules.prob_50_50
+        # mass[start, pity, featured_obtained]
+        mass = np.zeros((self.states, self.states, 2))
+        mass[np.arange(self.states), np.arange(self.states), 0] = 1.0
+        featured = np.zeros(self.states)
+        six_stars = np.zeros(self.states)
+
+        for pull in range(1, pulls_per_banner + 1):
+            new = np.zeros_like(mass)
+            if pull == rules.featured_guarantee:
+                pending = mass[:, :, 0].sum(axis=1)
+                featured += pending
+                six_stars += pending
+                new[:, 0, 1] += pending
+                mass[:, :, 0] = 0.0
+            hit = mass * h[None, :, None]
+            hit_total = hit.sum(axis=1)
+            six_stars += hit_total.sum(axis=1)
+            featured += win * hit_total.sum(axis=1)
+            new[:, 0, 1] += win * hit_total[:, 0] + hit_total[:, 1]
+            new[:, 0, 0] += (1 - win) * hit_total[:, 0]
+            miss = mass * (1 - h)[None, :, None]
+            new[:, 1:] += miss[:, :-1]
+            new[:, -1] += miss[:, -1]
+            mass = new
+
+        return mass.sum(axis=2), featured, six_stars
+
+    def long_run_metrics(self, pulls_per_banner: int) -> LongRunMetrics:
+        """
+        Steady-state costs across an unbounded sequence of banners.
+
+        Args:
+            pulls_per_banner: Pulls spent on every banner
+
+        Returns:
+            Long-run pulls per 6★, per featured copy and per bonus dupe
+        """
+        if pulls_per_banner <= 0:
+            raise ValueError(f"pulls_per_banner must be positive, got {pulls_per_banner}")
+        kernel, featured, six_stars = self.banner_kernel(pulls_per_banner)
+        pi = self.stationary_distribution(kernel)
+        featured_per_banner = float(pi @ featured)
+        six_per_banner = float(pi @ six_stars)
+        dupes_per_banner = pulls_per_banner / self.rules.bonus_dupe
+
+        return LongRunMetrics(
+            pulls_per_banner=pulls_per_banner,
+            pulls_per_6_star=pulls_per_banner / six_per_banner,
+            pulls_per_featured=pulls_per_banner / featured_per_banner,
+            pulls_per_bonus_dupe=float(self.rules.bonus_dupe),
+            pulls_per_featured_copy=pulls_per_banner / (featured_per_banner + dupes_per_banner),
+            featured_per_banner=featured_per_banner,
+            stationary_pity=pi,
+        )
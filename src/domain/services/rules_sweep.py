@@ -0,0 +1,215 @@
+"""Vectorized GameRules parameter sweep domain service."""
+
+import itertools
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from ..value_objects import GameRules
+
+
+SWEEPABLE_FIELDS = (
+    "prob_6_star_base",
+    "soft_pity_start",
+    "soft_pity_increment",
+    "hard_pity",
+    "prob_50_50",
+    "featured_guarantee",
+)
+
+# Fields that generate the linear hazard curve
+HAZARD_FIELDS = ("prob_6_star_base", "soft_pity_start", "soft_pity_increment", "hard_pity")
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    """
+    Results of a parameter sweep, one row per rules variant.
+
+    ``parameters`` maps each sweepable field to its per-variant values.
+    """
+    parameters: dict[str, np.ndarray]
+    expected_pulls_to_6_star: np.ndarray
+    quantile_levels: tuple[float, ...]
+    pulls_to_6_star_quantiles: np.ndarray
+    featured_horizons: tuple[int, ...]
+    featured_probability: np.ndarray
+    expected_pulls_to_featured: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.expected_pulls_to_6_star)
+
+    def variant(self, index: int, base: GameRules | None = None) -> GameRules:
+        """Rebuild (and validate) the GameRules of one variant."""
+        values = {name: self.parameters[name][index].item() for name in SWEEPABLE_FIELDS}
+        base = base or GameRules.default()
+        return GameRules(**{**base.model_dump(), **values})
+
+
+class RulesSweep:
+    """
+    Domain service evaluating many GameRules variants in one vectorized pass.
+
+    Each variant is a row of a hazard matrix; survival curves, expectations
+    and quantiles are then column-wise NumPy operations, and the featured
+    odds come from a forward DP over pity that runs for all rows at once.
+    No GameRules or calculator objects are built per variant.
+    """
+
+    def __init__(self, base: GameRules | None = None):
+        """
+        Initialize the sweep.
+
+        Args:
+            base: Rules providing every parameter that is not swept
+        """
+        self.base = base or GameRules.default()
+
+    def grid(self, **axes: Sequence[float]) -> dict[str, np.ndarray]:
+        """
+        Cartesian product of parameter values.
+
+        Args:
+            **axes: Sweepable field name -> values to try
+
+        When the base rules have an explicit hazard curve, every variant
+        keeps that curve, so only fields that do not shape the hazard
+        (``prob_50_50``, ``featured_guarantee``) can be swept.
+
+        Returns:
+            Per-variant parameter arrays for every sweepable field
+        """
+        unknown = set(axes) - set(SWEEPABLE_FIELDS)
+        if unknown:
+            raise ValueError(f"Cannot sweep over {sorted(unknown)}; sweepable fields: {SWEEPABLE_FIELDS}")
+        curve_fields = set(axes) & set(HAZARD_FIELDS)
+        if self.base.hazard_curve is not None and curve_fields:
+            raise ValueError(
+                f"Cannot sweep over {sorted(curve_fields)}: the base rules use an explicit hazard curve"
+            )
+        names = list(axes)
+        combos = np.array(list(itertools.product(*(axes[n] for n in names))), dtype=float)
+        size = len(combos)
+        params = {}
+        for field in SWEEPABLE_FIELDS:
+            if field in axes:
+                params[field] = combos[:, names.index(field)]
+            else:
+                params[field] = np.full(size, float(getattr(self.base, field)))
+        for field in ("soft_pity_start", "hard_pity", "featured_guarantee"):
+            params[field] = params[field].astype(np.int64)
+        if self.base.hazard_curve is not None:
+            params["hazard"] = np.tile(np.array(self.base.hazard_table), (size, 1))
+        return params
+
+    def from_rules(self, variants: Sequence[GameRules]) -> dict[str, np.ndarray]:
+        """
+        Per-variant parameter arrays from explicit GameRules objects.
+
+        The hazard tables are included as a padded ``hazard`` matrix, so
+        variants with custom (non-linear) soft pity curves are supported.
+        """
+        params = {
+            field: np.array([getattr(r, field) for r in variants], dtype=float)
+            for field in SWEEPABLE_FIELDS
+        }
+        for field in ("soft_pity_start", "hard_pity", "featured_guarantee"):
+            params[field] = params[field].astype(np.int64)
+        width = int(params["hard_pity"].max()) + 1
+        hazard = np.ones((len(variants), width))
+        for i, rules in enumerate(variants):
+            hazard[i, :len(rules.hazard_table)] = rules.hazard_table
+        params["hazard"] = hazard
+        return params
+
+    @staticmethod
+    def hazard_matrix(params: dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Per-variant 6★ hazard by pulls_without_6_star.
+
+        Uses the explicit ``hazard`` matrix when present, otherwise
+        vectorizes GameRules.linear_hazard_curve over the parameter arrays.
+
+        Returns:
+            Array of shape (variants, max hard pity + 1)
+        """
+        if "hazard" in params:
+            return params["hazard"]
+        hard = params["hard_pity"][:, None]
+        soft_index = params["soft_pity_start"][:, None] - 1
+        t = np.arange(int(params["hard_pity"].max()) + 1)[None, :]
+        pulls_in_soft = np.maximum(t - soft_index + 1, 0)
+        hazard = params["prob_6_star_base"][:, None] + pulls_in_soft * params["soft_pity_increment"][:, None]
+        hazard = np.minimum(hazard, 1.0)
+        return np.where(t >= hard - 1, 1.0, hazard)
+
+    def evaluate(
+        self,
+        params: dict[str, np.ndarray],
+        quantiles: Sequence[float] = (0.5, 0.9, 0.99),
+        featured_within: Sequence[int] = (80, 120),
+    ) -> SweepResult:
+        """
+        Evaluate all variants.
+
+        Args:
+            params: Per-variant parameter arrays (from grid() or from_rules())
+            quantiles: Quantile levels of pulls-to-6★ to report
+            featured_within: Horizons for P(featured within N pulls)
+
+        Returns:
+            Sweep results with one row per variant
+        """
+        hazard = self.hazard_matrix(params)
+        variants, width = hazard.shape
+
+        # Pulls to 6★ from pity 0: survival[k] = P(gap > k)
+        survival = np.ones((variants, width + 1))
+        survival[:, 1:] = np.cumprod(1.0 - hazard, axis=1)
+        expected_6 = survival[:, :-1].sum(axis=1)
+        cdf = 1.0 - survival[:, 1:]
+        levels = tuple(quantiles)
+        q_matrix = np.stack(
+            [np.argmax(cdf >= q - 1e-12, axis=1) + 1 for q in levels], axis=1
+        ) if levels else np.zeros((variants, 0), dtype=np.int64)
+
+        # Featured: forward DP over pity for all variants at once
+        win = params["prob_50_50"]
+        guarantee = params["featured_guarantee"]
+        horizons = tuple(featured_within)
+        last = int(max(max(horizons, default=0), guarantee.max()))
+        mass = np.zeros((variants, width))
+        mass[:, 0] = 1.0
+        featured = np.zeros(variants)
+        featured_at = np.zeros((variants, len(horizons)))
+        expected_featured = np.zeros(variants)
+        hit_mass = np.empty_like(mass)
+        miss = np.empty_like(mass)
+
+        for pull in range(1, last + 1):
+            expected_featured += 1.0 - featured
+            at_guarantee = guarantee == pull
+            if at_guarantee.any():
+                featured[at_guarantee] += mass[at_guarantee].sum(axis=1)
+                mass[at_guarantee] = 0.0
+            np.multiply(mass, hazard, out=hit_mass)
+            np.subtract(mass, hit_mass, out=miss)
+            hits = hit_mass.sum(axis=1)
+            featured += win * hits
+            mass[:, 1:] = miss[:, :-1]
+            mass[:, -1] += miss[:, -1]
+            mass[:, 0] = (1.0 - win) * hits
+            for j, horizon in enumerate(horizons):
+                if horizon == pull:
+                    featured_at[:, j] = featured
+
+        return SweepResult(
+            parameters=params,
+            expected_pulls_to_6_star=expected_6,
+            quantile_levels=levels,
+            pulls_to_6_star_quantiles=q_matrix,
+            featured_horizons=horizons,
+            featured_probability=np.minimum(featured_at, 1.0),
+            expected_pulls_to_featured=expected_featured,
+        )
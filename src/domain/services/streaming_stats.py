@@ -0,0 +1,317 @@
+"""Mergeable streaming statistics for simulation output."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+
+
+class RunningMoments:
+    """
+    Online mean/variance accumulator (Welford).
+
+    Two accumulators built on different workers can be merged exactly
+    (Chan et al. parallel update), so no samples ever need to be kept.
+    """
+
+    __slots__ = ("count", "mean", "m2", "min", "max")
+
+    def __init__(self) -> None:
+        """Create an empty accumulator."""
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """Add one sample."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def add_many(self, values: Iterable[float]) -> None:
+        """Add every sample from an iterable."""
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: RunningMoments) -> RunningMoments:
+        """Merge another accumulator into this one (in place) and return self."""
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return self
+
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self) -> float:
+        """Unbiased sample variance (0 for fewer than two samples)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stddev(self) -> float:
+        """Sample standard deviation."""
+        return math.sqrt(self.variance)
+
+    @property
+    def standard_error(self) -> float:
+        """Standard error of the mean."""
+        return self.stddev / math.sqrt(self.count) if self.count > 0 else math.inf
+
+
+class FixedBinHistogram:
+    """
+    Histogram with fixed, equal-width bins over [low, high).
+
+    Values outside the range are counted in underflow/overflow so that
+    totals stay exact. Histograms with identical bins merge by addition.
+    """
+
+    __slots__ = ("low", "high", "bins", "counts", "underflow", "overflow")
+
+    def __init__(self, low: float, high: float, bins: int):
+        """
+        Create an empty histogram.
+
+        Args:
+            low: Inclusive lower edge of the first bin
+            high: Exclusive upper edge of the last bin
+            bins: Number of bins
+        """
+        if bins <= 0 or high <= low:
+            raise ValueError(f"Invalid histogram range [{low}, {high}) with {bins} bins")
+        self.low = low
+        self.high = high
+        self.bins = bins
+        self.counts = [0] * bins
+        self.underflow = 0
+        self.overflow = 0
+
+    @classmethod
+    def for_pulls(cls, max_pulls: int) -> FixedBinHistogram:
+        """Histogram with one bin per pull count 0..max_pulls."""
+        return cls(0, max_pulls + 1, max_pulls + 1)
+
+    @property
+    def width(self) -> float:
+        """Width of each bin."""
+        return (self.high - self.low) / self.bins
+
+    @property
+    def total(self) -> int:
+        """Number of samples added, including out-of-range ones."""
+        return sum(self.counts) + self.underflow + self.overflow
+
+    def add(self, value: float, weight: int = 1) -> None:
+        """Add one sample (optionally with an integer weight)."""
+        if value < self.low:
+            self.underflow += weight
+        elif value >= self.high:
+            self.overflow += weight
+        else:
+            index = min(int((value - self.low) / self.width), self.bins - 1)
+            self.counts[index] += weight
+
+    def add_many(self, values: Iterable[float]) -> None:
+        """Add every sample from an iterable."""
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: FixedBinHistogram) -> FixedBinHistogram:
+        """Merge another histogram with identical bins (in place) and return self."""
+        if (self.low, self.high, self.bins) != (other.low, other.high, other.bins):
+            raise ValueError("Cannot merge histograms with different bins")
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        return self
+
+    def edges(self) -> list[float]:
+        """Bin edges (bins + 1 values)."""
+        return [self.low + i * self.width for i in range(self.bins + 1)]
+
+    def quantile(self, q: float) -> float:
+        """Approximate quantile, interpolated linearly inside the bin."""
+        total = self.total
+        if total == 0:
+            return math.nan
+        rank = q * total
+        seen = self.underflow
+        if rank <= seen:
+            return self.low
+        for i, count in enumerate(self.counts):
+            if seen + count >= rank and count > 0:
+                return self.low + (i + (rank - seen) / count) * self.width
+            seen += count
+        return self.high
+
+
+class QuantileSketch:
+    """
+    Relative-error quantile sketch (DDSketch-style logarithmic buckets).
+
+    Every quantile estimate is within ``relative_accuracy`` of a true
+    sample value. Memory grows with the log of the value range, not with
+    the number of samples, and sketches with the same accuracy merge
+    exactly by adding bucket counts.
+    """
+
+    __slots__ = ("relative_accuracy", "max_buckets", "_gamma", "_log_gamma",
+                 "buckets", "zero_count", "count", "min", "max")
+
+    def __init__(self, relative_accuracy: float = 0.005, max_buckets: int = 2048):
+        """
+        Create an empty sketch.
+
+        Args:
+            relative_accuracy: Target relative error of quantile estimates
+            max_buckets: Bucket limit; lowest buckets are collapsed beyond it
+        """
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError(f"Relative accuracy must be in (0, 1), got {relative_accuracy}")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.buckets: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float, weight: int = 1) -> None:
+        """Add one non-negative sample (optionally with an integer weight)."""
+        if value < 0:
+            raise ValueError(f"QuantileSketch only accepts non-negative values, got {value}")
+        if value == 0:
+            self.zero_count += weight
+        else:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self.buckets[key] = self.buckets.get(key, 0) + weight
+            if len(self.buckets) > self.max_buckets:
+                self._collapse()
+        self.count += weight
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def add_many(self, values: Iterable[float]) -> None:
+        """Add every sample from an iterable."""
+        for value in values:
+            self.add(value)
+
+    def _collapse(self) -> None:
+        """Fold the lowest buckets together to honour the bucket limit."""
+        keys = sorted(self.buckets)
+        excess = len(keys) - self.max_buckets
+        target = keys[excess]
+        for key in keys[:excess]:
+            self.buckets[target] += self.buckets.pop(key)
+
+    def merge(self, other: QuantileSketch) -> QuantileSketch:
+        """Merge another sketch with the same accuracy (in place) and return self."""
+        if self.relative_accuracy != other.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the q-quantile.
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Estimated value (NaN if the sketch is empty)
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError(f"Quantile must be between 0 and 1, got {q}")
+        if self.count == 0:
+            return math.nan
+
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen > rank:
+                estimate = 2 * self._gamma ** key / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def percentiles(self, *qs: float) -> dict[float, float]:
+        """Estimate several quantiles at once (defaults to p50/p90/p99)."""
+        return {q: self.quantile(q) for q in (qs or (0.5, 0.9, 0.99))}
+
+
+class PullStatistics:
+    """
+    Combined accumulator for pull-count samples (e.g. pulls-to-featured).
+
+    Bundles moments, a per-pull histogram and a quantile sketch so that a
+    worker only has to ship one object back to be merged.
+    """
+
+    __slots__ = ("moments", "histogram", "sketch")
+
+    def __init__(self, max_pulls: int = 240, relative_accuracy: float = 0.005):
+        """
+        Create an empty accumulator.
+
+        Args:
+            max_pulls: Largest pull count with its own histogram bin
+            relative_accuracy: Relative accuracy of the quantile sketch
+        """
+        self.moments = RunningMoments()
+        self.histogram = FixedBinHistogram.for_pulls(max_pulls)
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    def add(self, pulls: int) -> None:
+        """Add one sample."""
+        self.moments.add(pulls)
+        self.histogram.add(pulls)
+        self.sketch.add(pulls)
+
+    def add_many(self, values: Iterable[int]) -> None:
+        """Add every sample from an iterable."""
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: PullStatistics) -> PullStatistics:
+        """Merge another accumulator (in place) and return self."""
+        self.moments.merge(other.moments)
+        self.histogram.merge(other.histogram)
+        self.sketch.merge(other.sketch)
+        return self
+
+    @property
+    def count(self) -> int:
+        """Number of samples added."""
+        return self.moments.count
+
+    def percentiles(self, *qs: float) -> dict[float, float]:
+        """Estimate quantiles (defaults to p50/p90/p99)."""
+        return self.sketch.percentiles(*qs)
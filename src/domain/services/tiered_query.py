@@ -0,0 +1,291 @@
+"""Accuracy-tiered distribution queries domain service."""
+
+import math
+import time
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Optional
+
+import numpy as np
+
+from ..entities import PityState
+from ..value_objects import AccuracyMode, GameRules
+from .adaptive_monte_carlo import AdaptiveMonteCarlo
+from .banner_plan_dp import BannerPlanDP
+from .compiled_rules import compile_rules
+from .pity_simulator import RandomGenerator
+from .pull_kernel import KernelState, PullKernel
+
+
+# Berry-Esseen constant for i.i.d. sums (Shevtsova, 2011)
+BERRY_ESSEEN = 0.4748
+
+
+@dataclass(frozen=True)
+class TieredAnswer:
+    """
+    Answer to a distribution query and how it was obtained.
+
+    ``error`` is a rigorous bound for EXACT (pruned mass), the confidence
+    interval half-width for VERIFY and an approximation estimate for FAST.
+    """
+    value: float
+    error: float
+    mode: AccuracyMode
+    elapsed: float
+
+    @property
+    def lower(self) -> float:
+        return max(0.0, self.value - self.error)
+
+    @property
+    def upper(self) -> float:
+        return min(1.0, self.value + self.error)
+
+
+class TieredProbabilityService:
+    """
+    Domain service answering featured-copy queries at a chosen accuracy.
+
+    FAST splits the count of featured units in N pulls into the first
+    featured pull, whose distribution is computed exactly from the current
+    pity (and clamped at the banner guarantee), and the i.i.d. gaps after
+    it (pity 0, no guarantee), whose sum is approximated by the central
+    limit theorem. Its error is the Berry-Esseen bound of that sum, so a
+    single copy is answered exactly. EXACT runs BannerPlanDP; VERIFY runs
+    Monte Carlo on the pull kernel. AUTO estimates the DP cost from
+    previous runs and only uses FAST when the DP would not fit the
+    latency budget and FAST's error bound is within ``fast_tolerance``.
+    """
+
+    def __init__(
+        self,
+        rules: GameRules,
+        random_gen: Optional[RandomGenerator] = None,
+        monte_carlo: Optional[AdaptiveMonteCarlo] = None,
+        epsilon: float = 1e-12,
+        exact_seconds_per_pull: float = 1e-4,
+        fast_tolerance: float = 0.05,
+    ):
+        """
+        Initialize service.
+
+        Args:
+            rules: Game rules
+            random_gen: Random number generator (required for VERIFY)
+            monte_carlo: Monte Carlo runner for VERIFY
+            epsilon: Pruning threshold of the exact DP
+            exact_seconds_per_pull: Initial DP cost estimate, refined by every EXACT run
+            fast_tolerance: Largest FAST error bound AUTO accepts
+        """
+        self.rules = rules
+        self.random_gen = random_gen
+        self.monte_carlo = monte_carlo or AdaptiveMonteCarlo(chunk_size=2_000, min_samples=2_000, max_samples=200_000)
+        self.exact = BannerPlanDP(rules, epsilon)
+        self.exact_seconds_per_pull = exact_seconds_per_pull
+        self.fast_tolerance = fast_tolerance
+        self._gap_pmf: Optional[np.ndarray] = None
+        self._gap_moments: Optional[tuple[float, float, float]] = None
+
+    def featured_gap_pmf(self, tail: float = 1e-15) -> np.ndarray:
+        """
+        Distribution of the pulls between featured units when no guarantee
+        applies (from pity 0); index i is a gap of i + 1 pulls.
+
+        Args:
+            tail: Probability mass left when the distribution is truncated
+        """
+        if self._gap_pmf is not None:
+            return self._gap_pmf
+        h = compile_rules(self.rules).hazard
+        win = self.rules.prob_50_50
+        mass = np.zeros(h.size)
+        mass[0] = 1.0
+        pmf = []
+        while mass.sum() > tail:
+            hits = mass * h
+            total = hits.sum()
+            pmf.append(win * total)
+            miss = mass - hits
+            mass = np.zeros_like(mass)
+            mass[1:] = miss[:-1]
+            mass[-1] += miss[-1]
+            mass[0] += (1 - win) * total
+        self._gap_pmf = np.array(pmf) / sum(pmf)
+        return self._gap_pmf
+
+    def featured_gap_moments(self) -> tuple[float, float, float]:
+        """
+        Mean, variance and third absolute central moment of the pulls
+        between featured units when no guarantee applies (from pity 0).
+        """
+        if self._gap_moments is not None:
+            return self._gap_moments
+        pmf = self.featured_gap_pmf()
+        gaps = np.arange(1, len(pmf) + 1)
+        mean = float(gaps @ pmf)
+        variance = float(((gaps - mean) ** 2) @ pmf)
+        third = float((np.abs(gaps - mean) ** 3) @ pmf)
+        self._gap_moments = (mean, variance, third)
+        return self._gap_moments
+
+    def first_featured_pmf(self, state: PityState, featured_obtained: bool = False) -> np.ndarray:
+        """
+        Distribution of the pull bringing the next featured unit from a state.
+
+        The first 6★ comes from the survival curve of the current pity; a
+        lost 50/50 is followed by a full gap from pity 0. Before the banner
+        guarantee, all remaining mass lands on the guaranteed pull.
+
+        Returns:
+            Probabilities, index i is the (i + 1)-th next pull
+        """
+        survival = compile_rules(self.rules).survival[min(state.pulls_without_6_star, self.rules.hard_pity)]
+        first_6_star = survival[:-1] - survival[1:]
+        win = self.rules.prob_50_50
+        # After a lost 50/50 the next featured is one more gap away
+        lost = np.convolve(first_6_star, self.featured_gap_pmf())
+        pmf = np.zeros(len(lost) + 1)
+        pmf[1:] = (1 - win) * lost
+        pmf[:len(first_6_star)] += win * first_6_star
+
+        to_guarantee = self.rules.featured_guarantee - state.banner_pulls
+        if not featured_obtained and to_guarantee > 0:
+            pmf = pmf[:to_guarantee]
+            pmf[-1] = max(0.0, 1.0 - pmf[:-1].sum())
+        return pmf
+
+    def fast_error_bound(self, state: PityState, pulls: int, copies: int) -> float:
+        """Berry-Esseen bound of FAST for a query (0 when it is exact)."""
+        gaps = copies - self._bonus_dupes(state, pulls, self.rules.bonus_dupe) - 1
+        if gaps <= 0 or pulls == 0:
+            return 0.0
+        _, variance, third = self.featured_gap_moments()
+        return min(1.0, BERRY_ESSEEN * third / (variance ** 1.5 * math.sqrt(gaps)))
+
+    @staticmethod
+    def _bonus_dupes(state: PityState, pulls: int, bonus_dupe: int) -> int:
+        return (state.total_pulls + pulls) // bonus_dupe - state.total_pulls // bonus_dupe
+
+    def _fast(self, state: PityState, pulls: int, copies: int, featured_obtained: bool) -> tuple[float, float]:
+        """First passage from the state plus a CLT over the later gaps, as P(copies >= k)."""
+        needed = copies - self._bonus_dupes(state, pulls, self.rules.bonus_dupe)
+        if needed <= 0:
+            return 1.0, 0.0
+        if pulls == 0:
+            return 0.0, 0.0
+        first = self.first_featured_pmf(state, featured_obtained)[:pulls]
+        if needed == 1:
+            return min(1.0, float(first.sum())), 0.0
+        # P(T1 + S_{n} <= pulls) with S_n ~ Normal, conditioned on T1 = t
+        mean, variance, _ = self.featured_gap_moments()
+        gaps = needed - 1
+        room = pulls - np.arange(1, len(first) + 1) + 0.5
+        z = (room - gaps * mean) / math.sqrt(gaps * variance)
+        normal = NormalDist()
+        value = float(first @ np.array([normal.cdf(x) for x in z]))
+        return min(1.0, value), self.fast_error_bound(state, pulls, copies)
+
+    def _exact(self, state: PityState, pulls: int, copies: int, featured_obtained: bool) -> tuple[float, float]:
+        start = time.perf_counter()
+        result = self.exact.evaluate(state, [pulls], featured_obtained)
+        if pulls:
+            observed = (time.perf_counter() - start) / pulls
+            self.exact_seconds_per_pull = 0.5 * self.exact_seconds_per_pull + 0.5 * observed
+        lower, upper = result.probability_at_least(copies)
+        return lower, upper - lower
+
+    def _verify(
+        self,
+        state: PityState,
+        pulls: int,
+        copies: int,
+        featured_obtained: bool,
+        target_half_width: float,
+    ) -> tuple[float, float]:
+        if self.random_gen is None:
+            raise ValueError("VERIFY mode needs a random generator")
+        kernel = PullKernel(self.rules)
+        random = self.random_gen.random
+        start = KernelState.from_pity_state(state, featured_obtained)
+
+        def trial() -> bool:
+            current = start
+            obtained = 0
+            for _ in range(pulls):
+                current, outcome = kernel.step(current, random(), random())
+                obtained += outcome.featured + outcome.bonus_dupe
+                if obtained >= copies:
+                    return True
+            return obtained >= copies
+
+        interval = self.monte_carlo.estimate_proportion(trial, target_half_width)
+        return interval.estimate, interval.half_width
+
+    def choose_mode(
+        self,
+        state: PityState,
+        pulls: int,
+        copies: int,
+        latency_budget: Optional[float],
+    ) -> AccuracyMode:
+        """
+        Pick EXACT or FAST for a query.
+
+        Args:
+            state: Current pity state
+            pulls: Horizon of the query
+            copies: Copies required
+            latency_budget: Seconds available (None = no limit)
+
+        Returns:
+            FAST if the DP's estimated cost exceeds the budget and FAST's
+            error bound is within ``fast_tolerance``, EXACT otherwise
+        """
+        if latency_budget is None or pulls * self.exact_seconds_per_pull <= latency_budget:
+            return AccuracyMode.EXACT
+        if self.fast_error_bound(state, pulls, copies) <= self.fast_tolerance:
+            return AccuracyMode.FAST
+        return AccuracyMode.EXACT
+
+    def featured_copies_at_least(
+        self,
+        state: PityState,
+        pulls: int,
+        copies: int = 1,
+        featured_obtained: bool = False,
+        mode: AccuracyMode = AccuracyMode.AUTO,
+        latency_budget: Optional[float] = None,
+        target_half_width: float = 0.005,
+    ) -> TieredAnswer:
+        """
+        Probability of obtaining at least ``copies`` featured copies
+        (bonus dupes included) within the next ``pulls`` pulls.
+
+        Args:
+            state: Current pity state
+            pulls: Number of pulls
+            copies: Copies required
+            featured_obtained: Whether the featured unit was already obtained
+                on this banner
+            mode: Accuracy mode
+            latency_budget: Seconds available, used by AUTO
+            target_half_width: Confidence interval half-width for VERIFY
+
+        Returns:
+            Probability with its error and the mode actually used
+        """
+        if pulls < 0:
+            raise ValueError(f"Pulls must be non-negative, got {pulls}")
+        started = time.perf_counter()
+        if mode == AccuracyMode.AUTO:
+            mode = self.choose_mode(state, pulls, copies, latency_budget)
+
+        if mode == AccuracyMode.FAST:
+            value, error = self._fast(state, pulls, copies, featured_obtained)
+        elif mode == AccuracyMode.EXACT:
+            value, error = self._exact(state, pulls, copies, featured_obtained)
+        else:
+            value, error = self._verify(state, pulls, copies, featured_obtained, target_half_width)
+
+        return TieredAnswer(value=value, error=error, mode=mode, elapsed=time.perf_counter() - started)
@@ -0,0 +1,10 @@
+"""Timestamp helpers shared by the history services."""
+
+from datetime import datetime, timezone
+
+
+def posix_timestamp(when: datetime) -> float:
+    """POSIX seconds; naive datetimes are taken as UTC."""
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return when.timestamp()
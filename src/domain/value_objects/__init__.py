@@ -3,5 +3,7 @@
 from .probability import Probability
 from .pity_count import PityCount, PullCount
 from .game_rules import GameRules
+from .confidence_interval import ConfidenceInterval
+from .accuracy_mode import AccuracyMode
 
-__all__ = ["Probability", "PityCount", "PullCount", "GameRules"]
+__all__ = ["Probability", "PityCount", "PullCount", "GameRules", "ConfidenceInterval", "AccuracyMode"]
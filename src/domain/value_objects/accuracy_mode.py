@@ -0,0 +1,18 @@
+"""Accuracy mode value object."""
+
+from enum import Enum
+
+
+class AccuracyMode(str, Enum):
+    """
+    How a distribution query is answered.
+
+    - FAST: closed-form renewal/normal approximation (sub-millisecond)
+    - EXACT: dynamic programming over the pity state space
+    - VERIFY: Monte Carlo simulation with a confidence interval
+    - AUTO: EXACT if it fits the latency budget, FAST otherwise
+    """
+    FAST = "fast"
+    EXACT = "exact"
+    VERIFY = "verify"
+    AUTO = "auto"
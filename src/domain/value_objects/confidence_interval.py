@@ -0,0 +1,27 @@
+"""Confidence interval value object."""
+
+from pydantic import BaseModel, Field
+
+
+class ConfidenceInterval(BaseModel):
+    """
+    A Monte Carlo estimate together with its confidence interval.
+
+    Immutable value object.
+    """
+    estimate: float = Field(description="Point estimate")
+    lower: float = Field(description="Lower bound of the interval")
+    upper: float = Field(description="Upper bound of the interval")
+    confidence: float = Field(gt=0.0, lt=1.0, description="Confidence level (e.g. 0.95)")
+    samples: int = Field(ge=0, description="Number of samples used")
+    converged: bool = Field(description="Whether the target precision was reached")
+
+    model_config = {"frozen": True}
+
+    @property
+    def half_width(self) -> float:
+        """Half the width of the interval."""
+        return (self.upper - self.lower) / 2
+
+    def __str__(self) -> str:
+        return f"{self.estimate:.6f} [{self.lower:.6f}, {self.upper:.6f}] @ {self.confidence:.0%}"
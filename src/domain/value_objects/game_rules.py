@@ -1,6 +1,12 @@
 """Game rules configuration value object."""
 
-from pydantic import BaseModel, Field
+import hashlib
+import json
+from functools import cached_property
+from typing import Any, Mapping, Optional
+
+from pydantic import BaseModel, Field, model_validator
+from typing_extensions import Self
 
 
 class GameRules(BaseModel):
@@ -8,6 +14,9 @@ class GameRules(BaseModel):
     Immutable game rules configuration for Arknights: Endfield pity system.
     
     This encapsulates all the constants that define the game mechanics.
+    The 6★ rate per pull is a hazard table indexed by pulls without 6★;
+    by default it is generated from the linear soft pity rule, but any
+    curve can be supplied through ``hazard_curve``.
     """
     # Base probabilities
     prob_6_star_base: float = Field(default=0.008, description="Base 6★ probability (0.8%)")
@@ -25,8 +34,96 @@ class GameRules(BaseModel):
     bonus_dupe: int = Field(default=240, description="Bonus dupe at pull N")
     free_pull_reward: int = Field(default=60, description="Free 10-pull reward at pull N")
     
+    # Explicit 6★ hazard curve (None = linear soft pity rule)
+    hazard_curve: tuple[float, ...] | None = Field(
+        default=None,
+        description="6★ probability per pull, indexed by pulls without 6★ (length = hard_pity)"
+    )
+    
     model_config = {"frozen": True}
     
+    @model_validator(mode="after")
+    def validate_hazard_curve(self) -> Self:
+        """Ensure an explicit hazard curve is a valid per-pull probability table."""
+        if self.hazard_curve is None:
+            return self
+        if len(self.hazard_curve) != self.hard_pity:
+            raise ValueError(
+                f"Hazard curve must have {self.hard_pity} entries (one per pull), got {len(self.hazard_curve)}"
+            )
+        if any(not 0.0 <= p <= 1.0 for p in self.hazard_curve):
+            raise ValueError("Hazard curve values must be between 0 and 1")
+        if self.hazard_curve[-1] != 1.0:
+            raise ValueError("Hazard curve must reach 1.0 at hard pity")
+        return self
+    
+    @staticmethod
+    def linear_hazard_curve(
+        prob_6_star_base: float,
+        soft_pity_start: int,
+        soft_pity_increment: float,
+        hard_pity: int
+    ) -> tuple[float, ...]:
+        """
+        Generate the linear soft pity hazard curve.
+        
+        - Base rate before pull ``soft_pity_start``
+        - +increment for each pull from ``soft_pity_start`` on
+        - 100% at pull ``hard_pity``
+        
+        Returns:
+            6★ probability for pulls_without_6_star = 0 .. hard_pity - 1
+        """
+        curve = []
+        for t in range(hard_pity):
+            if t >= hard_pity - 1:
+                curve.append(1.0)
+            elif t >= soft_pity_start - 1:
+                pulls_in_soft = t - (soft_pity_start - 1) + 1
+                curve.append(min(prob_6_star_base + pulls_in_soft * soft_pity_increment, 1.0))
+            else:
+                curve.append(prob_6_star_base)
+        return tuple(curve)
+    
+    @cached_property
+    def hazard_table(self) -> tuple[float, ...]:
+        """
+        6★ probability indexed by pulls without 6★, for 0 .. hard_pity.
+        
+        The extra last entry covers a state already sitting at hard pity,
+        so lookups never need bounds checks or branches.
+        """
+        curve = self.hazard_curve or self.linear_hazard_curve(
+            self.prob_6_star_base, self.soft_pity_start, self.soft_pity_increment, self.hard_pity
+        )
+        return curve + (1.0,)
+    
+    @cached_property
+    def fingerprint(self) -> str:
+        """
+        Stable content hash of the rules (hex SHA-256).
+        
+        Computed from the canonical JSON of every field, with the hazard
+        curve replaced by the effective table, so two rule sets that behave
+        identically share one fingerprint across processes and runs.
+        """
+        content = self.model_dump(mode="json")
+        content["hazard_curve"] = list(self.hazard_table)
+        canonical = json.dumps(content, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    
+    def model_copy(self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False) -> Self:
+        """
+        Copy the rules, re-validating when fields are updated.
+        
+        An update builds a new instance from the merged fields, so it is
+        validated and ``hazard_table``/``fingerprint`` are derived from
+        the new values instead of being copied from this instance's cache.
+        """
+        if update:
+            return type(self)(**{**self.model_dump(), **update})
+        return super().model_copy(deep=deep)
+    
     @classmethod
     def default(cls) -> "GameRules":
         """Get default game rules."""
@@ -213,6 +213,10 @@ class PityCalculatorMenu:
         # Simplified version - show first 120 pulls
         rows = self.show_prob_table_uc.execute(120)
         self.presenter.show_probability_table(rows[:80], "FEATURED 6★ PROBABILITY TABLE (Phase 1)")
+        rules = self.show_prob_table_uc.rules
+        self.presenter.show_featured_graph(
+            self.show_prob_table_uc.featured_curve(), rules.soft_pity_start, rules.hard_pity
+        )
     
     def option_load_save(self) -> None:
         """Load or save state."""
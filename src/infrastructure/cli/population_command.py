@@ -0,0 +1,67 @@
+"""
+Population analytics command.
+
+Usage:
+    python -m src.infrastructure.cli.population_command pulls.jsonl.gz [--workers N] [--chunk-lines N]
+"""
+
+import argparse
+from pathlib import Path
+from typing import Optional, Sequence
+
+from src.domain.value_objects import GameRules
+from src.application.dto import PopulationReportDTO
+from src.application.ports import OutputPort
+from src.application.use_cases import AnalyzePopulationUseCase
+from src.infrastructure.persistence.jsonl_pull_records import JsonlPullRecordSource
+from src.infrastructure.presentation.console_presenter import ConsolePresenter
+
+
+def show_population_report(report: PopulationReportDTO, presenter: OutputPort) -> None:
+    """Display a population report."""
+    presenter.show_message("\n" + "=" * 60)
+    presenter.show_message("  POPULATION STATISTICS")
+    presenter.show_message("=" * 60)
+    presenter.show_data({
+        "Players": f"{report.players:,}",
+        "Pulls": f"{report.pulls:,}",
+        "6★ pulls": f"{report.six_stars:,} ({report.six_star_rate:.3%})",
+        "5★ pulls": f"{report.five_stars:,}",
+        "50/50 record": f"{report.won_50_50:,} won / {report.lost_50_50:,} lost ({report.win_rate_50_50:.2%})",
+        "6★ in soft pity": f"{report.soft_pity_share:.2%}",
+        "Featured obtained": f"{report.featured_obtained:,}",
+        "Mean pulls per featured": f"{report.mean_pulls_per_featured:.2f}",
+    })
+    if report.pulls_per_featured_percentiles:
+        presenter.show_table(
+            ["Percentile", "Pulls per featured"],
+            [[f"p{q * 100:g}", f"{v:.0f}"] for q, v in report.pulls_per_featured_percentiles.items()],
+        )
+    cycles = sum(report.cycle_lengths)
+    if cycles:
+        presenter.show_table(
+            ["6★ at pull", "Share"],
+            [[length, f"{count / cycles:.2%}"] for length, count in enumerate(report.cycle_lengths) if count],
+        )
+    if report.players:
+        presenter.show_table(
+            ["Final pity", "Players"],
+            [[pity, f"{count:,} ({count / report.players:.2%})"] for pity, count in enumerate(report.final_pity) if count],
+        )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Parse arguments, analyze the dataset and print the report."""
+    parser = argparse.ArgumentParser(description="Population statistics over a JSONL pull record dataset.")
+    parser.add_argument("dataset", type=Path, help="JSONL file, optionally gzip-compressed")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunk-lines", type=int, default=50_000, help="Records per chunk")
+    args = parser.parse_args(argv)
+
+    source = JsonlPullRecordSource(args.dataset, chunk_lines=args.chunk_lines)
+    report = AnalyzePopulationUseCase(GameRules.default(), workers=args.workers).execute(source)
+    show_population_report(report, ConsolePresenter())
+
+
+if __name__ == "__main__":
+    main()
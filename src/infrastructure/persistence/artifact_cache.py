@@ -0,0 +1,182 @@
+"""On-disk cache of precomputed probability artifacts."""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+
+# Bump whenever the meaning or layout of any stored artifact changes
+FORMAT_VERSION = 1
+
+
+class NpyArtifactCache:
+    """
+    Concrete implementation of the domain ArtifactStore using ``.npy`` files.
+
+    Layout: ``<directory>/v<FORMAT_VERSION>/<fingerprint>/<name>.npy`` with a
+    ``<name>.json`` manifest holding the SHA-256 and size of the array file.
+    Arrays are opened with ``mmap_mode="r"``, so worker processes share
+    the page cache instead of each holding a copy. The checksum is verified
+    once per file per process; a mismatch discards the artifact so it is
+    rebuilt. When the total size exceeds ``max_bytes`` the least recently
+    used artifacts are evicted, and directories of older format versions
+    are always removed.
+
+    Defaults to ~/.endfield_pity_cache
+    """
+
+    def __init__(self, directory: Optional[Path] = None, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Initialize cache.
+
+        Args:
+            directory: Cache root (defaults to ~/.endfield_pity_cache)
+            max_bytes: Total size of stored arrays kept before evicting
+        """
+        if directory is None:
+            directory = Path.home() / ".endfield_pity_cache"
+        self.directory = Path(directory)
+        self.version_dir = self.directory / f"v{FORMAT_VERSION}"
+        self.max_bytes = max_bytes
+        self._verified: set[Path] = set()
+
+    def _paths(self, fingerprint: str, name: str) -> tuple[Path, Path]:
+        """Array and manifest paths of an artifact."""
+        if not name.isidentifier():
+            raise ValueError(f"Artifact name must be an identifier, got {name!r}")
+        folder = self.version_dir / fingerprint
+        return folder / f"{name}.npy", folder / f"{name}.json"
+
+    @staticmethod
+    def _sha256(path: Path) -> str:
+        """Checksum of a file, read in blocks."""
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _discard(self, array_path: Path, manifest_path: Path) -> None:
+        """Remove a (possibly partial or corrupt) artifact."""
+        self._verified.discard(array_path)
+        for path in (array_path, manifest_path):
+            path.unlink(missing_ok=True)
+
+    def load(self, fingerprint: str, name: str) -> Optional[np.ndarray]:
+        """
+        Load an artifact as a read-only memory map.
+
+        Returns None if the artifact is missing or fails its integrity check.
+        """
+        array_path, manifest_path = self._paths(fingerprint, name)
+        if not array_path.exists() or not manifest_path.exists():
+            return None
+
+        try:
+            if array_path not in self._verified:
+                manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+                if (
+                    manifest.get("format_version") != FORMAT_VERSION
+                    or manifest.get("bytes") != array_path.stat().st_size
+                    or manifest.get("sha256") != self._sha256(array_path)
+                ):
+                    self._discard(array_path, manifest_path)
+                    return None
+                self._verified.add(array_path)
+            array = np.load(array_path, mmap_mode="r", allow_pickle=False)
+        except (OSError, ValueError):
+            self._discard(array_path, manifest_path)
+            return None
+
+        # Manifest mtime doubles as the LRU timestamp
+        os.utime(manifest_path)
+        return array
+
+    def save(self, fingerprint: str, name: str, array: np.ndarray) -> None:
+        """
+        Store an artifact atomically.
+
+        The array and its manifest are each written to a temporary file and
+        renamed into place, so concurrent readers never see a partial file.
+        """
+        array_path, manifest_path = self._paths(fingerprint, name)
+        array_path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_name = tempfile.mkstemp(dir=array_path.parent, suffix=".tmp")
+        manifest_tmp_name: Optional[str] = None
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, np.ascontiguousarray(array), allow_pickle=False)
+            tmp_path = Path(tmp_name)
+            manifest = {
+                "format_version": FORMAT_VERSION,
+                "fingerprint": fingerprint,
+                "name": name,
+                "dtype": str(array.dtype),
+                "shape": list(array.shape),
+                "bytes": tmp_path.stat().st_size,
+                "sha256": self._sha256(tmp_path),
+            }
+            manifest_fd, manifest_tmp_name = tempfile.mkstemp(dir=array_path.parent, suffix=".tmp")
+            with os.fdopen(manifest_fd, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(tmp_path, array_path)
+            os.replace(manifest_tmp_name, manifest_path)
+        except Exception as e:
+            Path(tmp_name).unlink(missing_ok=True)
+            if manifest_tmp_name is not None:
+                Path(manifest_tmp_name).unlink(missing_ok=True)
+            raise IOError(f"Failed to save artifact {name}: {e}")
+
+        self._verified.add(array_path)
+        self.evict()
+
+    def get_or_build(self, fingerprint: str, name: str, build: Callable[[], np.ndarray]) -> np.ndarray:
+        """Load an artifact, building and storing it on a miss."""
+        array = self.load(fingerprint, name)
+        if array is not None:
+            return array
+        array = build()
+        self.save(fingerprint, name, array)
+        loaded = self.load(fingerprint, name)
+        return loaded if loaded is not None else array
+
+    def size(self) -> int:
+        """Total bytes of stored arrays for the current format version."""
+        return sum(path.stat().st_size for path in self.version_dir.glob("*/*.npy"))
+
+    def evict(self) -> None:
+        """Drop stale format versions, then LRU artifacts until under max_bytes."""
+        if self.directory.exists():
+            for stale in self.directory.glob("v*"):
+                if stale != self.version_dir and stale.is_dir():
+                    shutil.rmtree(stale, ignore_errors=True)
+
+        entries = []
+        for manifest_path in self.version_dir.glob("*/*.json"):
+            array_path = manifest_path.with_suffix(".npy")
+            if array_path.exists():
+                entries.append((manifest_path.stat().st_mtime_ns, array_path.stat().st_size, array_path, manifest_path))
+
+        total = sum(size for _, size, _, _ in entries)
+        for _, size, array_path, manifest_path in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            self._discard(array_path, manifest_path)
+            total -= size
+            if not any(array_path.parent.iterdir()):
+                array_path.parent.rmdir()
+
+    def clear(self) -> None:
+        """Delete every stored artifact."""
+        self._verified.clear()
+        for version_dir in self.directory.glob("v*"):
+            if version_dir.is_dir():
+                shutil.rmtree(version_dir)
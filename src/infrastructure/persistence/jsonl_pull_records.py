@@ -0,0 +1,86 @@
+"""JSONL pull record dataset reader."""
+
+import gzip
+import json
+from collections.abc import Iterator
+from itertools import islice
+from pathlib import Path
+from typing import BinaryIO
+
+import numpy as np
+
+from src.domain.entities import CharacterType, PullRecordBatch
+from src.domain.entities.pull_record_batch import NO_50_50
+
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+class JsonlPullRecordSource:
+    """
+    Concrete implementation of PullRecordSource for JSON Lines files.
+
+    One pull per line, with the PullResult fields plus the player and the
+    banner, records grouped by player in pull order::
+
+        {"player": "p1", "banner": "b1", "rarity": 6, "character_type": "featured", "won_50_50": true}
+
+    ``character_type`` and ``won_50_50`` may be omitted for 4★/5★ pulls.
+    Files starting with the gzip magic bytes are decompressed on the fly.
+    Chunks are lists of raw lines; decoding them is left to the workers.
+    """
+
+    def __init__(self, file_path: Path, chunk_lines: int = 50_000):
+        """
+        Initialize the source.
+
+        Args:
+            file_path: Dataset path (.jsonl or gzip-compressed)
+            chunk_lines: Lines per chunk
+        """
+        if chunk_lines <= 0:
+            raise ValueError(f"chunk_lines must be positive, got {chunk_lines}")
+        self.file_path = Path(file_path)
+        self.chunk_lines = chunk_lines
+
+    def _open(self) -> BinaryIO:
+        with open(self.file_path, "rb") as f:
+            compressed = f.read(2) == GZIP_MAGIC
+        return gzip.open(self.file_path, "rb") if compressed else open(self.file_path, "rb")
+
+    def iter_chunks(self) -> Iterator[list[bytes]]:
+        """Yield lists of at most ``chunk_lines`` raw lines."""
+        with self._open() as f:
+            while chunk := list(islice(f, self.chunk_lines)):
+                yield chunk
+
+    def parse(self, chunk: list[bytes]) -> PullRecordBatch:
+        """Decode raw lines into columns (blank lines are skipped)."""
+        players: list[str] = []
+        banners: list[str] = []
+        rarities: list[int] = []
+        featured: list[bool] = []
+        won_50_50: list[int] = []
+        for line in chunk:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                rarity = int(record["rarity"])
+                players.append(str(record["player"]))
+                banners.append(str(record["banner"]))
+            except (ValueError, KeyError, TypeError) as e:
+                raise ValueError(f"Invalid pull record {line[:200]!r}: {e}")
+            if rarity not in (4, 5, 6):
+                raise ValueError(f"Invalid rarity {rarity} in pull record {line[:200]!r}")
+            won = record.get("won_50_50")
+            rarities.append(rarity)
+            featured.append(record.get("character_type") == CharacterType.FEATURED.value)
+            won_50_50.append(NO_50_50 if won is None else int(bool(won)))
+        return PullRecordBatch(
+            players=tuple(players),
+            banners=tuple(banners),
+            rarities=np.array(rarities, dtype=np.uint8),
+            featured=np.array(featured, dtype=bool),
+            won_50_50=np.array(won_50_50, dtype=np.int8),
+        )
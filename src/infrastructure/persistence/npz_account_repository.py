@@ -0,0 +1,75 @@
+"""NPZ-based snapshot repository for tracked accounts."""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from src.domain.entities import PityStateBatch
+
+
+class NpzAccountSnapshotRepository:
+    """
+    Concrete implementation of AccountSnapshotRepository using ``.npz`` files.
+
+    Every counter column and the account ids are stored as raw arrays in
+    one uncompressed archive, so saving and loading tens of thousands of
+    accounts is a handful of buffer copies. Snapshots are written to a
+    temporary file and renamed into place.
+
+    Saves to user's home directory by default: ~/.endfield_accounts.npz
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, file_path: Optional[Path] = None):
+        """
+        Initialize repository.
+
+        Args:
+            file_path: Custom file path (defaults to ~/.endfield_accounts.npz)
+        """
+        if file_path is None:
+            file_path = Path.home() / ".endfield_accounts.npz"
+        self.file_path = Path(file_path)
+
+    def save(self, account_ids: np.ndarray, batch: PityStateBatch) -> None:
+        """Save a snapshot of all tracked accounts atomically."""
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.file_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(
+                    f,
+                    format_version=np.array(self.FORMAT_VERSION),
+                    account_ids=np.asarray(account_ids, dtype=str),
+                    **{name: getattr(batch, name) for name in PityStateBatch.COLUMNS},
+                )
+            os.replace(tmp_name, self.file_path)
+        except Exception as e:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise IOError(f"Failed to save account snapshot: {e}")
+
+    def load(self) -> Optional[tuple[np.ndarray, PityStateBatch]]:
+        """
+        Load the snapshot.
+
+        Returns None if the file doesn't exist or has an unknown format.
+        """
+        if not self.file_path.exists():
+            return None
+        with np.load(self.file_path, allow_pickle=False) as data:
+            if int(data["format_version"]) != self.FORMAT_VERSION:
+                return None
+            batch = PityStateBatch(**{name: data[name] for name in PityStateBatch.COLUMNS})
+            return data["account_ids"], batch
+
+    def exists(self) -> bool:
+        """Check if a snapshot exists."""
+        return self.file_path.exists()
+
+    def delete(self) -> None:
+        """Delete the snapshot file."""
+        self.file_path.unlink(missing_ok=True)
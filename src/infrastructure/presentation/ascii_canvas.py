@@ -0,0 +1,129 @@
+"""Vectorized ASCII canvas for line charts."""
+
+from typing import Optional
+
+import numpy as np
+
+
+class AsciiCanvas:
+    """
+    Rasterizes a whole series onto a character grid at once.
+
+    The plot area has ``height + 1`` rows; a value v in [0, y_max] lands
+    on row ceil(v / y_max * height) (row 0 is the baseline). A series
+    longer than the width is downsampled to one column per bucket of
+    points, and each column draws the bucket's min-max envelope so spikes
+    and drops survive the reduction. Each row is emitted as one string.
+    """
+
+    def __init__(self, width: int = 120, height: int = 25):
+        """
+        Initialize canvas.
+
+        Args:
+            width: Plot columns
+            height: Plot rows above the baseline
+        """
+        if width <= 0 or height <= 0:
+            raise ValueError(f"Canvas size must be positive, got {width}x{height}")
+        self.width = width
+        self.height = height
+
+    def columns(self, points: int) -> np.ndarray:
+        """Column of each series index (identity when the series fits)."""
+        index = np.arange(points)
+        if points <= self.width:
+            return index
+        return index * self.width // points
+
+    def _rows(self, values: np.ndarray, y_max: float) -> np.ndarray:
+        return np.clip(np.ceil(values / y_max * self.height), 0, self.height).astype(np.int64)
+
+    def rasterize(
+        self,
+        series: np.ndarray,
+        y_max: float = 100.0,
+        markers: Optional[dict[int, str]] = None,
+        char: str = ".",
+    ) -> list[str]:
+        """
+        Draw a series.
+
+        Args:
+            series: Values in [0, y_max] (out-of-range values are not drawn)
+            y_max: Value of the top row
+            markers: Character to draw at given series indices
+            char: Character of the curve
+
+        Returns:
+            Plot rows from top to bottom
+        """
+        values = np.asarray(series, dtype=float)
+        columns = self.columns(len(values))
+        grid = np.full((self.height + 1, self.width), ord(" "), dtype=np.uint8)
+
+        visible = np.isfinite(values) & (values <= y_max)
+        low = np.full(self.width, np.inf)
+        high = np.full(self.width, -np.inf)
+        np.minimum.at(low, columns[visible], values[visible])
+        np.maximum.at(high, columns[visible], values[visible])
+        drawn = np.isfinite(low)
+        low_row = np.where(drawn, self._rows(np.where(drawn, low, 0), y_max), 1)
+        high_row = np.where(drawn, self._rows(np.where(drawn, high, 0), y_max), 0)
+        rows = np.arange(self.height + 1)[:, None]
+        grid[(rows >= low_row) & (rows <= high_row)] = ord(char)
+
+        for index, marker in (markers or {}).items():
+            if 0 <= index < len(values) and visible[index]:
+                grid[self._rows(values[index:index + 1], y_max)[0], columns[index]] = ord(marker)
+
+        return [grid[row].tobytes().decode("ascii") for row in range(self.height, -1, -1)]
+
+    def x_axis(self, points: int, ticks: list[int], first: int = 1) -> str:
+        """
+        Tick labels under the plot, each right-aligned to its column.
+
+        Args:
+            points: Series length
+            ticks: Series indices to label
+            first: Label of series index 0
+        """
+        columns = self.columns(points)
+        line = [" "] * (self.width + 8)
+        for index in sorted(ticks):
+            if not 0 <= index < points:
+                continue
+            label = str(index + first)
+            end = columns[index] + 1
+            start = max(0, end - len(label))
+            if any(c != " " for c in line[max(0, start - 1):end]):
+                continue
+            line[start:start + len(label)] = label
+        return "".join(line).rstrip()
+
+    def render(
+        self,
+        series: np.ndarray,
+        y_max: float = 100.0,
+        markers: Optional[dict[int, str]] = None,
+        ticks: Optional[list[int]] = None,
+        y_unit: str = "%",
+    ) -> list[str]:
+        """
+        Draw a series with a labelled y axis and an x axis.
+
+        Returns:
+            Chart lines, ready to be written
+        """
+        plot = self.rasterize(series, y_max, markers)
+        labels = {0: f"{y_max:g}{y_unit}", self.height // 2: f"{y_max / 2:g}{y_unit}", self.height: f"0{y_unit}"}
+        lines = [
+            f"{labels.get(i, ''):>6} {'+' if i == self.height else '|'}{row}"
+            for i, row in enumerate(plot)
+        ]
+        lines.append("       +" + "-" * self.width)
+        if ticks is None:
+            step = max(1, len(series) // 6)
+            ticks = [0] + list(range(step - 1, len(series), step))
+        lines.append("        " + self.x_axis(len(series), ticks))
+        return lines
@@ -0,0 +1,191 @@
+"""Columnar file exporter for simulation and table results."""
+
+import csv
+import os
+import tempfile
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+import numpy as np
+
+from src.domain.services import FixedBinHistogram
+
+
+class NpyStreamWriter:
+    """
+    Appends rows to a 1-D ``.npy`` file without knowing the length upfront.
+
+    The header is written with room for any row count and rewritten with
+    the final shape on close (``.npy`` headers may be padded with spaces),
+    so rows are streamed straight to disk and the result can be opened
+    with ``np.load(path, mmap_mode="r")``.
+    """
+
+    MAGIC = b"\x93NUMPY\x01\x00"
+    ALIGN = 64
+
+    def __init__(self, f: BinaryIO, dtype: np.dtype):
+        """
+        Start a file.
+
+        Args:
+            f: Binary file positioned at its start
+            dtype: Row dtype (plain or structured)
+        """
+        self.f = f
+        self.dtype = np.dtype(dtype)
+        self.rows = 0
+        self._descr = np.lib.format.dtype_to_descr(self.dtype)
+        widest = len(self._header_text(10 ** 20))
+        self._header_bytes = -(-(len(self.MAGIC) + 2 + widest + 1) // self.ALIGN) * self.ALIGN
+        f.write(self._header(0))
+
+    def _header_text(self, rows: int) -> str:
+        return repr({"descr": self._descr, "fortran_order": False, "shape": (rows,)})
+
+    def _header(self, rows: int) -> bytes:
+        length = self._header_bytes - len(self.MAGIC) - 2
+        text = self._header_text(rows).ljust(length - 1) + "\n"
+        return self.MAGIC + length.to_bytes(2, "little") + text.encode("latin1")
+
+    def append(self, rows: np.ndarray) -> None:
+        """Append rows."""
+        rows = np.ascontiguousarray(rows, dtype=self.dtype)
+        self.f.write(rows.tobytes())
+        self.rows += len(rows)
+
+    def finish(self) -> None:
+        """Write the final header."""
+        self.f.seek(0)
+        self.f.write(self._header(self.rows))
+        self.f.seek(0, os.SEEK_END)
+
+
+class ColumnarExporter:
+    """
+    Concrete implementation of ResultExporter writing NumPy or CSV files.
+
+    With ``table_format="npy"`` samples and tables become 1-D ``.npy``
+    files (tables as structured arrays, one field per column) that load
+    memory-mapped; histograms become uncompressed ``.npz`` archives.
+    With ``"csv"`` everything is streamed row by row. Chunks are written
+    as they arrive, and every file is written to a temporary name and
+    renamed into place.
+    """
+
+    FORMATS = ("npy", "csv")
+
+    def __init__(self, directory: Path, table_format: str = "npy"):
+        """
+        Initialize exporter.
+
+        Args:
+            directory: Output directory (created if missing)
+            table_format: "npy" or "csv"
+        """
+        if table_format not in self.FORMATS:
+            raise ValueError(f"table_format must be one of {self.FORMATS}, got {table_format!r}")
+        self.directory = Path(directory)
+        self.table_format = table_format
+
+    @contextmanager
+    def _atomic(self, file_name: str, mode: str) -> Iterator:
+        """Open a temporary file that replaces ``file_name`` on success."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        target = self.directory / file_name
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, mode, **({"newline": ""} if "b" not in mode else {})) as f:
+                yield f
+            os.replace(tmp_name, target)
+        except Exception as e:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise IOError(f"Failed to export {target}: {e}")
+
+    @property
+    def _suffix(self) -> str:
+        return f".{self.table_format}"
+
+    def write_samples(self, name: str, chunks: Iterable[np.ndarray]) -> Path:
+        """Write sample chunks as one ``value`` column."""
+        return self.write_table(name, ({"value": np.asarray(chunk)} for chunk in chunks), columns=("value",))
+
+    def write_table(
+        self,
+        name: str,
+        chunks: Iterable[dict[str, np.ndarray]],
+        columns: Optional[Sequence[str]] = None,
+    ) -> Path:
+        """
+        Write column chunks (a single column is stored as a plain array in ``.npy``).
+
+        Args:
+            name: File name without suffix
+            chunks: Column chunks, with the same columns in every chunk
+            columns: Column names, so an empty stream still gets a CSV
+                header (default: the columns of the first chunk)
+        """
+        file_name = name + self._suffix
+        if self.table_format == "csv":
+            with self._atomic(file_name, "w") as f:
+                writer = csv.writer(f)
+                header = list(columns) if columns is not None else None
+                if header is not None:
+                    writer.writerow(header)
+                for chunk in chunks:
+                    if header is None:
+                        header = list(chunk)
+                        writer.writerow(header)
+                    writer.writerows(zip(*(np.asarray(chunk[c]).tolist() for c in header)))
+            return self.directory / file_name
+
+        with self._atomic(file_name, "wb") as f:
+            writer: Optional[NpyStreamWriter] = None
+            for chunk in chunks:
+                if writer is None:
+                    writer = NpyStreamWriter(f, self._dtype(chunk))
+                writer.append(self._records(chunk, writer.dtype))
+            if writer is None:
+                empty = {column: np.empty(0) for column in columns or ("value",)}
+                writer = NpyStreamWriter(f, self._dtype(empty))
+            writer.finish()
+        return self.directory / file_name
+
+    @staticmethod
+    def _dtype(chunk: dict[str, np.ndarray]) -> np.dtype:
+        if len(chunk) == 1:
+            return np.asarray(next(iter(chunk.values()))).dtype
+        return np.dtype([(column, np.asarray(values).dtype) for column, values in chunk.items()])
+
+    @staticmethod
+    def _records(chunk: dict[str, np.ndarray], dtype: np.dtype) -> np.ndarray:
+        if dtype.names is None:
+            return np.asarray(next(iter(chunk.values())))
+        records = np.empty(len(next(iter(chunk.values()))), dtype=dtype)
+        for column in dtype.names:
+            records[column] = chunk[column]
+        return records
+
+    def write_histogram(self, name: str, histogram: FixedBinHistogram) -> Path:
+        """Write bin edges and counts, including underflow and overflow."""
+        edges = np.array(histogram.edges())
+        counts = np.array(histogram.counts, dtype=np.int64)
+        if self.table_format == "csv":
+            return self.write_table(name, [{
+                "low": np.concatenate([[-np.inf], edges[:-1], [histogram.high]]),
+                "high": np.concatenate([[histogram.low], edges[1:], [np.inf]]),
+                "count": np.concatenate([[histogram.underflow], counts, [histogram.overflow]]),
+            }], columns=("low", "high", "count"))
+
+        file_name = f"{name}.npz"
+        with self._atomic(file_name, "wb") as f:
+            np.savez(
+                f,
+                edges=edges,
+                counts=counts,
+                underflow=np.array(histogram.underflow),
+                overflow=np.array(histogram.overflow),
+            )
+        return self.directory / file_name
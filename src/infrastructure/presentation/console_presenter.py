@@ -1,137 +1,307 @@
 """Console output presenter."""
 
-from typing import Any
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any, Optional, TextIO
+
+import numpy as np
+
 from src.application.dto import StateInfoDTO, SimulationResultDTO, ProbabilityTableRowDTO
+from .ascii_canvas import AsciiCanvas
+
+
+class BufferedTextWriter:
+    """
+    Collects lines and writes them to a stream in large chunks.
+
+    Lines are joined and written once the buffer holds ``buffer_chars``
+    characters (and on flush), so rendering a long table costs a few
+    writes instead of one per line, and memory stays bounded by the
+    buffer size however many lines go through.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, buffer_chars: int = 1 << 16):
+        """
+        Initialize writer.
+
+        Args:
+            stream: Output stream (defaults to the current sys.stdout)
+            buffer_chars: Characters buffered before a write
+        """
+        self.stream = stream
+        self.buffer_chars = buffer_chars
+        self._lines: list[str] = []
+        self._size = 0
+
+    def line(self, text: str = "") -> None:
+        """Add one line (a trailing newline is added)."""
+        self._lines.append(text)
+        self._size += len(text) + 1
+        if self._size >= self.buffer_chars:
+            self.flush()
+
+    def lines(self, texts: Iterable[str]) -> None:
+        """Add every line from an iterable."""
+        for text in texts:
+            self.line(text)
+
+    def flush(self) -> None:
+        """Write the buffered lines."""
+        if self._lines:
+            stream = self.stream if self.stream is not None else sys.stdout
+            stream.write("\n".join(self._lines) + "\n")
+            self._lines.clear()
+            self._size = 0
 
 
 class ConsolePresenter:
     """
     Console-based output presenter.
     
-    Implements OutputPort protocol.
+    Implements OutputPort protocol. Output is built in a buffer and
+    written in large chunks; tables can be streamed from row generators
+    with a fixed column schema in constant memory.
     """
     
+    def __init__(self, stream: Optional[TextIO] = None, buffer_chars: int = 1 << 16):
+        """
+        Initialize presenter.
+        
+        Args:
+            stream: Output stream (defaults to the current sys.stdout)
+            buffer_chars: Characters buffered before a write
+        """
+        self.stream = stream
+        self.buffer_chars = buffer_chars
+    
+    @contextmanager
+    def _output(self) -> Iterator[BufferedTextWriter]:
+        """Buffered writer that is flushed when the block ends."""
+        out = BufferedTextWriter(self.stream, self.buffer_chars)
+        try:
+            yield out
+        finally:
+            out.flush()
+    
     def show_message(self, message: str) -> None:
         """Display a message."""
-        print(message)
+        with self._output() as out:
+            out.line(message)
     
     def show_error(self, error: str) -> None:
         """Display an error message."""
-        print(f"❌ Error: {error}")
+        with self._output() as out:
+            out.line(f"❌ Error: {error}")
     
     def show_data(self, data: dict[str, Any]) -> None:
         """Display structured data."""
-        for key, value in data.items():
-            print(f"{key}: {value}")
+        with self._output() as out:
+            out.lines(f"{key}: {value}" for key, value in data.items())
     
     def show_table(self, headers: list[str], rows: list[list[Any]]) -> None:
-        """Display a simple table."""
-        # Calculate column widths
+        """Display a simple table, sized to fit every cell."""
+        cells = [[str(cell) for cell in row] for row in rows]
         col_widths = [len(h) for h in headers]
-        for row in rows:
+        for row in cells:
             for i, cell in enumerate(row):
-                col_widths[i] = max(col_widths[i], len(str(cell)))
+                if len(cell) > col_widths[i]:
+                    col_widths[i] = len(cell)
+        self.stream_table(headers, cells, col_widths)
+    
+    def stream_table(self, headers: Sequence[str], rows: Iterable[Sequence[Any]], widths: Sequence[int]) -> None:
+        """
+        Display a table from a row iterable with fixed column widths.
         
-        # Print headers
-        header_line = " | ".join(h.ljust(col_widths[i]) for i, h in enumerate(headers))
-        print("\n" + header_line)
-        print("-" * len(header_line))
+        Rows are formatted and written as they are consumed, so a
+        generator of any length renders in constant memory. Cells longer
+        than their column are not truncated.
         
-        # Print rows
-        for row in rows:
-            row_line = " | ".join(str(cell).ljust(col_widths[i]) for i, cell in enumerate(row))
-            print(row_line)
+        Args:
+            headers: Column headers
+            rows: Row iterable
+            widths: Width of each column
+        """
+        with self._output() as out:
+            header_line = " | ".join(h.ljust(widths[i]) for i, h in enumerate(headers))
+            out.line("\n" + header_line)
+            out.line("-" * len(header_line))
+            row_format = " | ".join(f"{{!s:<{width}}}" for width in widths)
+            out.lines(row_format.format(*row) for row in rows)
     
     def show_state_info(self, info: StateInfoDTO) -> None:
         """Display formatted state information."""
-        print("\n" + "=" * 60)
-        print("  YOUR CURRENT STATE")
-        print("=" * 60)
-        
-        print(f"\n--- CURRENT COUNTERS ---")
-        print(f"  Pity (P):          {info.current_pity}/80")
-        print(f"  Banner Pulls (S):  {info.banner_counter}/120")
-        print(f"  Spark Dupe (D):    {info.dupe_counter}/240")
-        print(f"  5★ Guarantee:      {info.pulls_without_5_star}/10")
-        
-        print(f"\n--- PULLS TO NEXT MILESTONE ---")
-        print(f"  To 5★ Guarantee:   {info.pulls_to_5_star} pulls")
-        print(f"  To Soft Pity:      {info.pulls_to_soft_pity} pulls")
-        print(f"  To Hard Pity:      {info.pulls_to_hard_pity} pulls")
-        print(f"  To Featured:       {info.pulls_to_featured} pulls")
-        print(f"  To Bonus Dupe:     {info.pulls_to_bonus_dupe} pulls")
-        print(f"  To Free 10-pull:   {info.pulls_to_free_pull} pulls")
-        
-        print(f"\n--- STATUS ---")
-        if info.at_hard_pity:
-            print("  ⚡ HARD PITY ACTIVE - Next 6★ GUARANTEED (50/50)")
-        elif info.in_soft_pity:
-            print("  🔥 SOFT PITY ACTIVE - Increased rates")
-        else:
-            print("  📊 Base rates active")
-        
-        if info.at_featured_guarantee:
-            print("  ⭐ FEATURED GUARANTEE - Next 6★ is featured 100%")
+        with self._output() as out:
+            out.line("\n" + "=" * 60)
+            out.line("  YOUR CURRENT STATE")
+            out.line("=" * 60)
+            
+            out.line(f"\n--- CURRENT COUNTERS ---")
+            out.line(f"  Pity (P):          {info.current_pity}/80")
+            out.line(f"  Banner Pulls (S):  {info.banner_counter}/120")
+            out.line(f"  Spark Dupe (D):    {info.dupe_counter}/240")
+            out.line(f"  5★ Guarantee:      {info.pulls_without_5_star}/10")
+            
+            out.line(f"\n--- PULLS TO NEXT MILESTONE ---")
+            out.line(f"  To 5★ Guarantee:   {info.pulls_to_5_star} pulls")
+            out.line(f"  To Soft Pity:      {info.pulls_to_soft_pity} pulls")
+            out.line(f"  To Hard Pity:      {info.pulls_to_hard_pity} pulls")
+            out.line(f"  To Featured:       {info.pulls_to_featured} pulls")
+            out.line(f"  To Bonus Dupe:     {info.pulls_to_bonus_dupe} pulls")
+            out.line(f"  To Free 10-pull:   {info.pulls_to_free_pull} pulls")
+            
+            out.line(f"\n--- STATUS ---")
+            if info.at_hard_pity:
+                out.line("  ⚡ HARD PITY ACTIVE - Next 6★ GUARANTEED (50/50)")
+            elif info.in_soft_pity:
+                out.line("  🔥 SOFT PITY ACTIVE - Increased rates")
+            else:
+                out.line("  📊 Base rates active")
+            
+            if info.at_featured_guarantee:
+                out.line("  ⭐ FEATURED GUARANTEE - Next 6★ is featured 100%")
     
     def show_simulation_result(self, result: SimulationResultDTO) -> None:
         """Display simulation result."""
-        print("\n" + "=" * 60)
-        print("  SIMULATION RESULT")
-        print("=" * 60)
-        print(f"\n{result.message}")
-        print(f"\nNew pity: {result.new_pity}")
-        print(f"Banner pulls: {result.banner_pulls}")
+        with self._output() as out:
+            out.line("\n" + "=" * 60)
+            out.line("  SIMULATION RESULT")
+            out.line("=" * 60)
+            out.line(f"\n{result.message}")
+            out.line(f"\nNew pity: {result.new_pity}")
+            out.line(f"Banner pulls: {result.banner_pulls}")
     
     def show_base_rates(self, rates_info: dict) -> None:
         """Display base rates and pity system information."""
-        print("\n" + "=" * 60)
-        print("  GACHA SYSTEM - ARKNIGHTS: ENDFIELD")
-        print("=" * 60)
-        
-        base = rates_info["base_rates"]
-        print("\n--- BASE RATES ---")
-        print(f"  6★: {base['6_star']}%")
-        print(f"  5★: {base['5_star']}%")
-        print(f"  4★: {base['4_star']}%")
-        
-        pity = rates_info["pity_system"]
-        print("\n--- PITY SYSTEM ---")
-        print(f"  • 5★ Guarantee: Every {pity['5_star_guarantee']} pulls (50% featured)")
-        print(f"  • Soft Pity: Pull {pity['soft_pity_start']}+ → +{pity['soft_pity_increment']:.0f}% per pull")
-        print(f"  • Hard Pity: Pull {pity['hard_pity']} → 6★ guaranteed (50/50)")
-        print(f"  • Featured Guarantee: Pull {pity['featured_guarantee']} → Featured 100%")
-        print(f"  • Bonus Dupe: Pull {pity['bonus_dupe']} → Extra copy (repeats)")
+        with self._output() as out:
+            out.line("\n" + "=" * 60)
+            out.line("  GACHA SYSTEM - ARKNIGHTS: ENDFIELD")
+            out.line("=" * 60)
+            
+            base = rates_info["base_rates"]
+            out.line("\n--- BASE RATES ---")
+            out.line(f"  6★: {base['6_star']}%")
+            out.line(f"  5★: {base['5_star']}%")
+            out.line(f"  4★: {base['4_star']}%")
+            
+            pity = rates_info["pity_system"]
+            out.line("\n--- PITY SYSTEM ---")
+            out.line(f"  • 5★ Guarantee: Every {pity['5_star_guarantee']} pulls (50% featured)")
+            out.line(f"  • Soft Pity: Pull {pity['soft_pity_start']}+ → +{pity['soft_pity_increment']:.0f}% per pull")
+            out.line(f"  • Hard Pity: Pull {pity['hard_pity']} → 6★ guaranteed (50/50)")
+            out.line(f"  • Featured Guarantee: Pull {pity['featured_guarantee']} → Featured 100%")
+            out.line(f"  • Bonus Dupe: Pull {pity['bonus_dupe']} → Extra copy (repeats)")
+            
+            special = rates_info["special_rules"]
+            out.line("\n--- SPECIAL RULES ---")
+            out.line("  • When losing 50/50:")
+            out.line(f"    - {special['prob_prev_limited']:.2f}% for each previous limited (x2)")
+            out.line(f"    - {special['prob_standard']:.2f}% for standard 6★")
+            out.line("  • ⚠ NO featured guarantee after losing 50/50 until pull 120")
+            out.line(f"  • After {special['free_pull_reward']} pulls: Free 10-pull (next banner)")
+            
+            out.line("\n--- CARRY OVER ---")
+            out.line("  ✓ 6★ Pity (soft/hard): Carries over between banners")
+            out.line("  ✓ 5★ Guarantee: Carries over between banners")
+            out.line("  ✓ Bonus Dupe: Carries over between banners")
+            out.line("  ✗ Featured Guarantee (120): Does NOT carry over")
+    
+    @staticmethod
+    def _probability_row(pull_number: int, pity: int, probability: float, cumulative: float) -> str:
+        """One formatted probability table line."""
+        marker = ""
+        if pull_number == 65:
+            marker = " <- Soft Pity Start"
+        elif pull_number == 80:
+            marker = " <- Hard Pity (GUARANTEED)"
         
-        special = rates_info["special_rules"]
-        print("\n--- SPECIAL RULES ---")
-        print("  • When losing 50/50:")
-        print(f"    - {special['prob_prev_limited']:.2f}% for each previous limited (x2)")
-        print(f"    - {special['prob_standard']:.2f}% for standard 6★")
-        print("  • ⚠ NO featured guarantee after losing 50/50 until pull 120")
-        print(f"  • After {special['free_pull_reward']} pulls: Free 10-pull (next banner)")
+        if cumulative >= 0.999 and pull_number < 80:
+            return f"    {pull_number:3d}  |  {pity:2d}  |    {probability * 100:5.1f}%   |     {cumulative * 100:6.3f}%{marker}"
+        return f"    {pull_number:3d}  |  {pity:2d}  |    {probability * 100:5.1f}%   |      {cumulative * 100:5.1f}%{marker}"
+    
+    def _probability_header(self, out: BufferedTextWriter, title: str) -> None:
+        out.line("\n" + "=" * 95)
+        out.line(f"  {title}")
+        out.line("=" * 95)
+        out.line("\n  Pull   | Pity |  Prob. 6★  |  Cumulative Prob.")
+        out.line("  " + "-" * 85)
+    
+    def show_probability_table(self, rows: Iterable[ProbabilityTableRowDTO], title: str = "PROBABILITY TABLE") -> None:
+        """Display probability table with formatting (rows may be a generator)."""
+        with self._output() as out:
+            self._probability_header(out, title)
+            out.lines(
+                self._probability_row(row.pull_number, row.pity, row.probability, row.cumulative)
+                for row in rows
+            )
+    
+    def show_probability_columns(
+        self,
+        chunks: Iterable[dict[str, np.ndarray]],
+        title: str = "PROBABILITY TABLE",
+    ) -> None:
+        """
+        Display a probability table streamed as column chunks.
         
-        print("\n--- CARRY OVER ---")
-        print("  ✓ 6★ Pity (soft/hard): Carries over between banners")
-        print("  ✓ 5★ Guarantee: Carries over between banners")
-        print("  ✓ Bonus Dupe: Carries over between banners")
-        print("  ✗ Featured Guarantee (120): Does NOT carry over")
-    
-    def show_probability_table(self, rows: list[ProbabilityTableRowDTO], title: str = "PROBABILITY TABLE") -> None:
-        """Display probability table with formatting."""
-        print("\n" + "=" * 95)
-        print(f"  {title}")
-        print("=" * 95)
-        print("\n  Pull   | Pity |  Prob. 6★  |  Cumulative Prob.")
-        print("  " + "-" * 85)
+        Takes the chunks of ShowProbabilityTableUseCase.iter_columns, so
+        long horizons render without building row DTOs.
+        """
+        with self._output() as out:
+            self._probability_header(out, title)
+            for chunk in chunks:
+                out.lines(
+                    self._probability_row(*row)
+                    for row in zip(
+                        chunk["pull_number"].tolist(),
+                        chunk["pity"].tolist(),
+                        chunk["probability"].tolist(),
+                        chunk["cumulative"].tolist(),
+                    )
+                )
+    
+    def show_chart(
+        self,
+        title: str,
+        series: np.ndarray,
+        markers: Optional[dict[int, str]] = None,
+        legend: Optional[dict[str, str]] = None,
+        ticks: Optional[list[int]] = None,
+        width: int = 120,
+        height: int = 25,
+    ) -> None:
+        """
+        Display a line chart of percentages.
         
-        for row in rows:
-            marker = ""
-            if row.pull_number == 65:
-                marker = " <- Soft Pity Start"
-            elif row.pull_number == 80:
-                marker = " <- Hard Pity (GUARANTEED)"
-            
-            if row.cumulative >= 0.999 and row.pull_number < 80:
-                print(f"    {row.pull_number:3d}  |  {row.pity:2d}  |    {row.probability * 100:5.1f}%   |     {row.cumulative * 100:6.3f}%{marker}")
-            else:
-                print(f"    {row.pull_number:3d}  |  {row.pity:2d}  |    {row.probability * 100:5.1f}%   |      {row.cumulative * 100:5.1f}%{marker}")
+        Args:
+            title: Chart title
+            series: Values in [0, 100], one per x step (any length)
+            markers: Character drawn at given series indices
+            legend: Description of each marker character
+            ticks: Series indices to label on the x axis
+            width: Plot columns (longer series are downsampled)
+            height: Plot rows above the baseline
+        """
+        with self._output() as out:
+            out.line("\n" + "=" * 75)
+            out.line(f"  {title}")
+            out.line("=" * 75 + "\n")
+            out.lines(AsciiCanvas(width, height).render(series, markers=markers, ticks=ticks))
+            if legend:
+                out.line(f"\n  LEGEND:")
+                out.lines(f"    {char} = {text}" for char, text in legend.items())
+    
+    def show_featured_graph(self, curve: np.ndarray, soft_pity_start: int, hard_pity: int) -> None:
+        """Display the cumulative featured probability curve (probabilities per pull)."""
+        last = len(curve)
+        self.show_chart(
+            "GRAPH: PROBABILITY OF GETTING FEATURED 6★",
+            np.asarray(curve) * 100,
+            markers={soft_pity_start - 1: "#", hard_pity - 1: "@", last - 1: "*"},
+            legend={
+                ".": "Probability curve",
+                "#": f"Soft Pity start (pull {soft_pity_start})",
+                "@": f"Hard Pity (pull {hard_pity})",
+                "*": f"Featured GUARANTEED (pull {last})",
+            },
+            ticks=[0] + list(range(19, last, 20)),
+        )
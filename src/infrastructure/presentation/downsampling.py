@@ -0,0 +1,105 @@
+"""Downsampling of long series for terminal charts."""
+
+import numpy as np
+
+
+def _as_xy(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if x.shape != y.shape or x.ndim != 1:
+        raise ValueError("x and y must be 1-D arrays of the same length")
+    return x, y
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last points and, from each of ``threshold - 2``
+    equal buckets in between, the point forming the largest triangle with
+    the previously kept point and the mean of the next bucket. Preserves
+    the visual shape of smooth curves (PMFs, CDFs, sweeps).
+
+    Args:
+        x: Increasing x values
+        y: Y values
+        threshold: Number of points to keep
+
+    Returns:
+        Downsampled (x, y); the input if it already fits
+    """
+    x, y = _as_xy(x, y)
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return x, y
+
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    # Mean of each bucket; the bucket after the last one is the final point
+    sizes = np.diff(edges)
+    mean_x = np.append(np.add.reduceat(x[:-1], edges[:-1]) / sizes, x[-1])
+    mean_y = np.append(np.add.reduceat(y[:-1], edges[:-1]) / sizes, y[-1])
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        area = np.abs(
+            (x[a] - mean_x[i + 1]) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (mean_y[i + 1] - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    selected[-1] = n - 1
+    return x[selected], y[selected]
+
+
+def min_max_buckets(x: np.ndarray, y: np.ndarray, buckets: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Min/max bucketing.
+
+    Splits the series into ``buckets`` equal index ranges and keeps each
+    range's minimum and maximum (in their original order), so every spike
+    survives. Fully vectorized; returns at most ``2 * buckets`` points.
+
+    Args:
+        x: Increasing x values
+        y: Y values
+        buckets: Number of buckets
+
+    Returns:
+        Downsampled (x, y); the input if it already fits
+    """
+    x, y = _as_xy(x, y)
+    n = len(x)
+    if buckets <= 0 or 2 * buckets >= n:
+        return x, y
+
+    starts = np.arange(buckets) * n // buckets
+    bucket = np.repeat(np.arange(buckets), np.diff(np.append(starts, n)))
+    index = np.arange(n)
+    lows = np.minimum.reduceat(y, starts)
+    highs = np.maximum.reduceat(y, starts)
+    first_low = np.minimum.reduceat(np.where(y == lows[bucket], index, n), starts)
+    first_high = np.minimum.reduceat(np.where(y == highs[bucket], index, n), starts)
+    keep = np.unique(np.concatenate([first_low, first_high]))
+    return x[keep], y[keep]
+
+
+METHODS = {"lttb": lttb, "minmax": min_max_buckets}
+
+
+def downsample(x: np.ndarray, y: np.ndarray, max_points: int, method: str = "lttb") -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a series to at most ``max_points`` points.
+
+    Args:
+        x: Increasing x values
+        y: Y values
+        max_points: Point budget
+        method: "lttb" or "minmax"
+    """
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {tuple(METHODS)}, got {method!r}")
+    if method == "minmax":
+        return min_max_buckets(x, y, max_points // 2)
+    return lttb(x, y, max_points)
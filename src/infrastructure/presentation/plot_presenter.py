@@ -0,0 +1,126 @@
+"""Terminal chart presenter backed by uniplot."""
+
+import sys
+from types import ModuleType
+from typing import Any, Optional, TextIO
+
+import numpy as np
+
+from src.domain.services import FixedBinHistogram
+from .downsampling import downsample
+
+
+def _load_uniplot() -> ModuleType:
+    """Import uniplot on first use, so merely loading the presenter stays cheap."""
+    try:
+        import uniplot
+    except ImportError as e:
+        raise ImportError("Charts need the 'uniplot' package (pip install uniplot)") from e
+    return uniplot
+
+
+class UniplotPresenter:
+    """
+    Charts simulation histograms, exact PMF/CDF curves and sweep results.
+
+    Every series is downsampled before plotting (LTTB by default, or
+    min/max bucketing for noisy data where spikes must survive), so
+    plotting millions of points costs about as much as plotting
+    ``max_points``. uniplot is only imported when a chart is drawn.
+    """
+
+    def __init__(
+        self,
+        stream: Optional[TextIO] = None,
+        width: int = 60,
+        height: int = 17,
+        max_points: int = 1_000,
+        method: str = "lttb",
+        **plot_options: Any,
+    ):
+        """
+        Initialize presenter.
+
+        Args:
+            stream: Output stream (defaults to the current sys.stdout)
+            width: Plot width in characters
+            height: Plot height in lines
+            max_points: Points kept per series after downsampling
+            method: Downsampling method, "lttb" or "minmax"
+            **plot_options: Extra keyword options passed to uniplot
+        """
+        self.stream = stream
+        self.width = width
+        self.height = height
+        self.max_points = max_points
+        self.method = method
+        self.plot_options = plot_options
+
+    def plot(
+        self,
+        title: str,
+        series: dict[str, np.ndarray],
+        xs: Optional[np.ndarray] = None,
+        method: Optional[str] = None,
+        **options: Any,
+    ) -> None:
+        """
+        Chart one or more series sharing an x axis.
+
+        Args:
+            title: Chart title
+            series: Label -> y values
+            xs: Shared x values (default: 0 .. n - 1)
+            method: Downsampling method for this chart (default: presenter's)
+            **options: Extra keyword options passed to uniplot
+        """
+        ys_list, xs_list = [], []
+        for values in series.values():
+            values = np.asarray(values, dtype=float)
+            x = np.arange(len(values), dtype=float) if xs is None else np.asarray(xs, dtype=float)
+            x, y = downsample(x, values, self.max_points, method or self.method)
+            xs_list.append(x)
+            ys_list.append(y)
+
+        kwargs = {"title": title, "width": self.width, "height": self.height, "lines": True}
+        if len(series) > 1:
+            kwargs["legend_labels"] = list(series)
+        kwargs.update(self.plot_options)
+        kwargs.update(options)
+        chart = _load_uniplot().plot_to_string(ys_list, xs=xs_list, **kwargs)
+        if isinstance(chart, list):
+            chart = "\n".join(chart)
+        stream = self.stream if self.stream is not None else sys.stdout
+        stream.write(chart.rstrip("\n") + "\n")
+
+    def show_histogram(self, title: str, histogram: FixedBinHistogram) -> None:
+        """Chart a simulation histogram (counts at bin centers)."""
+        edges = np.asarray(histogram.edges())
+        self.plot(
+            title,
+            {"count": np.asarray(histogram.counts, dtype=float)},
+            xs=(edges[:-1] + edges[1:]) / 2,
+            method="minmax",
+            y_min=0,
+        )
+
+    def show_samples(self, title: str, samples: np.ndarray, bins: int = 60) -> None:
+        """Chart the histogram of raw samples."""
+        counts, edges = np.histogram(np.asarray(samples), bins=bins)
+        self.plot(title, {"count": counts.astype(float)}, xs=(edges[:-1] + edges[1:]) / 2, method="minmax", y_min=0)
+
+    def show_pmf(self, title: str, pmf: np.ndarray, offset: int = 0) -> None:
+        """Chart an exact PMF; index i is the value ``offset + i``."""
+        pmf = np.asarray(pmf, dtype=float)
+        self.plot(title, {"pmf": pmf}, xs=np.arange(len(pmf)) + offset, y_min=0)
+
+    def show_cdf(self, title: str, cdf: np.ndarray, offset: int = 0) -> None:
+        """Chart an exact CDF; index i is the value ``offset + i``."""
+        cdf = np.asarray(cdf, dtype=float)
+        self.plot(title, {"cdf": cdf}, xs=np.arange(len(cdf)) + offset, y_min=0, y_max=1)
+
+    def show_sweep(self, title: str, parameter: np.ndarray, results: dict[str, np.ndarray]) -> None:
+        """Chart sweep results (one series per label) against the swept parameter."""
+        order = np.argsort(np.asarray(parameter, dtype=float), kind="stable")
+        self.plot(title, {label: np.asarray(values)[order] for label, values in results.items()},
+                  xs=np.asarray(parameter, dtype=float)[order])
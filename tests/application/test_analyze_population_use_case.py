@@ -0,0 +1,79 @@
+"""Tests for AnalyzePopulationUseCase."""
+
+import gzip
+import json
+import random
+
+import pytest
+
+from src.application.use_cases import AnalyzePopulationUseCase
+from src.domain.services import PullKernel
+from src.domain.services.pull_kernel import KernelState
+from src.infrastructure.persistence.jsonl_pull_records import JsonlPullRecordSource
+
+
+def _write_dataset(path, rules, players=25, seed=4):
+    """Simulate players on a few banners; returns the expected counters."""
+    kernel = PullKernel(rules)
+    rng = random.Random(seed)
+    expected = {"pulls": 0, "six_stars": 0, "won": 0, "featured": [], "final_pity": []}
+    with gzip.open(path, "wt") as f:
+        for player in range(players):
+            state = KernelState(0, 0, 0, 0, False)
+            for banner in range(rng.randint(1, 3)):
+                if banner:
+                    state = kernel.new_banner(state)
+                for _ in range(rng.randint(0, 150)):
+                    before = state
+                    state, outcome = kernel.step(state, rng.random(), rng.random())
+                    record = {"player": f"p{player}", "banner": f"b{banner}", "rarity": outcome.rarity}
+                    if outcome.rarity == 6:
+                        record["character_type"] = "featured" if outcome.featured else "standard"
+                        record["won_50_50"] = outcome.featured
+                        expected["six_stars"] += 1
+                        expected["won"] += outcome.featured
+                        if outcome.featured and not before.featured_obtained:
+                            expected["featured"].append(state.banner_pulls)
+                    expected["pulls"] += 1
+                    f.write(json.dumps(record) + "\n")
+            if state.total_pulls:
+                expected["final_pity"].append(state.pulls_without_6_star)
+    return expected
+
+
+class TestAnalyzePopulationUseCase:
+    """Test suite for AnalyzePopulationUseCase."""
+    
+    @pytest.fixture
+    def dataset(self, tmp_path, game_rules):
+        path = tmp_path / "pulls.jsonl.gz"
+        return path, _write_dataset(path, game_rules)
+    
+    def test_matches_direct_replay(self, game_rules, dataset):
+        """Test the report agrees with counters gathered while simulating."""
+        path, expected = dataset
+        report = AnalyzePopulationUseCase(game_rules, workers=1).execute(JsonlPullRecordSource(path, chunk_lines=37))
+        
+        assert report.players == len(expected["final_pity"]) == sum(report.final_pity)
+        assert list(report.final_pity) == [expected["final_pity"].count(p) for p in range(len(report.final_pity))]
+        assert report.pulls == expected["pulls"]
+        assert report.six_stars == sum(report.cycle_lengths) == expected["six_stars"]
+        assert report.won_50_50 == expected["won"]
+        assert report.featured_obtained == len(expected["featured"])
+        assert report.mean_pulls_per_featured == pytest.approx(sum(expected["featured"]) / len(expected["featured"]))
+    
+    def test_chunking_does_not_change_the_report(self, game_rules, dataset):
+        """Test players split across chunks are resumed from their carry."""
+        path, _ = dataset
+        use_case = AnalyzePopulationUseCase(game_rules, workers=1)
+        whole = use_case.execute(JsonlPullRecordSource(path, chunk_lines=1_000_000))
+        for chunk_lines in (1, 7, 150):
+            assert use_case.execute(JsonlPullRecordSource(path, chunk_lines=chunk_lines)) == whole
+    
+    def test_parallel_matches_serial(self, game_rules, dataset):
+        """Test process-pool runs give the same report as in-process runs."""
+        path, _ = dataset
+        source = JsonlPullRecordSource(path, chunk_lines=200)
+        serial = AnalyzePopulationUseCase(game_rules, workers=1).execute(source)
+        parallel = AnalyzePopulationUseCase(game_rules, workers=2, max_pending=3).execute(source)
+        assert parallel == serial
@@ -0,0 +1,48 @@
+"""Tests for CompareStrategiesUseCase."""
+
+import pytest
+from src.application.use_cases import CompareStrategiesUseCase
+from src.domain.services import StopAtFeatured, ReachSpark, SaveForNextBanner
+
+
+class TestCompareStrategiesUseCase:
+    """Test suite for CompareStrategiesUseCase."""
+    
+    def test_paired_differences(self, game_rules):
+        """Test differences are reported against the baseline strategy."""
+        use_case = CompareStrategiesUseCase(game_rules, workers=1, block_size=100)
+        
+        result = use_case.execute([StopAtFeatured(), ReachSpark()], trials=300, seed=7)
+        
+        assert result.trials == 300
+        assert [s.name for s in result.strategies] == ["stop_at_featured", "reach_spark"]
+        diff = result.differences[0]
+        assert diff.baseline == "stop_at_featured"
+        assert diff.mean_pulls_difference > 0
+        stop, spark = result.strategies
+        assert abs(diff.mean_pulls_difference - (spark.mean_pulls_spent - stop.mean_pulls_spent)) < 1e-9
+    
+    def test_common_random_numbers_reduce_variance(self, game_rules):
+        """Test paired differences are tighter than the independent estimate."""
+        use_case = CompareStrategiesUseCase(game_rules, workers=1)
+        
+        result = use_case.execute([StopAtFeatured(), ReachSpark()], trials=500, seed=1)
+        
+        stop, spark = result.strategies
+        independent_stderr = (stop.stderr_pulls_spent ** 2 + spark.stderr_pulls_spent ** 2) ** 0.5
+        assert result.differences[0].stderr_pulls_difference < independent_stderr
+    
+    def test_parallel_matches_serial(self, game_rules):
+        """Test process-pool runs give the same answer as in-process runs."""
+        strategies = [StopAtFeatured(), SaveForNextBanner()]
+        serial = CompareStrategiesUseCase(game_rules, workers=1, block_size=50).execute(strategies, 200, seed=3)
+        parallel = CompareStrategiesUseCase(game_rules, workers=2, block_size=50).execute(strategies, 200, seed=3)
+        
+        for a, b in zip(serial.strategies, parallel.strategies):
+            assert a.mean_featured_copies == pytest.approx(b.mean_featured_copies)
+            assert a.mean_pulls_spent == pytest.approx(b.mean_pulls_spent)
+    
+    def test_requires_strategy(self, game_rules):
+        """Test an empty strategy list is rejected."""
+        with pytest.raises(ValueError):
+            CompareStrategiesUseCase(game_rules, workers=1).execute([], trials=10)
@@ -0,0 +1,38 @@
+"""Tests for EstimateFeaturedProbabilityUseCase."""
+
+import random
+
+from src.application.use_cases import EstimateFeaturedProbabilityUseCase
+from src.domain.entities import PityState
+from src.domain.services import EventDrivenSimulator, AdaptiveMonteCarlo
+
+
+class TestEstimateFeaturedProbabilityUseCase:
+    """Test suite for EstimateFeaturedProbabilityUseCase."""
+    
+    def test_guaranteed_within_spark(self, game_rules):
+        """Test the featured guarantee makes 120 pulls certain."""
+        simulator = EventDrivenSimulator(game_rules, random.Random(1))
+        use_case = EstimateFeaturedProbabilityUseCase(
+            simulator, AdaptiveMonteCarlo(chunk_size=500, min_samples=500), game_rules
+        )
+        
+        result = use_case.execute(PityState.initial(), within_pulls=120, target_half_width=0.01)
+        
+        assert result.estimate == 1.0
+        assert result.converged is True
+        assert result.samples == 500
+    
+    def test_interval_reported_with_estimate(self, game_rules):
+        """Test the estimate is reported inside its interval."""
+        simulator = EventDrivenSimulator(game_rules, random.Random(2))
+        use_case = EstimateFeaturedProbabilityUseCase(
+            simulator, AdaptiveMonteCarlo(chunk_size=2000, min_samples=2000), game_rules
+        )
+        
+        result = use_case.execute(PityState.initial(), within_pulls=80, target_half_width=0.02)
+        
+        assert result.converged is True
+        assert result.lower <= result.estimate <= result.upper
+        assert result.half_width <= 0.02
+        assert 0.45 < result.estimate < 0.65
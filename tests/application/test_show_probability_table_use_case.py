@@ -0,0 +1,30 @@
+"""Tests for ShowProbabilityTableUseCase."""
+
+import pytest
+from src.application.use_cases import ShowProbabilityTableUseCase
+
+
+class TestShowProbabilityTableUseCase:
+    """Test suite for ShowProbabilityTableUseCase."""
+    
+    def test_longer_table_extends_previous(self, prob_calculator, counter_calculator, game_rules):
+        """Test successive longer tables match a table built in one go."""
+        use_case = ShowProbabilityTableUseCase(prob_calculator, counter_calculator, game_rules)
+        fresh = ShowProbabilityTableUseCase(prob_calculator, counter_calculator, game_rules).execute(120)
+        assert len(use_case.execute(30)) == 30
+        assert len(use_case.execute(10)) == 10
+        extended = use_case.execute(120)
+        assert extended == fresh
+        assert extended[79].cumulative == pytest.approx(1.0)
+    
+    def test_columns_match_rows(self, prob_calculator, counter_calculator, game_rules):
+        """Test the chunked column stream agrees with the row DTOs."""
+        use_case = ShowProbabilityTableUseCase(prob_calculator, counter_calculator, game_rules)
+        rows = use_case.execute(100)
+        chunks = list(use_case.iter_columns(100, chunk_size=30))
+        assert [len(c["pull_number"]) for c in chunks] == [30, 30, 30, 10]
+        columns = {name: [v for c in chunks for v in c[name].tolist()] for name in chunks[0]}
+        assert columns["pull_number"] == [r.pull_number for r in rows]
+        assert columns["pity"] == [r.pity for r in rows]
+        assert columns["probability"] == pytest.approx([r.probability for r in rows])
+        assert columns["cumulative"] == pytest.approx([r.cumulative for r in rows])
@@ -0,0 +1,84 @@
+"""Tests for MultiAccountTracker."""
+
+import numpy as np
+import pytest
+
+from src.application.use_cases import MultiAccountTracker
+from src.domain.entities import PityStateBatch
+from src.infrastructure.persistence.npz_account_repository import NpzAccountSnapshotRepository
+
+
+@pytest.fixture
+def tracker(game_rules, tmp_path):
+    """Provide a tracker with a tiny initial capacity and an NPZ repository."""
+    return MultiAccountTracker(game_rules, NpzAccountSnapshotRepository(tmp_path / "accounts.npz"), capacity=2)
+
+
+class TestMultiAccountTracker:
+    """Test suite for MultiAccountTracker."""
+    
+    def test_add_and_grow(self, tracker):
+        """Test accounts are added past the initial capacity."""
+        rows = tracker.add_accounts([f"acc{i}" for i in range(10)])
+        assert rows.tolist() == list(range(10))
+        assert len(tracker) == 10
+        assert tracker.rows(["acc7", "acc2"]).tolist() == [7, 2]
+        with pytest.raises(ValueError):
+            tracker.add_accounts(["acc3"])
+    
+    def test_apply_pulls_and_banner_reset(self, tracker):
+        """Test a pull batch updates only the accounts that pulled."""
+        tracker.add_accounts(["a", "b", "c"])
+        rows = tracker.rows(["a", "a", "b", "a", "b"])
+        tracker.apply_pulls(rows, np.array([4, 6, 5, 4, 4]))
+        assert tracker.state("a").pulls_without_6_star == 1
+        assert tracker.state("b").pulls_without_5_star == 1
+        assert tracker.state("c").total_pulls == 0
+        tracker.start_banner(tracker.rows(["a"]))
+        assert tracker.state("a").banner_pulls == 0
+        assert tracker.state("a").total_pulls == 3
+        assert tracker.status()["pulls_to_featured"].tolist() == [120, 118, 120]
+    
+    def test_invalid_initial_states_rejected(self, tracker):
+        """Test states breaking PityState invariants cannot be added."""
+        states = PityStateBatch.from_arrays(pulls_without_6_star=[90], banner_pulls=[0], total_pulls=[0])
+        with pytest.raises(Exception, match="6_star_pity_above_hard_pity"):
+            tracker.add_accounts(["x"], states)
+    
+    def test_snapshot_round_trip(self, tracker, game_rules, tmp_path):
+        """Test a snapshot restores every account and counter."""
+        tracker.add_accounts([f"acc{i}" for i in range(100)])
+        rng = np.random.default_rng(0)
+        tracker.apply_pulls(rng.integers(0, 100, 5_000), rng.choice([4, 5, 6], 5_000))
+        tracker.save()
+        
+        restored = MultiAccountTracker(game_rules, NpzAccountSnapshotRepository(tmp_path / "accounts.npz"))
+        assert restored.load()
+        assert restored.account_ids.tolist() == tracker.account_ids.tolist()
+        assert restored.batch.to_states() == tracker.batch.to_states()
+    
+    def test_load_without_snapshot(self, game_rules, tmp_path):
+        """Test loading when nothing was saved."""
+        tracker = MultiAccountTracker(game_rules, NpzAccountSnapshotRepository(tmp_path / "none.npz"))
+        assert not tracker.load()
+    
+    @pytest.mark.parametrize("account_ids, pity", [
+        (["x", "y"], [90, 0]),
+        (["x", "x"], [0, 0]),
+        (["x"], [0, 0]),
+    ])
+    def test_failed_load_keeps_accounts(self, tracker, account_ids, pity):
+        """Test a malformed or mismatched snapshot leaves the tracker unchanged."""
+        tracker.add_accounts(["a", "b", "c"])
+        tracker.apply_pulls(tracker.rows(["a", "b", "b"]), np.array([4, 5, 6]))
+        before = tracker.batch.to_states()
+        tracker.repository.save(
+            np.array(account_ids),
+            PityStateBatch.from_arrays(pulls_without_6_star=pity, banner_pulls=[0, 0], total_pulls=[0, 0]),
+        )
+        
+        with pytest.raises(Exception):
+            tracker.load()
+        assert tracker.account_ids.tolist() == ["a", "b", "c"]
+        assert tracker.batch.to_states() == before
+        assert tracker.state("b").pulls_without_6_star == 0
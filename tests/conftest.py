@@ -1,8 +1,9 @@
 """Pytest configuration and shared fixtures."""
 
+import numpy as np
 import pytest
 from src.domain.value_objects import GameRules
-from src.domain.entities import PityState
+from src.domain.entities import PityState, PityStateBatch
 from src.domain.services import ProbabilityCalculator, CounterCalculator, PitySimulator
 
 
@@ -69,3 +70,16 @@ def hard_pity_state():
         banner_pulls=80,
         total_pulls=80
     )
+
+
+@pytest.fixture
+def random_batch():
+    """Provide a batch of valid random states."""
+    rng = np.random.default_rng(3)
+    banner = rng.integers(0, 300, 1_000)
+    return PityStateBatch.from_arrays(
+        pulls_without_6_star=rng.integers(0, 81, 1_000),
+        pulls_without_5_star=rng.integers(0, 11, 1_000),
+        banner_pulls=banner,
+        total_pulls=banner + rng.integers(0, 500, 1_000),
+    )
@@ -0,0 +1,55 @@
+"""Tests for AdaptiveMonteCarlo service."""
+
+import random
+
+import pytest
+from src.domain.services import AdaptiveMonteCarlo
+
+
+class TestAdaptiveMonteCarlo:
+    """Test suite for AdaptiveMonteCarlo."""
+    
+    def test_stops_once_precise_enough(self):
+        """Test sampling stops at the first chunk meeting the target."""
+        rng = random.Random(3)
+        runner = AdaptiveMonteCarlo(chunk_size=1000, min_samples=1000)
+        
+        result = runner.estimate_proportion(lambda: rng.random() < 0.3, target_half_width=0.02)
+        
+        assert result.converged is True
+        assert result.half_width <= 0.02
+        assert result.samples < 10_000
+        assert result.lower <= 0.3 <= result.upper
+    
+    def test_reports_not_converged_at_cap(self):
+        """Test the cap is honoured and reported."""
+        rng = random.Random(3)
+        runner = AdaptiveMonteCarlo(chunk_size=500, min_samples=500, max_samples=2000)
+        
+        result = runner.estimate_proportion(lambda: rng.random() < 0.5, target_half_width=0.0001)
+        
+        assert result.converged is False
+        assert result.samples == 2000
+    
+    def test_wilson_interval_degenerate(self):
+        """Test Wilson interval stays inside [0, 1] for extreme counts."""
+        z = AdaptiveMonteCarlo.z_score(0.95)
+        lower, upper = AdaptiveMonteCarlo.wilson_interval(0, 100, z)
+        assert lower == 0.0
+        assert 0.0 < upper < 0.05
+        assert abs(z - 1.959964) < 1e-5
+    
+    def test_estimate_mean(self):
+        """Test mean estimation reaches the target half-width."""
+        rng = random.Random(9)
+        runner = AdaptiveMonteCarlo(chunk_size=2000, min_samples=2000)
+        
+        result = runner.estimate_mean(lambda: rng.uniform(0, 10), target_half_width=0.1)
+        
+        assert result.converged is True
+        assert abs(result.estimate - 5.0) < 0.2
+    
+    def test_invalid_confidence(self):
+        """Test confidence must be a proper fraction."""
+        with pytest.raises(ValueError):
+            AdaptiveMonteCarlo.z_score(1.0)
@@ -0,0 +1,78 @@
+"""Tests for the precomputed featured answer cube."""
+
+import numpy as np
+import pytest
+
+from src.domain.entities import PityState
+from src.domain.services import FeaturedAnswerCube, MarkovTransitionEngine, RenewalAnalyzer
+from src.domain.value_objects import GameRules
+
+
+@pytest.fixture(scope="module")
+def cube():
+    """Provide a cube over the default rules."""
+    return FeaturedAnswerCube(GameRules.default(), max_budget=200)
+
+
+class TestFeaturedAnswerCube:
+    """Test suite for FeaturedAnswerCube."""
+    
+    def test_matches_markov_engine(self, cube, game_rules, soft_pity_state):
+        """Test cube probabilities equal the exact forward distribution."""
+        engine = MarkovTransitionEngine(game_rules)
+        for state in (PityState.initial(), soft_pity_state):
+            for budget in (1, 40, 80, 150):
+                exact = engine.distribution_after(state, budget).featured_probability()
+                assert cube.lookup(state, budget).probability == pytest.approx(exact, abs=1e-12)
+    
+    def test_guarantee_and_known_values(self, cube, initial_state):
+        """Test the featured guarantee and reference numbers from pity 0."""
+        assert cube.lookup(initial_state, 80).probability == pytest.approx(0.5608, abs=1e-4)
+        assert cube.lookup(initial_state, 120).probability == pytest.approx(1.0)
+        assert cube.lookup(initial_state, 0).expected_pulls == pytest.approx(80.98, abs=0.01)
+    
+    def test_expected_matches_renewal_analysis(self, cube, game_rules):
+        """Test uncapped expectations agree with the first-passage solve."""
+        analyzer = RenewalAnalyzer(game_rules)
+        state = PityState(pulls_without_6_star=30, pulls_without_5_star=0, banner_pulls=50, total_pulls=50)
+        assert cube.lookup(state, 0).expected_pulls == pytest.approx(analyzer.expected_pulls_to_featured(30, 50))
+        assert cube.lookup(state, 0, featured_obtained=True).expected_pulls == pytest.approx(
+            analyzer.expected_pulls_to_featured(30, 50, True)
+        )
+    
+    def test_spend_is_capped_expectation(self, cube, initial_state):
+        """Test expected spend grows with the budget towards the uncapped mean."""
+        spends = [cube.lookup(initial_state, b).expected_spend for b in (0, 10, 80, 120, 200)]
+        assert spends[0] == 0.0
+        assert spends[1] == pytest.approx(10 - sum(cube.probability[0, 0, :10]))
+        assert spends == sorted(spends)
+        assert spends[-1] == pytest.approx(cube.lookup(initial_state, 0).expected_pulls)
+    
+    def test_past_guarantee_uses_flag_plane(self, cube):
+        """Test banner_pulls past the guarantee behaves like a used guarantee."""
+        state = PityState(pulls_without_6_star=10, pulls_without_5_star=0, banner_pulls=130, total_pulls=130)
+        fresh = PityState(pulls_without_6_star=10, pulls_without_5_star=0, banner_pulls=0, total_pulls=0)
+        assert cube.lookup(state, 100) == cube.lookup(fresh, 100, featured_obtained=True)
+    
+    def test_lookup_many_matches_lookup(self, cube):
+        """Test the vectorized lookup agrees with single lookups."""
+        rng = np.random.default_rng(0)
+        pity = rng.integers(0, 81, 500)
+        banner = rng.integers(0, 150, 500)
+        budget = rng.integers(0, 201, 500)
+        flags = rng.random(500) < 0.3
+        probability, spend, expected = cube.lookup_many(pity, banner, budget, flags)
+        for i in range(0, 500, 37):
+            state = PityState(
+                pulls_without_6_star=int(pity[i]), pulls_without_5_star=0,
+                banner_pulls=int(banner[i]), total_pulls=int(banner[i]),
+            )
+            answer = cube.lookup(state, int(budget[i]), bool(flags[i]))
+            assert (probability[i], spend[i], expected[i]) == pytest.approx(tuple(answer))
+    
+    def test_budget_out_of_range(self, cube, initial_state):
+        """Test budgets beyond the cube are rejected."""
+        with pytest.raises(ValueError):
+            cube.lookup(initial_state, 201)
+        with pytest.raises(ValueError):
+            cube.lookup_many([0], [0], [500])
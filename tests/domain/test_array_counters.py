@@ -0,0 +1,70 @@
+"""Tests for vectorized counters and bulk state validation."""
+
+from dataclasses import asdict
+
+import numpy as np
+import pytest
+
+from src.application.use_cases import CalculateStateUseCase
+from src.domain.entities import PityState, PityStateBatch
+from src.domain.exceptions import InvalidPityStateError
+from src.domain.services import ArrayCounterCalculator
+
+
+class TestArrayCounterCalculator:
+    """Test suite for ArrayCounterCalculator."""
+    
+    def test_status_matches_scalar_use_case(self, random_batch, prob_calculator, counter_calculator, game_rules):
+        """Test every column agrees with the per-state use case."""
+        status = ArrayCounterCalculator(game_rules).status(random_batch)
+        use_case = CalculateStateUseCase(prob_calculator, counter_calculator, game_rules)
+        for i in range(0, len(random_batch), 47):
+            expected = asdict(use_case.execute(random_batch.state(i)))
+            assert {name: status[name][i].item() for name in expected} == expected
+    
+    def test_counters(self, game_rules):
+        """Test the counter formulas on edge values."""
+        calc = ArrayCounterCalculator(game_rules)
+        assert calc.pity_counter(np.array([0, 80, 85])).tolist() == [0, 80, 80]
+        assert calc.pity_reset(np.array([50, 80, 100])).tolist() == [0, 0, 20]
+        assert calc.pulls_to_bonus_dupe(np.array([0, 240, 300])).tolist() == [240, 0, 0]
+
+
+class TestPityStateBatch:
+    """Test suite for PityStateBatch."""
+    
+    def test_round_trip(self, soft_pity_state, hard_pity_state):
+        """Test conversion to and from PityState objects."""
+        states = [PityState.initial(), soft_pity_state, hard_pity_state]
+        batch = PityStateBatch.from_states(states)
+        assert len(batch) == 3
+        assert batch.to_states() == states
+    
+    def test_validation_reports_rows(self):
+        """Test every invariant is checked and offending rows are listed."""
+        batch = PityStateBatch.from_arrays(
+            pulls_without_6_star=[0, 81, 10, -1, 5],
+            pulls_without_5_star=[0, 0, 11, 0, 0],
+            banner_pulls=[0, 0, 0, 0, 10],
+            total_pulls=[0, 0, 0, 0, 5],
+        )
+        report = batch.validate()
+        assert not report.valid
+        assert report.violations["6_star_pity_above_hard_pity"].tolist() == [1]
+        assert report.violations["5_star_pity_above_guarantee"].tolist() == [2]
+        assert report.violations["negative_counter"].tolist() == [3]
+        assert report.violations["total_below_banner_pulls"].tolist() == [4]
+        assert report.invalid_rows.tolist() == [1, 2, 3, 4]
+        with pytest.raises(InvalidPityStateError, match="4 of 5"):
+            report.raise_if_invalid()
+    
+    def test_valid_batch(self, random_batch):
+        """Test a valid batch passes."""
+        report = random_batch.validate()
+        assert report.valid
+        report.raise_if_invalid()
+    
+    def test_mismatched_columns_rejected(self):
+        """Test columns of different lengths are rejected."""
+        with pytest.raises(ValueError):
+            PityStateBatch.from_arrays(pulls_without_6_star=[0, 1], banner_pulls=[0], total_pulls=[0])
@@ -0,0 +1,59 @@
+"""Tests for the pruned banner plan DP."""
+
+import numpy as np
+import pytest
+
+from src.domain.services import BannerPlanDP, MarkovTransitionEngine
+
+
+class TestBannerPlanDP:
+    """Test suite for BannerPlanDP."""
+    
+    def test_single_banner_matches_markov_engine(self, game_rules, soft_pity_state):
+        """Test P(at least one copy) equals the exact featured probability."""
+        engine = MarkovTransitionEngine(game_rules)
+        dp = BannerPlanDP(game_rules, epsilon=0.0)
+        for pulls in (1, 30, 54, 55):
+            lower, upper = dp.evaluate(soft_pity_state, [pulls]).probability_at_least(1)
+            exact = engine.distribution_after(soft_pity_state, pulls).featured_probability()
+            assert lower == pytest.approx(exact, abs=1e-12)
+            assert upper == lower
+    
+    def test_guarantee_and_bonus_dupe(self, game_rules, initial_state):
+        """Test the spark makes one copy certain and the dupe adds one."""
+        dp = BannerPlanDP(game_rules)
+        assert dp.evaluate(initial_state, [120]).probability_at_least(1)[0] == pytest.approx(1.0)
+        assert dp.evaluate(initial_state, [240]).probability_at_least(2)[0] == pytest.approx(1.0)
+    
+    def test_banner_reset_reenables_guarantee(self, game_rules, initial_state):
+        """Test each banner in the plan gets its own featured guarantee."""
+        result = BannerPlanDP(game_rules).evaluate(initial_state, [120, 120])
+        assert result.probability_at_least(2)[0] == pytest.approx(1.0)
+    
+    def test_pruning_bounds_contain_exact(self, game_rules, initial_state):
+        """Test pruned results bracket the unpruned answer and track dropped mass."""
+        plan = [150] * 6
+        exact = BannerPlanDP(game_rules, epsilon=0.0).evaluate(initial_state, plan)
+        pruned = BannerPlanDP(game_rules, epsilon=1e-8).evaluate(initial_state, plan)
+        assert exact.discarded_mass == 0.0
+        assert pruned.discarded_mass > 0.0
+        assert pruned.copies_pmf.sum() + pruned.discarded_mass == pytest.approx(1.0)
+        assert pruned.peak_states < exact.peak_states
+        for copies in range(12):
+            lower, upper = pruned.probability_at_least(copies)
+            assert lower - 1e-12 <= exact.probability_at_least(copies)[0] <= upper + 1e-12
+        lower, upper = pruned.expected_copies()
+        assert lower <= exact.expected_copies()[0] <= upper
+    
+    def test_end_pity_is_a_distribution(self, game_rules, hard_pity_state):
+        """Test the end-of-plan pity marginal."""
+        result = BannerPlanDP(game_rules, epsilon=0.0).evaluate(hard_pity_state, [1])
+        assert result.pity_6_star[0] == pytest.approx(1.0)
+        assert np.isclose(result.pity_6_star.sum(), 1.0)
+    
+    def test_invalid_arguments(self, game_rules, initial_state):
+        """Test negative epsilon and negative banner spends are rejected."""
+        with pytest.raises(ValueError):
+            BannerPlanDP(game_rules, epsilon=-1.0)
+        with pytest.raises(ValueError):
+            BannerPlanDP(game_rules).evaluate(initial_state, [10, -1])
@@ -0,0 +1,43 @@
+"""Tests for bulk application of interleaved pulls."""
+
+import numpy as np
+import pytest
+
+from src.domain.entities import CharacterType, PityStateBatch, PullResult
+from src.domain.services import BulkPullApplier
+
+
+class TestBulkPullApplier:
+    """Test suite for BulkPullApplier."""
+    
+    def test_matches_sequential_apply(self, game_rules, pity_simulator, random_batch):
+        """Test interleaved pulls for many accounts match one-by-one application."""
+        rng = np.random.default_rng(11)
+        rows = rng.integers(0, 40, 3_000)
+        rarities = rng.choice([4, 5, 6], 3_000, p=[0.85, 0.1, 0.05])
+        batch = PityStateBatch(*(getattr(random_batch, n)[:40] for n in PityStateBatch.COLUMNS))
+        
+        updated = BulkPullApplier(game_rules).apply(batch, rows, rarities)
+        
+        states = batch.to_states()
+        for row, rarity in zip(rows, rarities):
+            result = PullResult(rarity=int(rarity), character_type=CharacterType.STANDARD)
+            states[row] = pity_simulator.apply_pull_result(states[row], result)
+        assert updated.to_states() == states
+    
+    def test_untouched_accounts_unchanged(self, game_rules, random_batch):
+        """Test accounts without pulls keep their state."""
+        updated = BulkPullApplier(game_rules).apply(random_batch, np.array([5]), np.array([6]))
+        assert updated.state(4) == random_batch.state(4)
+        assert updated.state(5).pulls_without_6_star == 0
+    
+    def test_out_of_range_rows(self, game_rules, random_batch):
+        """Test unknown account rows are rejected."""
+        with pytest.raises(IndexError):
+            BulkPullApplier(game_rules).apply(random_batch, np.array([len(random_batch)]), np.array([4]))
+    
+    @pytest.mark.parametrize("rarity", [3, 7, 0, 5.5])
+    def test_unknown_rarity_rejected(self, game_rules, random_batch, rarity):
+        """Test rarities other than 4, 5 and 6 are rejected instead of counted as 4★."""
+        with pytest.raises(ValueError, match="Rarities"):
+            BulkPullApplier(game_rules).apply(random_batch, np.array([0, 1]), np.array([4, rarity]))
@@ -0,0 +1,57 @@
+"""Tests for ChunkedSimulation service."""
+
+import random
+import threading
+
+import numpy as np
+import pytest
+from src.domain.services import ChunkedSimulation
+
+
+@pytest.fixture
+def chunked(game_rules):
+    """Provide a chunked simulation with a small memory cap."""
+    return ChunkedSimulation(game_rules, random.Random(11), chunk_size=1000, memory_cap_bytes=512)
+
+
+class TestChunkedSimulation:
+    """Test suite for ChunkedSimulation."""
+    
+    def test_memory_cap_bounds_chunk_length(self, chunked):
+        """Test chunks never exceed the memory cap."""
+        assert chunked.chunk_length(np.uint16) == 256
+        assert chunked.chunk_length(np.float64) == 64
+
+    def test_iter_samples_from_any_sampler(self, chunked):
+        """Test the generic API accepts any sampler."""
+        chunks = list(chunked.iter_samples(lambda: 1.5, 100))
+        assert [len(c) for c in chunks] == [64, 36]
+        assert float(np.concatenate(chunks).sum()) == 150.0
+
+    def test_pulls_to_featured_chunks(self, chunked, initial_state):
+        """Test all requested samples are produced in capped chunks."""
+        chunks = list(chunked.iter_pulls_to_featured(initial_state, 1000))
+        
+        assert [len(c) for c in chunks] == [256, 256, 256, 232]
+        assert all(c.dtype == np.uint16 for c in chunks)
+        samples = np.concatenate(chunks)
+        assert samples.min() >= 1
+        assert samples.max() <= 120
+    
+    def test_cancellation_between_chunks(self, chunked, initial_state):
+        """Test a cancelled stream stops at the next chunk boundary."""
+        cancel = threading.Event()
+        received = 0
+        for chunk in chunked.iter_pulls_to_featured(initial_state, 10_000, cancel=cancel):
+            received += len(chunk)
+            cancel.set()
+        assert received == 256
+    
+    def test_rarity_stream_is_continuous(self, chunked, initial_state):
+        """Test the pull sequence respects the 5★ guarantee across chunks."""
+        rarities = np.concatenate(list(chunked.iter_pull_rarities(initial_state, 3000)))
+        
+        assert len(rarities) == 3000
+        assert set(np.unique(rarities)) <= {4, 5, 6}
+        hits = np.flatnonzero(rarities >= 5)
+        assert np.diff(np.concatenate(([-1], hits))).max() <= 10
@@ -0,0 +1,148 @@
+"""Tests for the rules fingerprint and compiled-rules registry."""
+
+import random
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from src.domain.services import (
+    CompiledRules,
+    CompiledRulesRegistry,
+    ProbabilityCalculator,
+    RenewalAnalyzer,
+    build_alias_table,
+    compile_rules,
+    configure_registry,
+    get_registry,
+)
+from src.domain.value_objects import GameRules
+
+
+class TestFingerprint:
+    """Test suite for GameRules.fingerprint."""
+    
+    def test_equal_rules_share_fingerprint(self):
+        """Test separately built equal rules hash identically."""
+        assert GameRules().fingerprint == GameRules.default().fingerprint
+        assert len(GameRules().fingerprint) == 64
+    
+    def test_explicit_default_curve_shares_fingerprint(self, game_rules):
+        """Test the fingerprint depends on the effective hazard, not how it was given."""
+        explicit = GameRules(hazard_curve=game_rules.hazard_table[:-1])
+        assert explicit.fingerprint == game_rules.fingerprint
+    
+    def test_changed_field_changes_fingerprint(self, game_rules):
+        """Test any rule change yields a new fingerprint."""
+        assert GameRules(prob_50_50=0.6).fingerprint != game_rules.fingerprint
+        assert GameRules(bonus_dupe=200).fingerprint != game_rules.fingerprint
+    
+    def test_model_copy_recomputes_derived_values(self):
+        """Test model_copy(update=...) does not carry over cached values."""
+        base = GameRules()
+        assert base.hazard_table[55] == 0.008
+        base_fingerprint = base.fingerprint
+        
+        copy = base.model_copy(update={"soft_pity_start": 50})
+        assert copy.fingerprint == GameRules(soft_pity_start=50).fingerprint
+        assert copy.fingerprint != base_fingerprint
+        assert copy.hazard_table[55] > 0.008
+        assert compile_rules(copy).fingerprint == copy.fingerprint
+    
+    def test_model_copy_update_is_validated(self):
+        """Test invalid updates are rejected like direct construction."""
+        with pytest.raises(ValidationError):
+            GameRules().model_copy(update={"hazard_curve": (0.5,) * 10})
+
+
+class TestCompiledRules:
+    """Test suite for CompiledRules."""
+    
+    def test_tables_match_services(self, game_rules):
+        """Test compiled tables agree with the per-service computations."""
+        compiled = CompiledRules(game_rules)
+        calculator = ProbabilityCalculator(game_rules)
+        assert compiled.expected_pulls_to_6_star[0] == pytest.approx(
+            calculator.calculate_average_pulls_to_6_star()
+        )
+        assert compiled.survival[70, 10] == 0.0
+        assert compiled.featured_cdf[0] == 0.0
+        assert compiled.featured_cdf[80] == pytest.approx(0.5608, abs=1e-3)
+        assert compiled.featured_cdf[-1] == pytest.approx(1.0)
+    
+    def test_arrays_are_read_only(self, game_rules):
+        """Test shared arrays cannot be mutated by consumers."""
+        compiled = CompiledRules(game_rules)
+        with pytest.raises(ValueError):
+            compiled.hazard[0] = 0.5
+    
+    def test_alias_table_reproduces_weights(self):
+        """Test alias tables encode the original distributions exactly."""
+        weights = np.array([[0.1, 0.2, 0.7], [1.0, 0.0, 0.0], [0.5, 0.25, 0.25]])
+        prob, alias = build_alias_table(weights)
+        outcomes = weights.shape[1]
+        recovered = np.zeros_like(weights)
+        for row in range(len(weights)):
+            for column in range(outcomes):
+                recovered[row, column] += prob[row, column] / outcomes
+                recovered[row, alias[row, column]] += (1 - prob[row, column]) / outcomes
+        assert np.allclose(recovered, weights)
+    
+    def test_sample_rarity(self, game_rules):
+        """Test alias sampling respects hard pity and the 5★ guarantee."""
+        compiled = CompiledRules(game_rules)
+        rng = random.Random(1)
+        assert all(compiled.sample_rarity(79, 0, rng.random()) == 6 for _ in range(100))
+        assert all(compiled.sample_rarity(0, 9, rng.random()) in (5, 6) for _ in range(100))
+        six = sum(compiled.sample_rarity(0, 0, rng.random()) == 6 for _ in range(50_000))
+        assert six / 50_000 == pytest.approx(0.008, abs=0.002)
+
+
+class TestCompiledRulesRegistry:
+    """Test suite for CompiledRulesRegistry."""
+    
+    def test_hit_and_miss(self):
+        """Test equal rules reuse one compiled artifact."""
+        registry = CompiledRulesRegistry()
+        first = registry.get(GameRules())
+        second = registry.get(GameRules.default())
+        assert first is second
+        assert (registry.hits, registry.misses) == (1, 1)
+    
+    def test_lru_eviction(self):
+        """Test the least recently used rules set is evicted first."""
+        registry = CompiledRulesRegistry(max_size=2)
+        a, b, c = GameRules(prob_50_50=0.4), GameRules(prob_50_50=0.5), GameRules(prob_50_50=0.6)
+        registry.get(a)
+        registry.get(b)
+        registry.get(a)
+        registry.get(c)
+        assert a in registry and c in registry
+        assert b not in registry
+        assert len(registry) == 2
+    
+    def test_services_share_process_registry(self, game_rules):
+        """Test services pick up the process-wide compiled tables."""
+        assert RenewalAnalyzer(game_rules).hazard is compile_rules(game_rules).hazard
+    
+    def test_configure_registry_sets_store(self, game_rules):
+        """Test the process-wide registry is rebuilt with the configured store."""
+        class RecordingStore:
+            def __init__(self):
+                self.names = []
+            
+            def get_or_build(self, fingerprint, name, build):
+                self.names.append(name)
+                return build()
+        
+        previous = get_registry()
+        store = RecordingStore()
+        try:
+            registry = configure_registry(store, max_size=4)
+            assert get_registry() is registry and registry.store is store
+            assert compile_rules(game_rules).expected_pulls_to_6_star[0] > 0
+            assert store.names
+            with pytest.raises(AttributeError):
+                registry.store = None
+        finally:
+            configure_registry(previous.store, previous.max_size)
@@ -0,0 +1,96 @@
+"""Tests for EventDrivenSimulator service."""
+
+import random
+
+import pytest
+from src.domain.entities import PityState, EventType
+from src.domain.services import EventDrivenSimulator, GapDistributions
+
+
+@pytest.fixture
+def event_simulator(game_rules):
+    """Provide event-driven simulator with a seeded random source."""
+    return EventDrivenSimulator(game_rules, random.Random(1234))
+
+
+class TestGapDistributions:
+    """Test suite for GapDistributions."""
+
+    def test_six_star_pmf_matches_average(self, game_rules, prob_calculator):
+        """Test 6★ gap distribution is consistent with the expected value."""
+        gaps = GapDistributions(game_rules)
+        pmf = gaps.six_star_gap_pmf(0)
+        assert len(pmf) == 80
+        assert abs(sum(pmf) - 1.0) < 1e-12
+        mean = sum((k + 1) * p for k, p in enumerate(pmf))
+        assert abs(mean - prob_calculator.calculate_average_pulls_to_6_star()) < 1e-9
+
+    def test_hard_pity_gap_is_one(self, game_rules):
+        """Test the next pull is certain at hard pity."""
+        gaps = GapDistributions(game_rules)
+        assert gaps.sample_six_star_gap(79, 0.999) == 1
+        assert gaps.sample_six_star_gap(80, 0.5) == 1
+
+    def test_five_star_guarantee_caps_gap(self, game_rules):
+        """Test the 5★ gap never exceeds the guarantee."""
+        gaps = GapDistributions(game_rules)
+        assert gaps.sample_five_star_gap(0, 0.9999) == 10
+        assert gaps.sample_five_star_gap(7, 0.9999) == 3
+        assert gaps.sample_five_star_gap(10, 0.5) == 1
+
+
+class TestEventDrivenSimulator:
+    """Test suite for EventDrivenSimulator."""
+
+    def test_final_state_counts_all_pulls(self, event_simulator, initial_state):
+        """Test counters advance by exactly the simulated pulls."""
+        events, final_state = event_simulator.simulate(initial_state, 500)
+
+        assert final_state.banner_pulls == 500
+        assert final_state.total_pulls == 500
+        assert all(1 <= e.pull_offset <= 500 for e in events)
+        assert [e.pull_offset for e in events] == sorted(e.pull_offset for e in events)
+
+    def test_five_star_guarantee_respected(self, event_simulator, initial_state):
+        """Test no run of 10 pulls passes without a 5★ or 6★."""
+        events, _ = event_simulator.simulate(initial_state, 2000)
+        offsets = [0] + [
+            e.pull_offset for e in events
+            if e.event_type in (EventType.SIX_STAR, EventType.FIVE_STAR, EventType.FEATURED_GUARANTEE)
+        ]
+        assert max(b - a for a, b in zip(offsets, offsets[1:])) <= 10
+
+    def test_milestones(self, event_simulator, initial_state):
+        """Test milestone events fire at the expected pulls."""
+        events, _ = event_simulator.simulate(initial_state, 480)
+
+        free = [e.pull_offset for e in events if e.event_type == EventType.FREE_PULL_REWARD]
+        dupes = [e.pull_offset for e in events if e.event_type == EventType.BONUS_DUPE]
+        assert free == [60]
+        assert dupes == [240, 480]
+
+    def test_featured_guarantee(self, game_rules, initial_state):
+        """Test featured is obtained by pull 120 when every 50/50 is lost."""
+        class AlwaysLose:
+            def random(self):
+                return 0.99
+
+        simulator = EventDrivenSimulator(game_rules, AlwaysLose())
+        events, _ = simulator.simulate(initial_state, 120)
+
+        assert events[-1].pull_offset == 120
+        assert events[-1].event_type == EventType.FEATURED_GUARANTEE
+        assert events[-1].result.is_featured()
+        assert simulator.pulls_to_featured(initial_state) == 120
+
+    def test_pulls_to_featured_respects_spark(self, event_simulator):
+        """Test pulls to featured never exceed the remaining guarantee."""
+        state = PityState(
+            pulls_without_6_star=10,
+            pulls_without_5_star=0,
+            banner_pulls=100,
+            total_pulls=100
+        )
+        samples = [event_simulator.pulls_to_featured(state) for _ in range(200)]
+        assert max(samples) <= 20
+        assert min(samples) >= 1
@@ -0,0 +1,87 @@
+"""Tests for the event-sourced account history."""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.domain.entities import CharacterType, PityState, PullResult
+from src.domain.services import AccountEventLog
+
+START = datetime(2026, 1, 1)
+
+
+def _result(rng):
+    rarity = rng.choices([4, 5, 6], weights=[85, 12, 3])[0]
+    if rarity == 6:
+        featured = rng.random() < 0.5
+        return PullResult(
+            rarity=6,
+            character_type=CharacterType.FEATURED if featured else CharacterType.STANDARD,
+            won_50_50=featured,
+        )
+    return PullResult(rarity=rarity, character_type=CharacterType.FIVE_STAR if rarity == 5 else CharacterType.FOUR_STAR)
+
+
+@pytest.fixture
+def history(game_rules, pity_simulator):
+    """Provide a long random history and the states derived step by step."""
+    rng = random.Random(4)
+    log = AccountEventLog(game_rules, snapshot_interval=64)
+    states = [PityState.initial()]
+    when = START
+    for i in range(2_000):
+        when += timedelta(minutes=rng.randint(0, 30))
+        if i % 500 == 499:
+            log.record_banner_change(when)
+            s = states[-1]
+            states.append(PityState(
+                pulls_without_6_star=s.pulls_without_6_star, pulls_without_5_star=s.pulls_without_5_star,
+                banner_pulls=0, total_pulls=s.total_pulls,
+            ))
+        else:
+            result = _result(rng)
+            log.record_pull(when, result)
+            states.append(pity_simulator.apply_pull_result(states[-1], result))
+    return log, states
+
+
+class TestAccountEventLog:
+    """Test suite for AccountEventLog."""
+    
+    def test_replay_matches_sequential_application(self, history):
+        """Test every point of the history rebuilds the stepwise state."""
+        log, states = history
+        assert len(log) == 2_000
+        assert log.current_state == states[-1]
+        for events in range(0, 2_001, 37):
+            assert log.state_after(events) == states[events]
+    
+    def test_replay_is_bounded_by_interval(self, history, monkeypatch):
+        """Test a rebuild replays at most one snapshot interval."""
+        log, _ = history
+        calls = []
+        original = log.kernel.apply
+        monkeypatch.setattr(log.kernel, "apply", lambda *a: calls.append(1) or original(*a))
+        log.state_after(1_000 + 63)
+        assert len(calls) <= 63
+    
+    def test_time_travel(self, game_rules):
+        """Test state at a date includes exactly the events up to that date."""
+        log = AccountEventLog(game_rules, snapshot_interval=4)
+        six = PullResult(rarity=6, character_type=CharacterType.FEATURED, won_50_50=True)
+        four = PullResult(rarity=4, character_type=CharacterType.FOUR_STAR)
+        for day in range(10):
+            log.record_pull(START + timedelta(days=day), six if day == 5 else four)
+        assert log.state_at(START - timedelta(days=1)) == PityState.initial()
+        assert log.state_at(START + timedelta(days=3, hours=12)).pulls_without_6_star == 4
+        assert log.state_at(START + timedelta(days=5)).pulls_without_6_star == 0
+        assert log.state_at(START + timedelta(days=9)).pulls_without_6_star == 4
+        assert log.featured_obtained
+    
+    def test_out_of_order_rejected(self, game_rules):
+        """Test events must be chronological."""
+        log = AccountEventLog(game_rules)
+        log.record_banner_change(START)
+        with pytest.raises(ValueError):
+            log.record_banner_change(START - timedelta(seconds=1))
@@ -0,0 +1,51 @@
+"""Tests for table-driven hazard curves in GameRules."""
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from src.domain.services import GapDistributions, ProbabilityCalculator, RulesSweep
+from src.domain.value_objects import GameRules
+
+
+def _step_curve(hard_pity=80):
+    """A non-linear curve: flat 2% then a jump to 50% before hard pity."""
+    return tuple([0.02] * (hard_pity - 10) + [0.5] * 9 + [1.0])
+
+
+class TestHazardTable:
+    """Test suite for GameRules.hazard_table."""
+    
+    def test_default_table_matches_linear_rule(self, game_rules):
+        """Test the default table reproduces the soft pity formula."""
+        table = game_rules.hazard_table
+        assert len(table) == game_rules.hard_pity + 1
+        assert table[0] == 0.008
+        assert table[63] == 0.008
+        assert abs(table[64] - 0.058) < 1e-12
+        assert abs(table[69] - (0.008 + 0.05 * 6)) < 1e-12
+        assert table[79] == 1.0
+        assert table[80] == 1.0
+    
+    def test_custom_curve_is_used(self):
+        """Test a custom curve drives every consumer of the hazard."""
+        rules = GameRules(hazard_curve=_step_curve())
+        assert ProbabilityCalculator(rules).calculate_6_star_probability(75).value == 0.5
+        assert GapDistributions(rules).hazard[10] == 0.02
+        
+        sweep = RulesSweep()
+        result = sweep.evaluate(sweep.from_rules([GameRules.default(), rules]))
+        survival = np.cumprod(1.0 - np.array(rules.hazard_table))
+        expected = 1.0 + survival[:-1].sum()
+        assert result.expected_pulls_to_6_star[1] == pytest.approx(expected)
+        assert result.expected_pulls_to_6_star[0] != pytest.approx(expected)
+    
+    @pytest.mark.parametrize("curve", [
+        (0.01,) * 79 + (1.0,) + (1.0,),
+        (0.01,) * 79 + (0.9,),
+        (-0.1,) + (0.01,) * 78 + (1.0,),
+    ])
+    def test_invalid_curve_rejected(self, curve):
+        """Test wrong length, missing hard pity and out-of-range values."""
+        with pytest.raises(ValidationError):
+            GameRules(hazard_curve=curve)
@@ -0,0 +1,93 @@
+"""Tests for the Fenwick-tree pull history index."""
+
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.domain.entities import CharacterType, PullResult
+from src.domain.services import FenwickTree, PullHistoryIndex
+
+START = datetime(2026, 3, 1)
+
+
+def _history(size, seed=2):
+    rng = random.Random(seed)
+    results = []
+    for _ in range(size):
+        rarity = rng.choices([4, 5, 6], weights=[80, 14, 6])[0]
+        if rarity == 6:
+            won = rng.random() < 0.5
+            results.append(PullResult(
+                rarity=6, character_type=CharacterType.FEATURED if won else CharacterType.STANDARD, won_50_50=won
+            ))
+        else:
+            results.append(PullResult(rarity=rarity, character_type=CharacterType.FOUR_STAR))
+    return results
+
+
+class TestFenwickTree:
+    """Test suite for FenwickTree."""
+    
+    def test_prefix_sums_match_cumsum(self):
+        """Test every prefix and range agrees with a plain cumulative sum."""
+        rows = np.random.default_rng(0).integers(0, 5, (333, 3))
+        tree = FenwickTree(rows)
+        cumulative = np.vstack([np.zeros(3, dtype=int), rows.cumsum(axis=0)])
+        for end in range(334):
+            assert tree.prefix(end).tolist() == cumulative[end].tolist()
+        assert tree.range_sum(10, 200).tolist() == rows[10:200].sum(axis=0).tolist()
+    
+    def test_append_and_add(self):
+        """Test appends (with growth) and point updates keep sums exact."""
+        rows = np.random.default_rng(1).integers(0, 5, (100, 2))
+        tree = FenwickTree(np.empty((0, 2)))
+        for row in rows:
+            tree.append(row)
+        tree.add(40, np.array([10, 0]))
+        rows[40, 0] += 10
+        for end in (0, 1, 41, 64, 100):
+            assert tree.prefix(end).tolist() == rows[:end].sum(axis=0).tolist()
+
+
+class TestPullHistoryIndex:
+    """Test suite for PullHistoryIndex."""
+    
+    def test_range_counts_match_scan(self):
+        """Test range queries against a linear scan of the results."""
+        results = _history(2_000)
+        index = PullHistoryIndex(results)
+        for start, end in ((0, 2_000), (17, 900), (500, 501), (1_000, 1_000)):
+            window = results[start:end]
+            counts = index.counts(start, end)
+            assert counts.pulls == end - start
+            assert counts.six_stars == sum(r.is_six_star() for r in window)
+            assert counts.five_stars == sum(r.is_five_star() for r in window)
+            assert counts.featured == sum(r.is_featured() for r in window)
+            assert counts.won_50_50 + counts.lost_50_50 == counts.six_stars
+    
+    def test_date_range(self):
+        """Test counts between two dates include both endpoints."""
+        results = _history(100)
+        times = [START + timedelta(hours=i) for i in range(100)]
+        index = PullHistoryIndex(results, times)
+        counts = index.counts_between(START + timedelta(hours=10), START + timedelta(hours=19))
+        assert counts.pulls == 10
+        assert counts.six_stars == sum(r.is_six_star() for r in results[10:20])
+        assert index.counts_between(START - timedelta(days=2), START - timedelta(days=1)).pulls == 0
+    
+    def test_append_keeps_dates(self):
+        """Test appended pulls are visible to index and date queries."""
+        index = PullHistoryIndex([], [])
+        six = PullResult(rarity=6, character_type=CharacterType.FEATURED, won_50_50=True)
+        for day in range(30):
+            index.append(six, START + timedelta(days=day))
+        assert index.counts_between(START, START + timedelta(days=9)).featured == 10
+        with pytest.raises(ValueError):
+            index.append(six)
+    
+    def test_invalid_range(self):
+        """Test out-of-range pull indices are rejected."""
+        with pytest.raises(IndexError):
+            PullHistoryIndex(_history(10)).counts(5, 11)
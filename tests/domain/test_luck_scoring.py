@@ -0,0 +1,91 @@
+"""Tests for luck percentile scoring."""
+
+import random
+
+import numpy as np
+import pytest
+
+from src.domain.entities import CharacterType, PullResult
+from src.domain.services import LuckScorer, PullKernel
+from src.domain.services.pull_kernel import KernelState
+
+FOUR = PullResult(rarity=4, character_type=CharacterType.FOUR_STAR)
+WIN = PullResult(rarity=6, character_type=CharacterType.FEATURED, won_50_50=True)
+LOSS = PullResult(rarity=6, character_type=CharacterType.STANDARD, won_50_50=False)
+GUARANTEE = PullResult(rarity=6, character_type=CharacterType.FEATURED)
+
+
+def _simulated_history(rules, pulls, rng):
+    """Pulls from the kernel, starting a new banner before the guarantee can trigger."""
+    kernel = PullKernel(rules)
+    state = KernelState(0, 0, 0, 0, False)
+    for _ in range(pulls):
+        if state.banner_pulls == rules.featured_guarantee - 1:
+            state = kernel.new_banner(state)
+        state, outcome = kernel.step(state, rng.random(), rng.random())
+        if outcome.rarity == 6:
+            yield WIN if outcome.featured else LOSS
+        else:
+            yield FOUR
+
+
+class TestLuckScorer:
+    """Test suite for LuckScorer."""
+    
+    def test_cycle_percentile_is_mid_cdf(self, game_rules):
+        """Test the percentile table against the cycle-length pmf."""
+        scorer = LuckScorer(game_rules)
+        survival = scorer.compiled.survival[0]
+        pmf = survival[:-1] - survival[1:]
+        for length in (1, 30, 65, 80):
+            expected = 100 * (pmf[:length - 1].sum() + pmf[length - 1] / 2)
+            assert scorer.cycle_percentile(length) == pytest.approx(expected)
+        assert scorer.cycle_percentile(1) < 1 < 99 < scorer.cycle_percentile(80)
+    
+    def test_start_pity_conditions_the_cycle(self, game_rules):
+        """Test cycles from a high pity are scored against the shorter remaining window."""
+        scorer = LuckScorer(game_rules)
+        assert scorer.cycle_percentile(10, start_pity=70) > scorer.cycle_percentile(10)
+        with pytest.raises(ValueError):
+            scorer.cycle_percentile(11, start_pity=70)
+    
+    def test_report(self, game_rules):
+        """Test counters, the 50/50 record and the open cycle of a report."""
+        history = [FOUR] * 9 + [WIN] + [FOUR] * 79 + [LOSS] + [FOUR] * 5 + [GUARANTEE] + [FOUR] * 3
+        report = LuckScorer(game_rules).score(history)
+        assert report.pulls == len(history)
+        assert report.six_stars == 3
+        assert report.cycle_lengths == (10, 80)
+        assert report.guaranteed == 1
+        assert report.open_cycle_pulls == 3
+        assert (report.won_50_50, report.lost_50_50) == (1, 1)
+        assert report.percentile_50_50 == pytest.approx(50.0)
+        assert report.expected_rate == pytest.approx(1 / LuckScorer(game_rules).compiled.expected_pulls_to_6_star[0])
+    
+    def test_lucky_and_unlucky_histories(self, game_rules):
+        """Test short winning cycles score high and long losing ones low."""
+        scorer = LuckScorer(game_rules)
+        lucky = scorer.score(([FOUR] * 4 + [WIN]) * 5)
+        unlucky = scorer.score(([FOUR] * 79 + [LOSS]) * 5)
+        assert lucky.luck_percentile > 99
+        assert unlucky.luck_percentile < 1
+    
+    def test_luck_is_calibrated(self, game_rules):
+        """Test simulated histories get roughly uniform luck percentiles."""
+        scorer = LuckScorer(game_rules)
+        rng = random.Random(11)
+        lucks = [scorer.score(_simulated_history(game_rules, 400, rng)).luck_percentile for _ in range(300)]
+        assert np.mean(lucks) == pytest.approx(50, abs=5)
+        assert np.mean(np.array(lucks) < 10) == pytest.approx(0.1, abs=0.05)
+    
+    def test_merge_matches_single_stream(self, game_rules):
+        """Test merged account scores equal scoring the cycles together."""
+        scorer = LuckScorer(game_rules)
+        first = ([FOUR] * 20 + [WIN]) * 3
+        second = ([FOUR] * 60 + [LOSS]) * 2
+        merged = scorer.accumulator().merge(scorer.accumulator())
+        for history in (first, second):
+            account = scorer.accumulator()
+            account.add_many(history)
+            merged.merge(account)
+        assert merged.report() == scorer.score(first + second)
@@ -0,0 +1,78 @@
+"""Tests for MarkovTransitionEngine service."""
+
+import numpy as np
+import pytest
+from src.domain.entities import PityState
+from src.domain.services import MarkovTransitionEngine
+
+
+@pytest.fixture
+def engine(game_rules):
+    """Provide a Markov engine with a low stepping threshold."""
+    return MarkovTransitionEngine(game_rules, step_threshold=16)
+
+
+class TestMarkovTransitionEngine:
+    """Test suite for MarkovTransitionEngine."""
+    
+    def test_rows_are_stochastic(self, engine):
+        """Test every state's outgoing mass sums to one."""
+        for transitions in (engine.transitions, engine.guarantee_transitions):
+            out = np.bincount(transitions.rows, weights=transitions.values, minlength=engine.size)
+            assert np.allclose(out, 1.0)
+    
+    def test_single_pull_matches_hazard(self, engine, prob_calculator, initial_state):
+        """Test one pull from pity 0 gives the base 6★ rate."""
+        dist = engine.distribution_after(initial_state, 1)
+        assert dist.pity_6_star_marginal()[0] == pytest.approx(float(prob_calculator.calculate_6_star_probability(0)))
+        assert dist.probabilities.sum() == pytest.approx(1.0)
+    
+    def test_cumulative_6_star_matches_calculator(self, engine, prob_calculator):
+        """Test P(no 6★ in N pulls) agrees with the cumulative formula."""
+        state = PityState(pulls_without_6_star=60, pulls_without_5_star=0, banner_pulls=130, total_pulls=130)
+        dist = engine.distribution_after(state, 15)
+        no_six = dist.pity_6_star_marginal()[75]
+        expected = 1 - float(prob_calculator.calculate_cumulative_probability(60, 15))
+        assert no_six == pytest.approx(expected)
+    
+    def test_featured_guarantee(self, engine, initial_state):
+        """Test the featured unit is certain after 120 banner pulls."""
+        assert engine.distribution_after(initial_state, 119).featured_probability() < 1.0
+        assert engine.distribution_after(initial_state, 120).featured_probability() == pytest.approx(1.0)
+    
+    def test_squaring_matches_stepping(self, game_rules, initial_state):
+        """Test exponentiation by squaring agrees with sparse stepping."""
+        squared = MarkovTransitionEngine(game_rules, step_threshold=0).distribution_after(initial_state, 300)
+        stepped = MarkovTransitionEngine(game_rules, step_threshold=10_000).distribution_after(initial_state, 300)
+        assert np.allclose(squared.probabilities, stepped.probabilities, atol=1e-12)
+    
+    def test_deterministic_counters(self, engine):
+        """Test spark and dupe positions advance deterministically."""
+        state = PityState(pulls_without_6_star=0, pulls_without_5_star=0, banner_pulls=100, total_pulls=230)
+        dist = engine.distribution_after(state, 260)
+        assert dist.spark_position == 120
+        assert dist.dupe_position == 490 % 240
+        assert dist.bonus_dupes == 2
+    
+    def test_extending_horizon_matches_fresh(self, game_rules, soft_pity_state):
+        """Test continuing from a saved frontier equals starting over, across the guarantee."""
+        incremental = MarkovTransitionEngine(game_rules)
+        for pulls in (10, 40, 54, 55, 56, 90):
+            extended = incremental.distribution_after(soft_pity_state, pulls)
+            fresh = MarkovTransitionEngine(game_rules).distribution_after(soft_pity_state, pulls)
+            assert np.allclose(extended.probabilities, fresh.probabilities, atol=1e-14)
+        shorter = incremental.distribution_after(soft_pity_state, 20)
+        assert np.allclose(
+            shorter.probabilities,
+            MarkovTransitionEngine(game_rules).distribution_after(soft_pity_state, 20).probabilities,
+        )
+    
+    def test_frontier_is_reused(self, game_rules, initial_state, monkeypatch):
+        """Test a longer query only advances the extra pulls."""
+        engine = MarkovTransitionEngine(game_rules)
+        engine.distribution_after(initial_state, 50)
+        steps = []
+        original = engine.advance
+        monkeypatch.setattr(engine, "advance", lambda vector, pulls: steps.append(pulls) or original(vector, pulls))
+        engine.distribution_after(initial_state, 60)
+        assert sum(steps) == 10
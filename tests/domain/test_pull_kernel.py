@@ -0,0 +1,81 @@
+"""Tests for PullKernel and StrategySimulator."""
+
+import random
+
+from src.domain.services import (
+    PullKernel,
+    KernelState,
+    PitySimulator,
+    StrategySimulator,
+    StopAtFeatured,
+    ReachSpark,
+    SaveForNextBanner,
+)
+from src.domain.entities import PullResult, CharacterType
+
+
+class TestPullKernel:
+    """Test suite for PullKernel."""
+    
+    def test_four_star_matches_apply_pull_result(self, game_rules, mock_random, initial_state):
+        """Test the kernel agrees with PitySimulator on a 4★ pull."""
+        kernel = PullKernel(game_rules)
+        simulator = PitySimulator(game_rules, mock_random)
+        
+        state, outcome = kernel.step(KernelState.from_pity_state(initial_state), 0.99, 0.0)
+        expected = simulator.apply_pull_result(
+            initial_state, PullResult(rarity=4, character_type=CharacterType.FOUR_STAR)
+        )
+        
+        assert outcome.rarity == 4
+        assert state.to_pity_state() == expected
+    
+    def test_hard_pity_and_five_star_guarantee(self, game_rules):
+        """Test guaranteed pulls ignore the random numbers."""
+        kernel = PullKernel(game_rules)
+        
+        _, outcome = kernel.step(KernelState(79, 0, 79, 79), 0.999, 0.9)
+        assert outcome.rarity == 6
+        assert outcome.featured is False
+        
+        state, outcome = kernel.step(KernelState(5, 9, 5, 5), 0.999, 0.9)
+        assert outcome.rarity == 5
+        assert state.pulls_without_5_star == 0
+        assert state.pulls_without_6_star == 6
+    
+    def test_featured_guarantee_and_bonus_dupe(self, game_rules):
+        """Test the 120th banner pull is featured and pull 240 gives a dupe."""
+        kernel = PullKernel(game_rules)
+        
+        state, outcome = kernel.step(KernelState(30, 0, 119, 239), 0.999, 0.9)
+        assert outcome.rarity == 6 and outcome.featured and outcome.bonus_dupe
+        assert state.featured_obtained is True
+        
+        _, outcome = kernel.step(KernelState(30, 0, 119, 200, True), 0.999, 0.9)
+        assert outcome.rarity == 4
+
+
+class TestStrategySimulator:
+    """Test suite for StrategySimulator."""
+    
+    def test_reach_spark_spends_full_income(self, game_rules):
+        """Test reaching the spark spends exactly 120 pulls per banner."""
+        outcome = StrategySimulator(game_rules).play(ReachSpark(), random.Random(1), banners=2, pulls_per_banner=120)
+        assert outcome.pulls_spent == 240
+        assert outcome.featured_copies >= 2
+    
+    def test_save_for_next_banner_skips_first(self, game_rules):
+        """Test saving only pulls on the last banner."""
+        outcome = StrategySimulator(game_rules).play(
+            SaveForNextBanner(), random.Random(1), banners=2, pulls_per_banner=60
+        )
+        assert outcome.featured_copies == 1
+        assert 1 <= outcome.pulls_spent <= 120
+    
+    def test_common_random_numbers(self, game_rules):
+        """Test strategies see the same pulls when given the same stream."""
+        simulator = StrategySimulator(game_rules)
+        stop = simulator.play(StopAtFeatured(), random.Random(5), banners=1, pulls_per_banner=120)
+        spark = simulator.play(ReachSpark(), random.Random(5), banners=1, pulls_per_banner=120)
+        assert stop.pulls_spent <= spark.pulls_spent
+        assert stop.featured_copies == 1
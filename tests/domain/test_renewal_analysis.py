@@ -0,0 +1,79 @@
+"""Tests for RenewalAnalyzer service."""
+
+import numpy as np
+import pytest
+
+from src.domain.services import RenewalAnalyzer, MarkovTransitionEngine
+from src.domain.value_objects import GameRules
+
+
+@pytest.fixture
+def analyzer(game_rules):
+    """Provide renewal analyzer."""
+    return RenewalAnalyzer(game_rules)
+
+
+class TestRenewalAnalyzer:
+    """Test suite for RenewalAnalyzer."""
+    
+    def test_pulls_per_6_star_matches_average(self, analyzer, prob_calculator):
+        """Test the stationary 6★ rate agrees with the mean cycle length."""
+        assert analyzer.expected_pulls_per_6_star() == pytest.approx(
+            prob_calculator.calculate_average_pulls_to_6_star()
+        )
+    
+    def test_expected_pulls_to_featured_matches_markov(self, analyzer, game_rules, initial_state):
+        """Test the first-passage solve agrees with the exact N-step distributions."""
+        engine = MarkovTransitionEngine(game_rules)
+        tail_sum = sum(
+            1 - engine.distribution_after(initial_state, n).featured_probability()
+            for n in range(game_rules.featured_guarantee + 1)
+        )
+        assert analyzer.expected_pulls_to_featured() == pytest.approx(tail_sum)
+    
+    def test_guarantee_lowers_expected_pulls(self, analyzer):
+        """Test the featured guarantee only ever helps."""
+        with_spark = analyzer.expected_pulls_to_featured(pity=0, banner_pulls=0)
+        without_spark = analyzer.expected_pulls_to_featured(pity=0, featured_obtained=True)
+        assert with_spark < without_spark
+        assert analyzer.expected_pulls_to_featured(pity=50, banner_pulls=119) == 1.0
+    
+    def test_pending_guarantee_skips_linear_solve(self, analyzer, monkeypatch):
+        """Test the no-guarantee system is only solved when it is needed."""
+        table = analyzer.expected_pulls_to_featured_pending()
+        assert table.shape == (analyzer.states, 120)
+        assert analyzer.expected_pulls_to_featured(pity=30, banner_pulls=50) == pytest.approx(table[30, 50])
+        
+        def solve(*args):
+            raise AssertionError("linear system solved with the guarantee pending")
+        
+        monkeypatch.setattr(np.linalg, "solve", solve)
+        assert analyzer.expected_pulls_to_featured(pity=30, banner_pulls=50) == pytest.approx(table[30, 50])
+    
+    def test_banner_kernel_is_stochastic(self, analyzer):
+        """Test each starting pity ends the banner somewhere."""
+        kernel, featured, six_stars = analyzer.banner_kernel(120)
+        assert np.allclose(kernel.sum(axis=1), 1.0)
+        assert np.all(featured >= 1.0 - 1e-12)
+        assert np.all(six_stars >= featured - 1e-12)
+    
+    def test_long_run_metrics(self, analyzer):
+        """Test steady-state costs are consistent with each other."""
+        metrics = analyzer.long_run_metrics(pulls_per_banner=60)
+        
+        assert metrics.stationary_pity.sum() == pytest.approx(1.0)
+        assert metrics.pulls_per_bonus_dupe == 240
+        assert metrics.pulls_per_featured == pytest.approx(60 / metrics.featured_per_banner)
+        assert metrics.pulls_per_featured_copy < metrics.pulls_per_featured
+        # Without reaching the guarantee, one featured every two 6★ on average
+        assert metrics.pulls_per_featured == pytest.approx(2 * metrics.pulls_per_6_star)
+    
+    def test_rules_variant(self):
+        """Test metrics follow the rules (no soft pity means a longer cycle)."""
+        harsh = RenewalAnalyzer(GameRules(soft_pity_increment=0.0))
+        assert harsh.expected_pulls_per_6_star() > RenewalAnalyzer(GameRules()).expected_pulls_per_6_star()
+    
+    def test_invalid_banner_length(self, analyzer):
+        """Test a non-positive budget is rejected."""
+        with pytest.raises(ValueError):
+            analyzer.long_run_metrics(0)
@@ -0,0 +1,96 @@
+"""Tests for RulesSweep service."""
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from src.domain.services import RulesSweep, RenewalAnalyzer, ProbabilityCalculator
+from src.domain.value_objects import GameRules
+
+
+class TestRulesSweep:
+    """Test suite for RulesSweep."""
+    
+    def test_grid_is_cartesian_product(self):
+        """Test grid expands every combination and fills the rest from base."""
+        params = RulesSweep().grid(soft_pity_start=[60, 65, 70], hard_pity=[75, 80])
+        
+        assert len(params["soft_pity_start"]) == 6
+        assert set(params["hard_pity"]) == {75, 80}
+        assert np.all(params["prob_6_star_base"] == 0.008)
+    
+    def test_unknown_axis_rejected(self):
+        """Test only sweepable fields are accepted."""
+        with pytest.raises(ValueError):
+            RulesSweep().grid(bonus_dupe=[240])
+    
+    def test_hazard_matrix_matches_calculator(self):
+        """Test the vectorized hazard agrees with ProbabilityCalculator."""
+        rules = GameRules(soft_pity_start=60, soft_pity_increment=0.03)
+        sweep = RulesSweep()
+        hazard = sweep.hazard_matrix(sweep.from_rules([rules]))[0]
+        calc = ProbabilityCalculator(rules)
+        
+        expected = [float(calc.calculate_6_star_probability(t)) for t in range(rules.hard_pity + 1)]
+        assert np.allclose(hazard, expected)
+    
+    def test_matches_per_variant_services(self):
+        """Test sweep results agree with per-variant exact computations."""
+        variants = [
+            GameRules(),
+            GameRules(soft_pity_start=55, hard_pity=70),
+            GameRules(prob_6_star_base=0.015, soft_pity_increment=0.08, prob_50_50=0.75),
+        ]
+        sweep = RulesSweep()
+        result = sweep.evaluate(sweep.from_rules(variants), featured_within=(120,))
+        
+        for i, rules in enumerate(variants):
+            analyzer = RenewalAnalyzer(rules)
+            assert result.expected_pulls_to_6_star[i] == pytest.approx(analyzer.expected_pulls_per_6_star())
+            assert result.expected_pulls_to_featured[i] == pytest.approx(analyzer.expected_pulls_to_featured())
+            assert result.featured_probability[i, 0] == pytest.approx(1.0)
+    
+    def test_quantiles_and_variant_roundtrip(self):
+        """Test quantiles are ordered and variants can be rebuilt."""
+        sweep = RulesSweep()
+        result = sweep.evaluate(sweep.grid(soft_pity_increment=[0.02, 0.05, 0.1]))
+        
+        assert len(result) == 3
+        assert np.all(np.diff(result.pulls_to_6_star_quantiles, axis=1) >= 0)
+        assert np.all(np.diff(result.expected_pulls_to_6_star) < 0)
+        assert result.variant(1) == GameRules()
+    
+    def test_variant_is_validated(self):
+        """Test rebuilt variants are validated and get their own fingerprint."""
+        sweep = RulesSweep()
+        result = sweep.evaluate(sweep.grid(soft_pity_start=[50, 65], hard_pity=[75, 80]))
+        
+        variant = result.variant(1)
+        assert (variant.soft_pity_start, variant.hard_pity) == (50, 80)
+        assert variant.fingerprint == GameRules(soft_pity_start=50).fingerprint
+        assert variant.fingerprint != GameRules().fingerprint
+        
+        curved = GameRules(hazard_curve=(0.02,) * 79 + (1.0,))
+        with pytest.raises(ValidationError):
+            result.variant(0, base=curved)
+    
+    def test_grid_keeps_base_hazard_curve(self):
+        """Test a curve-based base is swept over its own curve."""
+        curved = GameRules(hazard_curve=(0.02,) * 70 + (0.5,) * 9 + (1.0,))
+        sweep = RulesSweep(curved)
+        result = sweep.evaluate(sweep.grid(prob_50_50=[0.5, 0.75]), featured_within=(120,))
+        
+        variants = [curved.model_copy(update={"prob_50_50": p}) for p in (0.5, 0.75)]
+        expected = sweep.evaluate(sweep.from_rules(variants), featured_within=(120,))
+        assert np.allclose(result.expected_pulls_to_6_star, expected.expected_pulls_to_6_star)
+        assert np.allclose(result.featured_probability, expected.featured_probability)
+        assert result.expected_pulls_to_6_star[0] != pytest.approx(
+            RulesSweep().evaluate(RulesSweep().grid(prob_50_50=[0.5])).expected_pulls_to_6_star[0]
+        )
+        assert result.variant(1, base=curved) == variants[1]
+    
+    def test_grid_rejects_hazard_fields_with_curve(self):
+        """Test hazard-shaping fields cannot be swept over an explicit curve."""
+        sweep = RulesSweep(GameRules(hazard_curve=(0.02,) * 79 + (1.0,)))
+        with pytest.raises(ValueError, match="soft_pity_start"):
+            sweep.grid(soft_pity_start=[60, 65])
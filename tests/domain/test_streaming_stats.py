@@ -0,0 +1,122 @@
+"""Tests for mergeable streaming statistics."""
+
+import pickle
+import random
+import statistics
+
+import pytest
+from src.domain.services import RunningMoments, FixedBinHistogram, QuantileSketch, PullStatistics
+
+
+@pytest.fixture
+def samples():
+    """Provide reproducible pull-count-like samples."""
+    rng = random.Random(42)
+    return [rng.randint(1, 120) for _ in range(5000)]
+
+
+class TestRunningMoments:
+    """Test suite for RunningMoments."""
+
+    def test_matches_batch_statistics(self, samples):
+        """Test mean and variance match the batch formulas."""
+        moments = RunningMoments()
+        moments.add_many(samples)
+
+        assert moments.count == len(samples)
+        assert abs(moments.mean - statistics.fmean(samples)) < 1e-9
+        assert abs(moments.variance - statistics.variance(samples)) < 1e-6
+        assert moments.min == min(samples)
+        assert moments.max == max(samples)
+
+    def test_merge_equals_single_pass(self, samples):
+        """Test merging partial accumulators gives the full result."""
+        left, right, full = RunningMoments(), RunningMoments(), RunningMoments()
+        left.add_many(samples[:1234])
+        right.add_many(samples[1234:])
+        full.add_many(samples)
+
+        left.merge(right)
+        assert left.count == full.count
+        assert abs(left.mean - full.mean) < 1e-9
+        assert abs(left.variance - full.variance) < 1e-6
+
+    def test_merge_with_empty(self):
+        """Test merging empty accumulators is a no-op."""
+        moments = RunningMoments()
+        moments.add(5)
+        moments.merge(RunningMoments())
+        assert moments.count == 1
+        assert RunningMoments().merge(moments).mean == 5
+
+
+class TestFixedBinHistogram:
+    """Test suite for FixedBinHistogram."""
+
+    def test_counts_and_overflow(self):
+        """Test values land in the right bins."""
+        hist = FixedBinHistogram.for_pulls(10)
+        hist.add_many([0, 1, 1, 10, 11, -1])
+
+        assert hist.counts[0] == 1
+        assert hist.counts[1] == 2
+        assert hist.counts[10] == 1
+        assert hist.overflow == 1
+        assert hist.underflow == 1
+        assert hist.total == 6
+
+    def test_merge_requires_same_bins(self):
+        """Test merging incompatible histograms fails."""
+        with pytest.raises(ValueError):
+            FixedBinHistogram(0, 10, 10).merge(FixedBinHistogram(0, 10, 5))
+
+
+class TestQuantileSketch:
+    """Test suite for QuantileSketch."""
+
+    def test_quantiles_within_relative_accuracy(self, samples):
+        """Test quantiles are within the configured relative error."""
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        sketch.add_many(samples)
+        ordered = sorted(samples)
+
+        for q in (0.5, 0.9, 0.99):
+            exact = ordered[int(q * (len(ordered) - 1))]
+            assert abs(sketch.quantile(q) - exact) <= 0.01 * exact + 1e-9
+
+    def test_merge_is_exact(self, samples):
+        """Test a merged sketch answers like a single sketch."""
+        full, left, right = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        full.add_many(samples)
+        left.add_many(samples[:2500])
+        right.add_many(samples[2500:])
+
+        merged = pickle.loads(pickle.dumps(left)).merge(pickle.loads(pickle.dumps(right)))
+        assert merged.percentiles() == full.percentiles()
+
+    def test_memory_is_bounded(self):
+        """Test the bucket count stays within the limit."""
+        sketch = QuantileSketch(relative_accuracy=0.01, max_buckets=64)
+        sketch.add_many(float(2 ** i) for i in range(200))
+        assert len(sketch.buckets) <= 64
+        assert sketch.count == 200
+
+    def test_rejects_negative_values(self):
+        """Test negative samples are rejected."""
+        with pytest.raises(ValueError):
+            QuantileSketch().add(-1)
+
+
+class TestPullStatistics:
+    """Test suite for PullStatistics."""
+
+    def test_merge_combines_all_parts(self, samples):
+        """Test the combined accumulator merges moments, histogram and sketch."""
+        left, right = PullStatistics(max_pulls=120), PullStatistics(max_pulls=120)
+        left.add_many(samples[:100])
+        right.add_many(samples[100:])
+        left.merge(right)
+
+        assert left.count == len(samples)
+        assert left.histogram.total == len(samples)
+        assert set(left.percentiles()) == {0.5, 0.9, 0.99}
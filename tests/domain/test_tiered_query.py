@@ -0,0 +1,107 @@
+"""Tests for accuracy-tiered distribution queries."""
+
+import random
+
+import pytest
+
+from src.domain.entities import PityState
+from src.domain.services import AdaptiveMonteCarlo, TieredProbabilityService
+from src.domain.value_objects import AccuracyMode
+
+
+class SeededRandom:
+    """Deterministic random generator for Monte Carlo checks."""
+    
+    def __init__(self, seed=0):
+        self._random = random.Random(seed)
+    
+    def random(self):
+        return self._random.random()
+
+
+@pytest.fixture
+def service(game_rules):
+    """Provide a tiered service with a small Monte Carlo budget."""
+    return TieredProbabilityService(
+        game_rules, SeededRandom(7), AdaptiveMonteCarlo(chunk_size=1_000, min_samples=1_000, max_samples=20_000)
+    )
+
+
+class TestTieredProbabilityService:
+    """Test suite for TieredProbabilityService."""
+    
+    def test_exact_single_banner(self, service, initial_state):
+        """Test EXACT reproduces the known featured probability with a tiny bound."""
+        answer = service.featured_copies_at_least(initial_state, 80, mode=AccuracyMode.EXACT)
+        assert answer.mode == AccuracyMode.EXACT
+        assert answer.value == pytest.approx(0.5608, abs=1e-4)
+        assert answer.error < 1e-9
+    
+    def test_verify_brackets_exact(self, service, initial_state):
+        """Test the Monte Carlo interval covers the exact answer."""
+        exact = service.featured_copies_at_least(initial_state, 80, mode=AccuracyMode.EXACT)
+        verify = service.featured_copies_at_least(
+            initial_state, 80, mode=AccuracyMode.VERIFY, target_half_width=0.02
+        )
+        assert verify.mode == AccuracyMode.VERIFY
+        assert verify.lower <= exact.value <= verify.upper
+    
+    def test_fast_within_its_error(self, service, initial_state):
+        """Test the renewal approximation stays within its error estimate at long horizons."""
+        for copies in (15, 20, 25):
+            fast = service.featured_copies_at_least(initial_state, 2_000, copies, mode=AccuracyMode.FAST)
+            exact = service.featured_copies_at_least(initial_state, 2_000, copies, mode=AccuracyMode.EXACT)
+            assert abs(fast.value - exact.value) <= fast.error
+    
+    def test_fast_counts_bonus_dupes(self, service, initial_state):
+        """Test deterministic bonus dupes alone can satisfy a query."""
+        answer = service.featured_copies_at_least(initial_state, 480, 2, mode=AccuracyMode.FAST)
+        assert (answer.value, answer.error) == (1.0, 0.0)
+    
+    def test_auto_respects_latency_budget(self, service, initial_state):
+        """Test AUTO falls back to FAST when the DP would not fit and FAST is tight."""
+        assert service.featured_copies_at_least(initial_state, 100).mode == AccuracyMode.EXACT
+        tight = service.featured_copies_at_least(initial_state, 120_000, 1_620, latency_budget=1e-3)
+        assert tight.mode == AccuracyMode.FAST
+        assert tight.error <= service.fast_tolerance
+        assert 0.0 < tight.value < 1.0
+        assert tight.elapsed < 0.1
+    
+    def test_auto_keeps_exact_when_fast_is_loose(self, service, initial_state):
+        """Test AUTO does not trade accuracy for latency at short horizons."""
+        for pulls, copies in ((60, 1), (120, 1), (200, 3)):
+            auto = service.featured_copies_at_least(initial_state, pulls, copies, latency_budget=1e-9)
+            exact = service.featured_copies_at_least(initial_state, pulls, copies, mode=AccuracyMode.EXACT)
+            assert auto.value == pytest.approx(exact.value, abs=1e-9)
+            assert auto.error <= service.fast_tolerance
+        assert service.featured_copies_at_least(initial_state, 200, 3, latency_budget=1e-9).mode == AccuracyMode.EXACT
+    
+    @pytest.mark.parametrize("state", [
+        PityState(pulls_without_6_star=79, banner_pulls=10, total_pulls=10),
+        PityState(pulls_without_6_star=70, banner_pulls=60, total_pulls=300),
+        PityState(pulls_without_6_star=30, banner_pulls=118, total_pulls=118),
+    ])
+    def test_fast_starts_from_state(self, service, state):
+        """Test FAST uses the starting pity and the banner guarantee."""
+        for pulls in (1, 2, 30, 60):
+            fast = service.featured_copies_at_least(state, pulls, mode=AccuracyMode.FAST)
+            exact = service.featured_copies_at_least(state, pulls, mode=AccuracyMode.EXACT)
+            assert fast.value == pytest.approx(exact.value, abs=1e-9)
+        assert service.featured_copies_at_least(
+            PityState(pulls_without_6_star=79, banner_pulls=10, total_pulls=10), 1, mode=AccuracyMode.FAST
+        ).value == pytest.approx(0.5)
+    
+    def test_fast_multiple_copies_from_state(self, service):
+        """Test FAST stays within its bound for several copies from a non-initial state."""
+        state = PityState(pulls_without_6_star=75, banner_pulls=100, total_pulls=100)
+        for copies in (15, 20, 25):
+            fast = service.featured_copies_at_least(state, 2_000, copies, mode=AccuracyMode.FAST)
+            exact = service.featured_copies_at_least(state, 2_000, copies, mode=AccuracyMode.EXACT)
+            assert abs(fast.value - exact.value) <= fast.error
+    
+    def test_verify_needs_random_generator(self, game_rules, initial_state):
+        """Test VERIFY without a random generator is rejected."""
+        with pytest.raises(ValueError):
+            TieredProbabilityService(game_rules).featured_copies_at_least(
+                initial_state, 10, mode=AccuracyMode.VERIFY
+            )
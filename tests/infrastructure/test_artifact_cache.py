@@ -0,0 +1,101 @@
+"""Tests for the on-disk artifact cache."""
+
+import os
+
+import numpy as np
+import pytest
+
+from src.domain.services import CompiledRules, CompiledRulesRegistry
+from src.domain.value_objects import GameRules
+from src.infrastructure.persistence.artifact_cache import FORMAT_VERSION, NpyArtifactCache
+
+
+class TestNpyArtifactCache:
+    """Test suite for NpyArtifactCache."""
+    
+    def test_round_trip_is_memory_mapped(self, tmp_path):
+        """Test saved arrays come back as read-only memory maps."""
+        cache = NpyArtifactCache(tmp_path)
+        cache.save("abc", "table", np.arange(10.0))
+        loaded = NpyArtifactCache(tmp_path).load("abc", "table")
+        assert isinstance(loaded, np.memmap)
+        assert not loaded.flags.writeable
+        assert np.array_equal(loaded, np.arange(10.0))
+    
+    def test_get_or_build_builds_once(self, tmp_path):
+        """Test the builder only runs on a cold cache."""
+        calls = []
+        
+        def build():
+            calls.append(1)
+            return np.ones(3)
+        
+        NpyArtifactCache(tmp_path).get_or_build("abc", "ones", build)
+        NpyArtifactCache(tmp_path).get_or_build("abc", "ones", build)
+        assert len(calls) == 1
+    
+    def test_corrupt_artifact_is_discarded(self, tmp_path):
+        """Test a checksum mismatch makes the artifact a miss."""
+        NpyArtifactCache(tmp_path).save("abc", "table", np.arange(100.0))
+        path = tmp_path / f"v{FORMAT_VERSION}" / "abc" / "table.npy"
+        data = bytearray(path.read_bytes())
+        data[-1] ^= 0xFF
+        path.write_bytes(bytes(data))
+        
+        assert NpyArtifactCache(tmp_path).load("abc", "table") is None
+        assert not path.exists()
+    
+    def test_failed_manifest_write_keeps_previous_artifact(self, tmp_path, monkeypatch):
+        """Test an interrupted save leaves the old artifact intact and no temporary files."""
+        cache = NpyArtifactCache(tmp_path)
+        cache.save("abc", "table", np.arange(5.0))
+        
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+        
+        monkeypatch.setattr("src.infrastructure.persistence.artifact_cache.json.dump", fail)
+        with pytest.raises(IOError):
+            cache.save("abc", "table", np.zeros(5))
+        monkeypatch.undo()
+        
+        folder = tmp_path / f"v{FORMAT_VERSION}" / "abc"
+        assert sorted(path.name for path in folder.iterdir()) == ["table.json", "table.npy"]
+        assert np.array_equal(NpyArtifactCache(tmp_path).load("abc", "table"), np.arange(5.0))
+    
+    def test_size_bounded_eviction(self, tmp_path):
+        """Test least recently used artifacts are evicted past max_bytes."""
+        cache = NpyArtifactCache(tmp_path)
+        for age, name in enumerate(("b", "a")):
+            cache.save("abc", name, np.zeros(1_000))
+            os.utime(tmp_path / f"v{FORMAT_VERSION}" / "abc" / f"{name}.json", (age, age))
+        cache.max_bytes = 2 * 8_128 + 1
+        cache.save("abc", "c", np.zeros(1_000))
+        assert cache.load("abc", "b") is None
+        assert cache.load("abc", "a") is not None
+        assert cache.load("abc", "c") is not None
+        assert cache.size() <= cache.max_bytes
+    
+    def test_stale_versions_are_removed(self, tmp_path):
+        """Test artifacts of other format versions are dropped."""
+        stale = tmp_path / "v0" / "abc"
+        stale.mkdir(parents=True)
+        (stale / "table.npy").write_bytes(b"old")
+        NpyArtifactCache(tmp_path).save("abc", "table", np.zeros(2))
+        assert not (tmp_path / "v0").exists()
+    
+    def test_invalid_name_rejected(self, tmp_path):
+        """Test artifact names cannot escape the cache directory."""
+        with pytest.raises(ValueError):
+            NpyArtifactCache(tmp_path).save("abc", "../x", np.zeros(1))
+    
+    def test_compiled_rules_use_store(self, tmp_path, game_rules):
+        """Test compiled tables are persisted and reloaded by fingerprint."""
+        cache = NpyArtifactCache(tmp_path)
+        first = CompiledRules(game_rules, cache)
+        expected = first.featured_cdf.copy()
+        
+        registry = CompiledRulesRegistry(store=NpyArtifactCache(tmp_path))
+        second = registry.get(GameRules.default())
+        assert isinstance(second.featured_cdf, np.memmap)
+        assert np.array_equal(second.featured_cdf, expected)
+        assert np.array_equal(second.survival, first.survival)
@@ -0,0 +1,68 @@
+"""Tests for the ASCII chart canvas."""
+
+import io
+
+import numpy as np
+
+from src.application.use_cases import ShowProbabilityTableUseCase
+from src.infrastructure.presentation.ascii_canvas import AsciiCanvas
+from src.infrastructure.presentation.console_presenter import ConsolePresenter
+
+
+def _cell_loop(series, width, height, y_max=100.0):
+    """Reference rasterizer: the per-cell rule of the original console graph."""
+    rows = []
+    for row in range(height, -1, -1):
+        line = ""
+        for col in range(width):
+            if col >= len(series):
+                line += " "
+                continue
+            top = row / height * y_max
+            bottom = (row - 1) / height * y_max if row > 0 else -5
+            line += "." if bottom < series[col] <= top else " "
+        rows.append(line)
+    return rows
+
+
+class TestAsciiCanvas:
+    """Test suite for AsciiCanvas."""
+    
+    def test_matches_per_cell_rule(self, prob_calculator, counter_calculator, game_rules):
+        """Test a series that fits is drawn exactly like the cell-by-cell loop."""
+        use_case = ShowProbabilityTableUseCase(prob_calculator, counter_calculator, game_rules)
+        curve = use_case.featured_curve() * 100
+        assert AsciiCanvas(120, 25).rasterize(curve) == _cell_loop(curve.tolist(), 120, 25)
+        assert AsciiCanvas(150, 10).rasterize(curve[:90]) == _cell_loop(curve[:90].tolist(), 150, 10)
+    
+    def test_downsampling_keeps_envelope(self):
+        """Test a long series fills the width and keeps its extremes per column."""
+        series = np.tile(np.linspace(0, 100, 100), 60)
+        rows = AsciiCanvas(60, 10).rasterize(series)
+        assert len(rows) == 11
+        assert all(len(row) == 60 for row in rows)
+        assert all(row == "." * 60 for row in rows)
+    
+    def test_markers(self):
+        """Test markers replace the curve at their point."""
+        rows = AsciiCanvas(10, 4).rasterize(np.linspace(10, 100, 10), markers={9: "*", 0: "#"})
+        assert rows[0][9] == "*"
+        assert rows[-2][0] == "#"
+    
+    def test_render_axes(self):
+        """Test the rendered chart has y labels and right-aligned x ticks."""
+        lines = AsciiCanvas(120, 25).render(np.linspace(1, 100, 120), ticks=[0, 19, 119])
+        assert lines[0].startswith("  100% |")
+        assert lines[12].startswith("   50% |")
+        assert lines[25].startswith("    0% +")
+        assert lines[-1] == "        1" + " " * 17 + "20" + " " * 97 + "120"
+    
+    def test_presenter_chart(self, prob_calculator, counter_calculator, game_rules):
+        """Test the featured graph is written with its legend."""
+        use_case = ShowProbabilityTableUseCase(prob_calculator, counter_calculator, game_rules)
+        stream = io.StringIO()
+        ConsolePresenter(stream).show_featured_graph(use_case.featured_curve(), 65, 80)
+        text = stream.getvalue()
+        assert "GRAPH: PROBABILITY OF GETTING FEATURED 6★" in text
+        assert "# = Soft Pity start (pull 65)" in text
+        assert text.count("*") == 2
@@ -0,0 +1,92 @@
+"""Tests for the columnar result exporter."""
+
+import csv
+
+import numpy as np
+import pytest
+
+from src.domain.services import FixedBinHistogram
+from src.infrastructure.presentation.columnar_exporter import ColumnarExporter
+
+
+def _chunks(total, size):
+    for start in range(0, total, size):
+        pulls = np.arange(start, min(start + size, total))
+        yield {"pull": pulls.astype(np.int32), "probability": pulls / total}
+
+
+class TestColumnarExporter:
+    """Test suite for ColumnarExporter."""
+    
+    def test_samples_stream_to_memory_mapped_npy(self, tmp_path):
+        """Test sample chunks are appended into one memory-mappable array."""
+        chunks = [np.arange(i * 1000, (i + 1) * 1000, dtype=np.uint16) for i in range(5)]
+        path = ColumnarExporter(tmp_path).write_samples("pulls", iter(chunks))
+        loaded = np.load(path, mmap_mode="r")
+        assert isinstance(loaded, np.memmap)
+        assert loaded.dtype == np.uint16
+        assert np.array_equal(loaded, np.concatenate(chunks))
+    
+    def test_table_npy_is_structured(self, tmp_path):
+        """Test tables become one structured array with a field per column."""
+        path = ColumnarExporter(tmp_path).write_table("table", _chunks(1_000, 64))
+        loaded = np.load(path, mmap_mode="r")
+        assert loaded.dtype.names == ("pull", "probability")
+        assert loaded["pull"].tolist() == list(range(1_000))
+        assert loaded["probability"][500] == pytest.approx(0.5)
+    
+    def test_empty_stream(self, tmp_path):
+        """Test an empty stream still writes a valid file."""
+        assert len(np.load(ColumnarExporter(tmp_path).write_samples("none", iter([])))) == 0
+    
+    def test_empty_table(self, tmp_path):
+        """Test an empty table still gets its column names."""
+        csv_path = ColumnarExporter(tmp_path, table_format="csv").write_table(
+            "empty", iter([]), columns=("pull", "probability")
+        )
+        with open(csv_path, newline="") as f:
+            assert list(csv.reader(f)) == [["pull", "probability"]]
+        
+        npy_path = ColumnarExporter(tmp_path).write_table("empty", iter([]), columns=("pull", "probability"))
+        loaded = np.load(npy_path)
+        assert loaded.dtype.names == ("pull", "probability")
+        assert len(loaded) == 0
+        
+        samples = ColumnarExporter(tmp_path, table_format="csv").write_samples("none", iter([]))
+        with open(samples, newline="") as f:
+            assert list(csv.reader(f)) == [["value"]]
+    
+    def test_table_csv(self, tmp_path):
+        """Test CSV tables have a header row and one line per row."""
+        path = ColumnarExporter(tmp_path, table_format="csv").write_table("table", _chunks(100, 7))
+        with open(path, newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == ["pull", "probability"]
+        assert len(rows) == 101
+        assert rows[51] == ["50", "0.5"]
+    
+    @pytest.mark.parametrize("table_format", ["npy", "csv"])
+    def test_histogram(self, tmp_path, table_format):
+        """Test histograms keep counts, edges and out-of-range totals."""
+        histogram = FixedBinHistogram.for_pulls(10)
+        histogram.add_many([0, 3, 3, 10, 11, -1])
+        path = ColumnarExporter(tmp_path, table_format=table_format).write_histogram("hist", histogram)
+        if table_format == "npy":
+            with np.load(path) as data:
+                assert data["counts"].tolist() == histogram.counts
+                assert len(data["edges"]) == 12
+                assert (int(data["underflow"]), int(data["overflow"])) == (1, 1)
+        else:
+            with open(path, newline="") as f:
+                counts = [int(row[2]) for row in list(csv.reader(f))[1:]]
+            assert counts == [1] + histogram.counts + [1]
+    
+    def test_failed_export_leaves_no_file(self, tmp_path):
+        """Test an error in the chunk stream removes the partial file."""
+        def broken():
+            yield {"value": np.arange(3)}
+            raise RuntimeError("boom")
+        
+        with pytest.raises(IOError):
+            ColumnarExporter(tmp_path).write_table("broken", broken())
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,69 @@
+"""Tests for the buffered console presenter."""
+
+import io
+
+from src.application.use_cases import ShowProbabilityTableUseCase
+from src.infrastructure.presentation.console_presenter import BufferedTextWriter, ConsolePresenter
+
+
+class CountingStream(io.StringIO):
+    """StringIO that counts write calls."""
+    
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+    
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+class TestConsolePresenter:
+    """Test suite for ConsolePresenter."""
+    
+    def test_table_layout(self):
+        """Test columns are padded to the widest cell."""
+        stream = io.StringIO()
+        ConsolePresenter(stream).show_table(["a", "bbb"], [[1, "xyzzy"], [22, 3.5]])
+        assert stream.getvalue() == "\na  | bbb  \n----------\n1  | xyzzy\n22 | 3.5  \n"
+    
+    def test_default_stream_is_stdout(self, capsys):
+        """Test output goes to sys.stdout when no stream is given."""
+        ConsolePresenter().show_data({"x": 1, "y": "z"})
+        assert capsys.readouterr().out == "x: 1\ny: z\n"
+    
+    def test_stream_table_writes_in_chunks(self):
+        """Test a long generator is written in a few large writes."""
+        stream = CountingStream()
+        rows = ((i, i * i) for i in range(100_000))
+        ConsolePresenter(stream, buffer_chars=1 << 16).stream_table(["n", "square"], rows, [6, 11])
+        lines = stream.getvalue().split("\n")
+        assert len(lines) == 100_000 + 4
+        assert lines[3] == "0      | 0          "
+        assert stream.writes < 100
+    
+    def test_probability_columns_match_rows(self, prob_calculator, counter_calculator, game_rules):
+        """Test the column-chunk renderer prints the same table as the row renderer."""
+        use_case = ShowProbabilityTableUseCase(prob_calculator, counter_calculator, game_rules)
+        from_rows, from_columns = io.StringIO(), io.StringIO()
+        ConsolePresenter(from_rows).show_probability_table(use_case.execute(120))
+        ConsolePresenter(from_columns).show_probability_columns(use_case.iter_columns(120, chunk_size=50))
+        assert from_rows.getvalue() == from_columns.getvalue()
+        assert "<- Soft Pity Start" in from_rows.getvalue()
+
+
+class TestBufferedTextWriter:
+    """Test suite for BufferedTextWriter."""
+    
+    def test_flushes_when_full(self):
+        """Test the buffer is written once it reaches its size."""
+        stream = CountingStream()
+        writer = BufferedTextWriter(stream, buffer_chars=10)
+        writer.line("1234")
+        assert stream.writes == 0
+        writer.line("5678")
+        assert stream.getvalue() == "1234\n5678\n"
+        writer.line("x")
+        writer.flush()
+        assert stream.getvalue() == "1234\n5678\nx\n"
+        assert stream.writes == 2
@@ -0,0 +1,55 @@
+"""Tests for series downsampling."""
+
+import numpy as np
+import pytest
+
+from src.infrastructure.presentation.downsampling import downsample, lttb, min_max_buckets
+
+
+class TestLttb:
+    """Test suite for lttb."""
+    
+    def test_keeps_endpoints_and_budget(self):
+        """Test the output has the requested size, keeps both ends and stays ordered."""
+        x = np.arange(100_000, dtype=float)
+        y = np.sin(x / 5_000)
+        dx, dy = lttb(x, y, 500)
+        assert len(dx) == 500
+        assert (dx[0], dx[-1]) == (0, 99_999)
+        assert np.all(np.diff(dx) > 0)
+        assert np.array_equal(dy, np.sin(dx / 5_000))
+    
+    def test_keeps_a_spike(self):
+        """Test a single outlier is chosen as its bucket's point."""
+        y = np.zeros(10_000)
+        y[4_321] = 50.0
+        dx, dy = lttb(np.arange(10_000.0), y, 100)
+        assert 4_321 in dx
+    
+    def test_short_series_unchanged(self):
+        """Test series within the budget are returned as-is."""
+        x, y = lttb(np.arange(5.0), np.arange(5.0) ** 2, 10)
+        assert y.tolist() == [0, 1, 4, 9, 16]
+
+
+class TestMinMaxBuckets:
+    """Test suite for min_max_buckets."""
+    
+    def test_bucket_extremes(self):
+        """Test each bucket contributes its first minimum and maximum in order."""
+        y = np.array([5, 1, 9, 3, 3, 7, 0, 2, 8, 4.0])
+        x, dy = min_max_buckets(np.arange(10.0), y, 3)
+        assert x.tolist() == [1, 2, 3, 5, 6, 8]
+        assert dy.tolist() == [1, 9, 3, 7, 0, 8]
+    
+    def test_global_extremes_survive(self):
+        """Test the series minimum and maximum are always kept."""
+        y = np.random.default_rng(0).normal(size=1_000_000)
+        _, dy = min_max_buckets(np.arange(len(y), dtype=float), y, 300)
+        assert len(dy) <= 600
+        assert (dy.min(), dy.max()) == (y.min(), y.max())
+    
+    def test_unknown_method(self):
+        """Test an unknown method is rejected."""
+        with pytest.raises(ValueError):
+            downsample(np.arange(3.0), np.arange(3.0), 2, method="nearest")
@@ -0,0 +1,47 @@
+"""Tests for the JSONL pull record source."""
+
+import gzip
+
+import pytest
+
+from src.infrastructure.persistence.jsonl_pull_records import JsonlPullRecordSource
+
+LINES = [
+    '{"player": "a", "banner": "b1", "rarity": 4}\n',
+    '\n',
+    '{"player": "a", "banner": "b1", "rarity": 6, "character_type": "featured", "won_50_50": true}\n',
+    '{"player": "b", "banner": "b1", "rarity": 6, "character_type": "standard", "won_50_50": false}\n',
+    '{"player": "b", "banner": "b2", "rarity": 5}\n',
+]
+
+
+class TestJsonlPullRecordSource:
+    """Test suite for JsonlPullRecordSource."""
+    
+    @pytest.mark.parametrize("compressed", [False, True])
+    def test_chunks_and_columns(self, tmp_path, compressed):
+        """Test plain and gzip files decode to the same columns."""
+        path = tmp_path / "pulls.jsonl"
+        with (gzip.open(path, "wt") if compressed else open(path, "w")) as f:
+            f.writelines(LINES)
+        source = JsonlPullRecordSource(path, chunk_lines=2)
+        
+        chunks = list(source.iter_chunks())
+        assert [len(c) for c in chunks] == [2, 2, 1]
+        batches = [source.parse(c) for c in chunks]
+        assert [len(b) for b in batches] == [1, 2, 1]
+        batch = batches[1]
+        assert batch.players == ("a", "b")
+        assert batch.rarities.tolist() == [6, 6]
+        assert batch.featured.tolist() == [True, False]
+        assert batch.won_50_50.tolist() == [1, 0]
+        assert batches[0].won_50_50.tolist() == [-1]
+        assert batch.leading_run() == 1
+    
+    def test_invalid_record(self, tmp_path):
+        """Test malformed records are reported."""
+        source = JsonlPullRecordSource(tmp_path / "unused.jsonl")
+        with pytest.raises(ValueError):
+            source.parse([b'{"player": "a", "rarity": 6}\n'])
+        with pytest.raises(ValueError):
+            source.parse([b'{"player": "a", "banner": "b", "rarity": 3}\n'])
@@ -0,0 +1,62 @@
+"""Tests for the uniplot chart presenter."""
+
+import io
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from src.domain.services import FixedBinHistogram, compile_rules
+
+
+def test_uniplot_is_imported_lazily():
+    """Test loading the presenter does not import the plotting library."""
+    code = (
+        "import sys; import src.infrastructure.presentation.plot_presenter; "
+        "sys.exit('uniplot' in sys.modules)"
+    )
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
+class TestUniplotPresenter:
+    """Test suite for UniplotPresenter."""
+    
+    @pytest.fixture
+    def presenter(self):
+        pytest.importorskip("uniplot")
+        from src.infrastructure.presentation.plot_presenter import UniplotPresenter
+        return UniplotPresenter(io.StringIO(), width=40, height=8, max_points=200, color=False)
+    
+    def test_pmf_and_cdf(self, presenter, game_rules):
+        """Test exact curves are drawn with their titles."""
+        compiled = compile_rules(game_rules)
+        survival = compiled.survival[0]
+        presenter.show_pmf("6★ gap", survival[:-1] - survival[1:], offset=1)
+        presenter.show_cdf("Featured within n", compiled.featured_cdf)
+        text = presenter.stream.getvalue()
+        assert "6★ gap" in text and "Featured within n" in text
+    
+    def test_large_series_is_downsampled(self, presenter, monkeypatch):
+        """Test only max_points points per series reach the plotting library."""
+        import uniplot
+        
+        calls = []
+        original = uniplot.plot_to_string
+        
+        def spy(ys, xs=None, **kwargs):
+            calls.append([len(y) for y in ys])
+            return original(ys, xs=xs, **kwargs)
+        
+        monkeypatch.setattr(uniplot, "plot_to_string", spy)
+        x = np.linspace(0, 1, 500_000)
+        presenter.plot("two series", {"sin": np.sin(x * 40), "cos": np.cos(x * 40)}, xs=x)
+        assert calls == [[200, 200]]
+    
+    def test_histogram(self, presenter):
+        """Test simulation histograms are charted."""
+        histogram = FixedBinHistogram.for_pulls(120)
+        histogram.add_many(range(121))
+        presenter.show_histogram("Pulls to featured", histogram)
+        presenter.show_samples("Samples", np.random.default_rng(0).normal(size=10_000))
+        assert presenter.stream.getvalue().count("┌") == 2